@@ -1,3 +1,5 @@
+import os
+
 from flask import Flask, render_template
 
 from routes.gmail import gmail
@@ -30,4 +32,9 @@ def home():
     return render_template("index.html")
 
 if __name__ == "__main__":
+    # warm the PDF render workers in the serving process only: with debug=True
+    # this block also runs in the reloader's watcher, which never serves
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        from features import pdf_export
+        pdf_export.warm_up()
     app.run(debug=True)
\ No newline at end of file
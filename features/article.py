@@ -0,0 +1,117 @@
+# features/article.py
+"""
+Article: the one in-memory shape for a scraped item.
+
+Fetchers return loose dicts whose "date" may be a date, a datetime or a
+string. The production adapters turn each one into an Article once: the
+timestamp is parsed a single time into `ts` (with `has_time` for hearings),
+`date` is kept as the ISO-ish string the templates and session already use,
+and the repeated labels (source, committee, side, tag) are interned.
+
+Stores hold Articles. Templates read attributes directly, and code that still
+expects a dict can use .get() / ["key"], or to_dict() for a mutable copy.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import typing as t
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+
+_HAS_TIME = re.compile(r"T\d{2}:\d{2}")
+
+
+def parse_timestamp(value: t.Any) -> tuple[str, datetime | None, bool]:
+    """(display string, parsed datetime or None, has time-of-day) for any fetcher date."""
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="minutes"), value, True
+    if isinstance(value, date):
+        return value.isoformat(), datetime(value.year, value.month, value.day), False
+    text = str(value or "").strip()
+    if not text:
+        return "", None, False
+    try:
+        ts = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        ts = None
+    return text, ts, bool(_HAS_TIME.search(text))
+
+
+def _label(value: t.Any) -> str:
+    return sys.intern(str(value)) if value else ""
+
+
+@dataclass(slots=True, eq=False)
+class Article:
+    id: str
+    title: str
+    url: str
+    date: str = ""                 # "YYYY-MM-DD" or "YYYY-MM-DDTHH:MM" (what templates/session use)
+    source: str = ""
+    committee: str = ""
+    side: str = ""
+    tag: str = ""
+    suggestion: str = ""
+    ts: datetime | None = None     # canonical parsed timestamp
+    has_time: bool = False         # True for hearings / timed events
+    dup_of: str = ""               # id of the cluster representative (features/dedupe.py)
+    dup_label: str = ""            # where that representative was found, for display
+
+    @classmethod
+    def from_raw(cls, *, id: str, title: str, url: str, date: t.Any = None,
+                 source: str = "", committee: str = "", side: str = "", tag: str = "",
+                 suggestion: str | None = None) -> "Article":
+        text, ts, has_time = parse_timestamp(date)
+        return cls(
+            id=id,
+            title=title,
+            url=url,
+            date=text,
+            source=_label(source),
+            committee=_label(committee),
+            side=_label(side),
+            tag=_label(tag),
+            suggestion=suggestion or "",
+            ts=ts,
+            has_time=has_time,
+        )
+
+    def shifted(self, days: int) -> "Article":
+        """Copy with the timestamp moved by `days`, keeping date-only vs timed format."""
+        if self.ts is None:
+            return self
+        ts = self.ts + timedelta(days=days)
+        text = ts.isoformat(timespec="minutes") if self.has_time else ts.date().isoformat()
+        return replace(self, ts=ts, date=text)
+
+    # ---- dict compatibility ----------------------------------------------------
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        return getattr(self, key, default) if key in _FIELDS else default
+
+    def __getitem__(self, key: str) -> t.Any:
+        if key not in _FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in _FIELDS
+
+    def to_dict(self) -> dict:
+        """Plain dict for templates that annotate items (empty optional labels omitted)."""
+        out = {"id": self.id, "title": self.title, "url": self.url, "date": self.date}
+        for key in ("source", "committee", "side", "tag", "suggestion"):
+            val = getattr(self, key)
+            if val:
+                out[key] = val
+        return out
+
+
+_FIELDS = frozenset(Article.__slots__)
+
+
+def as_dict(item: "Article | t.Mapping") -> dict:
+    """Mutable copy of a store item, whether it's an Article or a (manual) dict."""
+    return item.to_dict() if isinstance(item, Article) else dict(item)
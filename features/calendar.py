@@ -1,26 +1,36 @@
 # GET API KEYS
 import os
+import json
 import requests
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
-from openai import OpenAI
 from dotenv import load_dotenv
 
+from features.hearing_extract import extract_hearing
+from features import hearing_cache
+from features.openai_client import get_client
+from sources import http
+
 load_dotenv()
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 ADDEVENT_API_KEY = os.getenv("ADDEVENT_API_KEY")
 ADDEVENT_CALENDAR_ID = os.getenv("ADDEVENT_CALENDAR_ID")  # optional but recommended
 
-client = OpenAI(api_key=OPENAI_API_KEY)
-
 # ----------------------------
-# Web fetch (unchanged)
+# Web fetch
 # ----------------------------
-def fetch_hearing_html(url: str) -> str:
-    resp = requests.get(url, timeout=20)
+def fetch_hearing_page(url: str) -> str:
+    """Raw HTML of a hearing page (conditional GET against the last copy we saw)."""
+    cached = hearing_cache.get_page(url)
+    resp = http.get(url, timeout=20, headers=hearing_cache.conditional_headers(cached))
+    if resp.status_code == 304 and cached:
+        return cached["html"]
     if resp.status_code != 200:
         raise Exception(f"Failed to fetch page: {resp.status_code}")
-    return BeautifulSoup(resp.text, "html.parser").get_text()
+    hearing_cache.save_page(url, resp.text, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+    return resp.text
+
+def fetch_hearing_html(url: str) -> str:
+    return BeautifulSoup(fetch_hearing_page(url), "html.parser").get_text()
 
 # ----------------------------
 # AI extraction (unchanged)
@@ -40,7 +50,7 @@ DO NOT include any explanation, formatting, markdown, or commentary. DO NOT make
 Text:
 {page_text[:4000]}
 """
-    resp = client.chat.completions.create(
+    resp = get_client().chat.completions.create(
         model="gpt-3.5-turbo",
         messages=[
             {"role": "system", "content": "You are a helpful assistant extracting congressional hearing event details."},
@@ -50,6 +60,32 @@ Text:
     )
     return resp.choices[0].message.content
 
+def extract_hearing_details(url: str) -> dict:
+    """
+    Title/date/time/location for a hearing URL. Known page layouts are read
+    deterministically (features/hearing_extract.py); only unknown layouts go
+    to the LLM. Returns the same dict shape as json.loads(extract_event_info(...)).
+    Results are cached by URL + page-text hash, so an unchanged page is never
+    re-extracted from any session or worker.
+    """
+    html = fetch_hearing_page(url)
+    page_text = BeautifulSoup(html, "html.parser").get_text()
+    content_hash = hearing_cache.text_hash(page_text)
+
+    info = hearing_cache.get_extracted(url, content_hash)
+    if info:
+        return info
+
+    info = extract_hearing(url, html)
+    method = "markup"
+    if not info:
+        info = json.loads(extract_event_info(page_text))
+        method = "llm"
+    if info.get("date") and info.get("time"):
+        # don't pin an incomplete answer; a retry should get another go
+        hearing_cache.save_extracted(url, content_hash, info, method)
+    return info
+
 # ------------------------------------------------
 # AddEvent helpers: search + create (with de-dupe)
 # ------------------------------------------------
@@ -65,9 +101,10 @@ def _parse_dt_minute(dt_str: str):
     if not dt_str:
         return None
     dt_str = dt_str.strip()
-    for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S"):
+    # slice by the rendered width (16/19 chars), not len(fmt)
+    for fmt, width in (("%Y-%m-%d %H:%M:%S", 19), ("%Y-%m-%d %H:%M", 16)):
         try:
-            return datetime.strptime(dt_str[:len(fmt)], fmt)
+            return datetime.strptime(dt_str[:width], fmt).replace(second=0)
         except Exception:
             pass
     return None
@@ -99,6 +136,27 @@ def _search_events_addevent(q: str = None,
     r.raise_for_status()
     return r.json()
 
+def find_existing_event(events: list, url_tag: str, dt_start: datetime, window_hours: int = 3) -> dict | None:
+    """
+    Among already-fetched AddEvent events, find one for the same source URL
+    (in 'description') starting within the window. Accepts raw v2 events or
+    PulledEvent dicts. Returns {"id", "url", "deduped": True} or None.
+    """
+    win = timedelta(hours=max(1, int(window_hours)))
+    for ev in events or []:
+        # Normalize candidate start time (wall clock, minute precision)
+        ev_start = _parse_dt_minute(
+            str(ev.get("datetime_start") or ev.get("start") or "").replace("T", " ")
+        )
+        # Confirm same URL is present in description
+        desc = (ev.get("description") or "")
+        if ev_start and abs((ev_start - dt_start).total_seconds()) <= win.total_seconds() and url_tag in desc:
+            # Build a minimal compatible response
+            existing_id = ev.get("id") or ev.get("event_id")
+            existing_url = ev.get("url") or ev.get("link") or ev.get("addevent_url")
+            return {"id": existing_id, "url": existing_url, "deduped": True}
+    return None
+
 def create_event_addevent(data: dict,
                           *,
                           dedupe: bool = True,
@@ -136,16 +194,9 @@ def create_event_addevent(data: dict,
                     starts_before=dt_start + win,
                     page_size=20,
                 )
-                for ev in (sr.get("events") or []):
-                    # Normalize candidate start time
-                    ev_start = _parse_dt_minute(ev.get("datetime_start") or ev.get("start") or "")
-                    # Confirm same URL is present in description
-                    desc = (ev.get("description") or "")
-                    if ev_start and abs((ev_start - dt_start).total_seconds()) <= win.total_seconds() and url_tag in desc:
-                        # Build a minimal compatible response
-                        existing_id = ev.get("id") or ev.get("event_id")
-                        existing_url = ev.get("url") or ev.get("link")
-                        return {"id": existing_id, "url": existing_url, "deduped": True}
+                existing = find_existing_event(sr.get("events") or [], url_tag, dt_start, dedupe_window_hours)
+                if existing:
+                    return existing
         except Exception:
             # If search fails, just fall through and create.
             pass
@@ -1,7 +1,7 @@
 # features/calendar_pull.py
 """
 Pull events from AddEvent within a date range, extract the original link
-(from the event description), and generate per-event ICS content.
+(from the event description), and generate per-event or multi-event ICS content.
 
 ENV required:
     ADDEVENT_API_KEY        -> Your AddEvent API key (Bearer)
@@ -9,6 +9,7 @@ ENV required:
 Optional:
     ADDEVENT_CALENDAR_KEY   -> e.g. "GT179952" (AddEvent unique_key)
     LOCAL_TZ                -> IANA tz name, default "America/New_York"
+    ADDEVENT_PAGE_WORKERS   -> parallel page fetches per search, default 6
 
 Notes:
 - Uses AddEvent v2 endpoints under https://api.addevent.com/calevent/v2
@@ -18,12 +19,16 @@ Notes:
 
 from __future__ import annotations
 
+import hashlib
 import os
 import re
+import threading
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta, timezone, time as dtime
 
 import requests
+import requests.adapters
 
 try:
     from zoneinfo import ZoneInfo  # py3.9+
@@ -33,6 +38,7 @@ except Exception:  # pragma: no cover
 API_BASE = "https://api.addevent.com/calevent/v2"
 DEFAULT_CALENDAR_KEY = os.getenv("ADDEVENT_CALENDAR_KEY", "GT179952")
 DEBUG = os.getenv("PC_DEBUG", "").lower() in {"1", "true", "yes"}
+PAGE_WORKERS = int(os.getenv("ADDEVENT_PAGE_WORKERS", "6"))
 
 
 # ---- Timezone helpers --------------------------------------------------------
@@ -228,105 +234,221 @@ def _shape_event(raw: dict) -> PulledEvent:
     return ev
 
 
-# ---- Search ------------------------------------------------------------------
+# ---- Client ------------------------------------------------------------------
 
-def search_events_between(
-    start: date,
-    end: date,
-    calendar_key: str = DEFAULT_CALENDAR_KEY,
-    page_size: int = 20,   # AddEvent caps page_size low; use 20 max
-) -> list[PulledEvent]:
+class IncompletePull(RuntimeError):
+    """A results page of a search could not be fetched."""
+
+
+def _page_count(data: dict, page_size: int) -> int | None:
+    """
+    Total number of pages, if the response tells us. AddEvent has reported this
+    a few different ways; fall back to None (walk pages one by one).
+    """
+    candidates: list[dict] = [data]
+    for k in ("meta", "pagination", "paging"):
+        if isinstance(data.get(k), dict):
+            candidates.append(data[k])
+    for c in candidates:
+        for k in ("total_pages", "page_count", "last_page", "pages"):
+            v = c.get(k)
+            if isinstance(v, int) or (isinstance(v, str) and v.isdigit()):
+                return max(1, int(v))
+        for k in ("total", "total_count", "total_results", "count_total"):
+            v = c.get(k)
+            if isinstance(v, int) or (isinstance(v, str) and v.isdigit()):
+                return max(1, -(-int(v) // max(1, page_size)))
+    return None
+
+
+class AddEventClient:
     """
-    Pull events in the [start, end] inclusive date range using the correct
-    v2 search params: datetime_min / datetime_max, sort_by=datetime_start.
-    Locally filter as a safety net.
+    Reusable AddEvent client: one persistent requests.Session (keep-alive),
+    a unique_key -> calendar_id cache, and concurrent page fetching once the
+    first page tells us how many results there are.
     """
-    session = _api_session()
-    cal_id = resolve_calendar_id(session, calendar_key)
-
-    # For server-side filter
-    dt_min_str, dt_max_str = _api_date_bounds_str(start, end)
-    # For local safety filter
-    min_utc, max_utc = _utc_bounds(start, end)
-
-    events: list[PulledEvent] = []
-    page = 1
-
-    params: dict[str, t.Any] = {
-        "page": page,
-        "page_size": min(max(1, page_size), 20),
-        "sort_by": "datetime_start",   # correct field per docs
-        "sort_order": "asc",
-        "datetime_min": dt_min_str,    # correct date filters per docs
-        "datetime_max": dt_max_str,
-    }
-    if cal_id:
-        params["calendar_id"] = cal_id
-
-    while True:
-        params["page"] = page
+
+    def __init__(self, max_workers: int = PAGE_WORKERS):
+        self.max_workers = max(1, max_workers)
+        self._session: requests.Session | None = None
+        self._session_lock = threading.Lock()
+        self._calendar_ids: dict[str, str] = {}
+
+    @property
+    def session(self) -> requests.Session:
+        with self._session_lock:
+            if self._session is None:
+                s = _api_session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=4, pool_maxsize=max(10, self.max_workers)
+                )
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                self._session = s
+            return self._session
+
+    def calendar_id(self, calendar_key: str) -> str | None:
+        """resolve_calendar_id(), but only once per unique_key per process."""
+        if calendar_key in self._calendar_ids:
+            return self._calendar_ids[calendar_key]
+        cal_id = resolve_calendar_id(self.session, calendar_key)
+        if cal_id:  # don't cache misses; they may be transient
+            self._calendar_ids[calendar_key] = cal_id
+        return cal_id
+
+    def _get_page(self, params: dict[str, t.Any], page: int) -> tuple[list, dict] | None:
+        q = dict(params, page=page)
         try:
-            resp = session.get(f"{API_BASE}/events", params=params, timeout=30)
+            resp = self.session.get(f"{API_BASE}/events", params=q, timeout=30)
         except Exception as e:
             if DEBUG:
-                print(f"[AddEvent] HTTP error: {e}")
-            break
-
+                print(f"[AddEvent] HTTP error page={page}: {e}")
+            return None
         if not resp.ok:
             if DEBUG:
                 print(f"[AddEvent] search status={resp.status_code} body={resp.text[:300]}")
-            break
-
+            return None
         data = resp.json() or {}
         raw_items = data.get("events") or data.get("data") or data.get("items") or []
-        if DEBUG and page == 1:
-            print(f"[AddEvent] results page 1 count={len(raw_items)} params={params}")
+        if not isinstance(raw_items, list):
+            raw_items = []
+        return raw_items, data
+
+    def search_events_between(
+        self,
+        start: date,
+        end: date,
+        calendar_key: str = DEFAULT_CALENDAR_KEY,
+        page_size: int = 20,   # AddEvent caps page_size low; use 20 max
+    ) -> list[PulledEvent]:
+        """
+        Pull events in the [start, end] inclusive date range using the correct
+        v2 search params: datetime_min / datetime_max, sort_by=datetime_start.
+        Locally filter as a safety net. Raises IncompletePull if any results
+        page fails, so a partial list is never taken for the whole range.
+        """
+        cal_id = self.calendar_id(calendar_key)
+
+        # For server-side filter
+        dt_min_str, dt_max_str = _api_date_bounds_str(start, end)
+        # For local safety filter
+        min_utc, max_utc = _utc_bounds(start, end)
+
+        params: dict[str, t.Any] = {
+            "page_size": min(max(1, page_size), 20),
+            "sort_by": "datetime_start",   # correct field per docs
+            "sort_order": "asc",
+            "datetime_min": dt_min_str,    # correct date filters per docs
+            "datetime_max": dt_max_str,
+        }
+        if cal_id:
+            params["calendar_id"] = cal_id
+
+        pages: list[list] = []
+        first = self._get_page(params, 1)
+        if first is None:
+            raise IncompletePull("AddEvent results page 1 could not be fetched")
+        if first:
+            raw_items, data = first
+            if DEBUG:
+                print(f"[AddEvent] results page 1 count={len(raw_items)} params={params}")
+            pages.append(raw_items)
+            total_pages = _page_count(data, params["page_size"])
+
+            if raw_items and len(raw_items) >= params["page_size"]:
+                if total_pages and total_pages > 1:
+                    # we know the extent: fetch the rest side by side
+                    rest = range(2, min(total_pages, 1000) + 1)
+                    with ThreadPoolExecutor(max_workers=min(self.max_workers, len(rest))) as pool:
+                        results = list(pool.map(lambda p: self._get_page(params, p), rest))
+                    failed = [p for p, res in zip(rest, results) if res is None]
+                    if failed:
+                        # a partial list would be snapshotted as the whole range
+                        raise IncompletePull(f"AddEvent results pages {failed} could not be fetched")
+                    pages.extend(res[0] for res in results)
+                else:
+                    # no total in the response: simple numeric paging
+                    page = 2
+                    while page <= 1000:  # safety
+                        res = self._get_page(params, page)
+                        if res is None:
+                            raise IncompletePull(f"AddEvent results page {page} could not be fetched")
+                        if not res[0]:
+                            break
+                        pages.append(res[0])
+                        if len(res[0]) < params["page_size"]:
+                            break
+                        page += 1
+
+        events: list[PulledEvent] = []
+        seen: set[str] = set()
+        for raw_items in pages:
+            for raw in raw_items:
+                ev = _shape_event(raw)
+
+                # pages fetched concurrently can overlap if the data shifts mid-pull
+                if ev["id"] and ev["id"] in seen:
+                    continue
+                seen.add(ev["id"])
+
+                # safety: calendar filter
+                if cal_id and ev.get("calendar_id") and str(ev["calendar_id"]) != str(cal_id):
+                    continue
+
+                # safety: date filter (compare in UTC)
+                sdt = _ensure_aware_local(ev["starts_at_dt"]).astimezone(timezone.utc)
+                if not (min_utc <= sdt <= max_utc):
+                    continue
+
+                events.append(ev)
+
+        # final sort by local start time
+        events.sort(key=lambda e: _ensure_aware_local(e["starts_at_dt"]))
+        if DEBUG:
+            print(f"[AddEvent] total kept={len(events)} pages={len(pages)}")
+        return events
 
-        if not isinstance(raw_items, list) or not raw_items:
-            break
+    def retrieve_event(self, event_id: str) -> PulledEvent | None:
+        try:
+            resp = self.session.get(f"{API_BASE}/events/{event_id}", timeout=20)
+        except Exception:
+            return None
+        if not resp.ok:
+            if DEBUG:
+                print(f"[AddEvent] retrieve status={resp.status_code} body={resp.text[:200]}")
+            return None
+        data = resp.json() or {}
+        raw = data.get("event") if isinstance(data.get("event"), dict) else data
+        return _shape_event(raw)
 
-        for raw in raw_items:
-            ev = _shape_event(raw)
 
-            # safety: calendar filter
-            if cal_id and ev.get("calendar_id") and str(ev["calendar_id"]) != str(cal_id):
-                continue
+_client: AddEventClient | None = None
+_client_lock = threading.Lock()
 
-            # safety: date filter (compare in UTC)
-            sdt = _ensure_aware_local(ev["starts_at_dt"]).astimezone(timezone.utc)
-            if not (min_utc <= sdt <= max_utc):
-                continue
 
-            events.append(ev)
+def get_client() -> AddEventClient:
+    """Process-wide client so the session and calendar id cache are reused."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = AddEventClient()
+        return _client
 
-        # simple numeric paging: stop if fewer than page_size returned
-        if len(raw_items) < params["page_size"]:
-            break
 
-        page += 1
-        if page > 1000:  # safety
-            break
+# ---- Search ------------------------------------------------------------------
 
-    # final sort by local start time
-    events.sort(key=lambda e: _ensure_aware_local(e["starts_at_dt"]))
-    if DEBUG:
-        print(f"[AddEvent] total kept={len(events)}")
-    return events
+def search_events_between(
+    start: date,
+    end: date,
+    calendar_key: str = DEFAULT_CALENDAR_KEY,
+    page_size: int = 20,   # AddEvent caps page_size low; use 20 max
+) -> list[PulledEvent]:
+    """See AddEventClient.search_events_between (uses the shared client)."""
+    return get_client().search_events_between(start, end, calendar_key=calendar_key, page_size=page_size)
 
 
 def retrieve_event(event_id: str) -> PulledEvent | None:
-    session = _api_session()
-    try:
-        resp = session.get(f"{API_BASE}/events/{event_id}", timeout=20)
-    except Exception:
-        return None
-    if not resp.ok:
-        if DEBUG:
-            print(f"[AddEvent] retrieve status={resp.status_code} body={resp.text[:200]}")
-        return None
-    data = resp.json() or {}
-    raw = data.get("event") if isinstance(data.get("event"), dict) else data
-    return _shape_event(raw)
+    return get_client().retrieve_event(event_id)
 
 
 # ---- ICS generation ----------------------------------------------------------
@@ -339,7 +461,46 @@ def _fmt_ics_dt(dt: datetime | None) -> str:
     dt_utc = dt.astimezone(timezone.utc)
     return dt_utc.strftime("%Y%m%dT%H%M%SZ")
 
-def make_ics_for_event(ev: PulledEvent) -> str:
+_ICS_HEADER = [
+    "BEGIN:VCALENDAR",
+    "VERSION:2.0",
+    "PRODID:-//PolicyCrush//AddEvent Pull//EN",
+    "CALSCALE:GREGORIAN",
+    "METHOD:PUBLISH",
+]
+
+def _ics_escape(text: str) -> str:
+    """RFC 5545 TEXT escaping (backslash, ; , and newlines)."""
+    return (
+        (text or "")
+        .replace("\\", "\\\\")
+        .replace(";", r"\;")
+        .replace(",", r"\,")
+        .replace("\r\n", "\n")
+        .replace("\r", "\n")
+        .replace("\n", r"\n")
+    )
+
+def _fold_line(line: str) -> str:
+    """
+    Fold a content line at 75 octets (RFC 5545 3.1). Continuation lines start
+    with a single space; never split inside a multi-byte UTF-8 character.
+    """
+    if len(line.encode("utf-8")) <= 75:
+        return line
+    parts: list[str] = []
+    current, size, limit = [], 0, 75
+    for ch in line:
+        n = len(ch.encode("utf-8"))
+        if size + n > limit:
+            parts.append("".join(current))
+            current, size, limit = [], 0, 74  # leading space takes one octet
+        current.append(ch)
+        size += n
+    parts.append("".join(current))
+    return "\r\n ".join(parts)
+
+def _vevent_lines(ev: PulledEvent, dtstamp: str) -> list[str]:
     uid = (ev.get("id") or f"pc-{int(datetime.now().timestamp())}") + "@policycrush"
     title = (ev.get("title") or "").replace("\n", " ").strip()
     desc = (ev.get("description") or "").strip()
@@ -350,30 +511,58 @@ def make_ics_for_event(ev: PulledEvent) -> str:
     if not edt:
         edt = sdt + timedelta(hours=1)
 
-    dtstamp = _fmt_ics_dt(datetime.now().astimezone(LOCAL_TZ))
-    dtstart = _fmt_ics_dt(sdt)
-    dtend = _fmt_ics_dt(edt)
-
     lines = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "PRODID:-//PolicyCrush//AddEvent Pull//EN",
-        "CALSCALE:GREGORIAN",
-        "METHOD:PUBLISH",
         "BEGIN:VEVENT",
         f"UID:{uid}",
         f"DTSTAMP:{dtstamp}",
-        f"DTSTART:{dtstart}",
-        f"DTEND:{dtend}",
-        f"SUMMARY:{title}",
+        f"DTSTART:{_fmt_ics_dt(sdt)}",
+        f"DTEND:{_fmt_ics_dt(edt)}",
+        f"SUMMARY:{_ics_escape(title)}",
     ]
     if url:
         lines.append(f"URL:{url}")
     if desc:
-        safe = desc.replace("\\", "\\\\").replace(",", r"\,").replace(";", r"\;")
-        lines.append(f"DESCRIPTION:{safe}")
-    lines += ["END:VEVENT", "END:VCALENDAR", ""]
-    return "\r\n".join(lines)
+        lines.append(f"DESCRIPTION:{_ics_escape(desc)}")
+    lines.append("END:VEVENT")
+    return lines
+
+def make_ics_for_event(ev: PulledEvent) -> str:
+    dtstamp = _fmt_ics_dt(datetime.now().astimezone(LOCAL_TZ))
+    lines = [*_ICS_HEADER, *_vevent_lines(ev, dtstamp), "END:VCALENDAR", ""]
+    return "\r\n".join(_fold_line(l) for l in lines)
+
+def iter_ics_feed(events: t.Iterable[PulledEvent],
+                  name: str | None = None,
+                  refresh_minutes: int | None = None) -> t.Iterator[str]:
+    """
+    Yield one VCALENDAR with a VEVENT per event, chunk by chunk, so a feed
+    response can be streamed while it's generated.
+    """
+    header = list(_ICS_HEADER)
+    if name:
+        header.append(f"X-WR-CALNAME:{_ics_escape(name)}")
+    if refresh_minutes:
+        # hint for subscribing clients (Apple/Outlook read one or the other)
+        header.append(f"REFRESH-INTERVAL;VALUE=DURATION:PT{int(refresh_minutes)}M")
+        header.append(f"X-PUBLISHED-TTL:PT{int(refresh_minutes)}M")
+    yield "".join(_fold_line(l) + "\r\n" for l in header)
+
+    dtstamp = _fmt_ics_dt(datetime.now().astimezone(LOCAL_TZ))
+    for ev in events:
+        yield "".join(_fold_line(l) + "\r\n" for l in _vevent_lines(ev, dtstamp))
+    yield "END:VCALENDAR\r\n"
+
+def ics_feed_etag(events: t.Iterable[PulledEvent], *extra: str) -> str:
+    """Validator for a feed: changes only when an event's visible fields do."""
+    h = hashlib.sha1()
+    for part in extra:
+        h.update(str(part).encode("utf-8"))
+        h.update(b"\0")
+    for ev in events:
+        for f in ("id", "title", "description", "starts_at", "ends_at", "original_link", "addevent_url"):
+            h.update(str(ev.get(f) or "").encode("utf-8"))
+            h.update(b"\0")
+    return h.hexdigest()
 
 
 # ---- Grouping for UI/PDF -----------------------------------------------------
@@ -1,12 +1,5 @@
 # features/categorize.py
-import os
-from dotenv import load_dotenv
-from openai import OpenAI
-
-# Load API key exactly like classify.py
-load_dotenv()
-api_key = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=api_key)
+from features.openai_client import get_client
 
 # Exact labels you gave (spelling & casing matter)
 SPECIAL_CALENDAR = "Events"
@@ -94,7 +87,7 @@ def categorize_article(title: str, is_hearing: bool = False) -> str:
     instructions = _build_instructions(allowed)
 
     try:
-        resp = client.chat.completions.create(
+        resp = get_client().chat.completions.create(
             model="gpt-3.5-turbo",
             temperature=0,
             messages=[
@@ -112,3 +105,41 @@ def categorize_article(title: str, is_hearing: bool = False) -> str:
         return label
     except Exception:
         return "Quality and Innovation"
+
+
+def merge_index(old_index, entries, key, classify, labels, fallback="Quality and Innovation"):
+    """
+    Carry a label -> [ref] index forward to a new selection.
+
+    entries: [(ref, item)] for everything currently selected
+    key:     ref -> hashable identity
+    classify: item -> label, only called for refs not already in old_index
+
+    Refs already filed keep their label and position (so manual moves survive),
+    refs no longer selected are dropped, and new refs are classified and appended.
+    Returns (index, number of items classified).
+    """
+    current = {}
+    for ref, item in entries:
+        current.setdefault(key(ref), (ref, item))
+
+    index = {label: [] for label in labels}
+    filed = set()
+    for label, refs in (old_index or {}).items():
+        bucket = index.setdefault(label, [])
+        for ref in refs or []:
+            k = key(ref)
+            if k in current and k not in filed:
+                filed.add(k)
+                bucket.append(ref)
+
+    classified = 0
+    for k, (ref, item) in current.items():
+        if k in filed:
+            continue
+        label = classify(item)
+        if label not in index:
+            label = fallback
+        index[label].append(ref)
+        classified += 1
+    return index, classified
@@ -1,11 +1,4 @@
-import os
-from openai import OpenAI
-from dotenv import load_dotenv
-
-# Load .env if available
-load_dotenv()
-api_key = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=api_key)
+from features.openai_client import get_client
 
 SYSTEM_MESSAGE = {
     "role": "system",
@@ -50,7 +43,7 @@ Respond only with one of the following:
 Do not explain your reasoning. Only reply: YES, MAYBE, or NO.
 """
     try:
-        response = client.chat.completions.create(
+        response = get_client().chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
             temperature=0
@@ -0,0 +1,190 @@
+# features/dedupe.py
+"""
+Near-duplicate detection across scraped items.
+
+The same announcement routinely shows up as a committee release, the matching
+Senate/House release, HHS and the White House. Items are clustered by:
+
+  1. exact match on a normalized URL (scheme/www/trailing slash/tracking
+     params ignored), then
+  2. title similarity: a MinHash signature over word shingles finds
+     candidates through LSH bands (a few dict hits per item instead of
+     comparing every pair), and an exact Jaccard check on the shingle sets
+     confirms them.
+
+Candidates must also be dated within DEDUPE_MAX_DAYS of each other when both
+have a date, so a recurring "Hearing: ..." title from another week isn't folded.
+
+The first item seen in a cluster is its representative; later ones get
+`dup_of` / `dup_label` pointing at it.
+
+ENV (optional):
+    DEDUPE_JACCARD    -> minimum title shingle overlap (default 0.6)
+    DEDUPE_MAX_DAYS   -> max date distance inside a cluster (default 3)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import typing as t
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+if t.TYPE_CHECKING:
+    from features.article import Article
+
+JACCARD_MIN = float(os.getenv("DEDUPE_JACCARD", "0.6"))
+MAX_DAYS = int(os.getenv("DEDUPE_MAX_DAYS", "3"))
+
+# 16 bands x 2 rows: a pair at Jaccard 0.6 shares a band with p ~ 0.999
+_BANDS = 16
+_ROWS = 2
+_PRIME = (1 << 61) - 1
+_PERMS = [
+    (int.from_bytes(hashlib.blake2b(f"a{i}".encode(), digest_size=8).digest(), "big") % _PRIME | 1,
+     int.from_bytes(hashlib.blake2b(f"b{i}".encode(), digest_size=8).digest(), "big") % _PRIME)
+    for i in range(_BANDS * _ROWS)
+]
+
+_TRACKING = re.compile(r"^(utm_|fbclid$|gclid$|mc_cid$|mc_eid$|_hs)", re.I)
+_WORD = re.compile(r"[a-z0-9]+")
+_STOP = frozenset(
+    "a an and are as at be by for from has in is it its of on or that the this to was were will with "
+    "press release statement announces".split()
+)
+
+
+# ---- Features ------------------------------------------------------------------
+
+def normalize_url(url: str) -> str:
+    """Comparable form of a URL (host case, www., fragment, tracking params, trailing /)."""
+    try:
+        parts = urlsplit((url or "").strip())
+    except ValueError:
+        return (url or "").strip().lower()
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode(sorted((k, v) for k, v in parse_qsl(parts.query) if not _TRACKING.match(k)))
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("", host, path, query, ""))
+
+
+def shingles(title: str) -> frozenset[str]:
+    """Word unigrams + bigrams of a title, minus filler words."""
+    words = [w for w in _WORD.findall((title or "").lower()) if w not in _STOP]
+    grams = set(words)
+    grams.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    return frozenset(grams)
+
+
+def minhash(features: t.Iterable[str]) -> list[int]:
+    hashes = [int.from_bytes(hashlib.blake2b(f.encode("utf-8"), digest_size=8).digest(), "big") for f in features]
+    return [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMS]
+
+
+def _bands(signature: list[int]) -> list[tuple[int, tuple[int, ...]]]:
+    return [(i, tuple(signature[i * _ROWS:(i + 1) * _ROWS])) for i in range(_BANDS)]
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def describe(a: "Article") -> str:
+    """Where an item came from, for the 'same as' note."""
+    if a.side:
+        return f"House {a.committee} ({a.side})"
+    if a.committee:
+        return f"Senate {a.committee}"
+    return a.source or "News"
+
+
+# ---- Index -------------------------------------------------------------------
+
+class DedupeIndex:
+    def __init__(self):
+        self._by_url: dict[str, "Article"] = {}
+        self._bands: dict[tuple, list[int]] = {}
+        self._entries: list[tuple["Article", frozenset]] = []
+
+    def _close_in_time(self, a: "Article", b: "Article") -> bool:
+        if a.ts is None or b.ts is None:
+            return True
+        return abs((a.ts.date() - b.ts.date()).days) <= MAX_DAYS
+
+    def find(self, item: "Article", grams: frozenset | None = None) -> "Article | None":
+        """Representative of the cluster `item` belongs to, or None."""
+        hit = self._by_url.get(normalize_url(item.url))
+        if hit is not None:
+            return hit
+        grams = shingles(item.title) if grams is None else grams
+        if not grams:
+            return None
+        best, best_score = None, JACCARD_MIN
+        seen = set()
+        for band in _bands(minhash(grams)):
+            for pos in self._bands.get(band, ()):
+                if pos in seen:
+                    continue
+                seen.add(pos)
+                rep, rep_grams = self._entries[pos]
+                score = jaccard(grams, rep_grams)
+                if score >= best_score and self._close_in_time(item, rep):
+                    best, best_score = rep, score
+        return best
+
+    def add(self, item: "Article", grams: frozenset | None = None) -> None:
+        """Index a representative."""
+        self._by_url.setdefault(normalize_url(item.url), item)
+        grams = shingles(item.title) if grams is None else grams
+        if not grams:
+            return
+        pos = len(self._entries)
+        self._entries.append((item, grams))
+        for band in _bands(minhash(grams)):
+            self._bands.setdefault(band, []).append(pos)
+
+
+def cluster(items: t.Sequence["Article"], known: t.Iterable["Article"] = ()) -> dict[str, "Article"]:
+    """
+    Mark near-duplicates in `items` against `known` (already shown) items and
+    each other. Sets dup_of/dup_label on duplicates and returns {dup id: rep}.
+    """
+    index = DedupeIndex()
+    for k in known:
+        if not k.dup_of:
+            index.add(k)
+
+    reps: dict[str, "Article"] = {}
+    for item in items:
+        item.dup_of = item.dup_label = ""
+        grams = shingles(item.title)
+        rep = index.find(item, grams)
+        if rep is None or rep.id == item.id:
+            index.add(item, grams)
+            continue
+        item.dup_of = rep.id
+        item.dup_label = describe(rep)
+        reps[item.id] = rep
+    return reps
+
+
+def fold(items: list["Article"]) -> list["Article"]:
+    """Reorder a list so duplicates sit right under their representative (if it's in the list)."""
+    present = {a.id for a in items}
+    under: dict[str, list["Article"]] = {}
+    top: list["Article"] = []
+    for a in items:
+        if a.dup_of and a.dup_of in present:
+            under.setdefault(a.dup_of, []).append(a)
+        else:
+            top.append(a)
+    out: list["Article"] = []
+    for a in top:
+        out.append(a)
+        out.extend(under.get(a.id, ()))
+    return out
@@ -0,0 +1,254 @@
+# features/event_snapshots.py
+"""
+Local snapshot store for events pulled from AddEvent.
+
+A pull of [start, end] for a calendar is written to disk (and kept in memory)
+with the time it was fetched. Export, review and ICS endpoints hydrate from the
+freshest snapshot that covers the range they need instead of paging through the
+AddEvent API again. Pass refresh=True to force a live pull.
+
+A snapshot file's mtime is set to its fetched_at, so workers can tell from a
+directory listing whether a file is newer than the copy they hold in memory.
+Every save prunes snapshots covered by a newer one (same calendar, range at
+least as wide), memory copies past the TTL, and files past the keep window
+(the ICS feed still serves those when AddEvent is down).
+
+ENV (optional):
+    ADDEVENT_SNAPSHOT_TTL   -> seconds a snapshot counts as fresh (default 900)
+    ADDEVENT_SNAPSHOT_KEEP  -> seconds a snapshot file is kept on disk (default 604800)
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+import typing as t
+from datetime import date, datetime, timezone
+
+from features.storage import cache_dir, read_json, write_json
+from features.calendar_pull import (
+    PulledEvent,
+    search_events_between,
+    DEFAULT_CALENDAR_KEY,
+    _ensure_aware_local,
+    _utc_bounds,
+)
+
+SNAPSHOT_TTL = int(os.getenv("ADDEVENT_SNAPSHOT_TTL", "900"))
+SNAPSHOT_KEEP = int(os.getenv("ADDEVENT_SNAPSHOT_KEEP", "604800"))
+
+_DT_FIELDS = ("starts_at_dt", "ends_at_dt")
+_NAME_RE = re.compile(r"^(?P<cal>[A-Za-z0-9_-]+)_(?P<start>\d{4}-\d{2}-\d{2})_(?P<end>\d{4}-\d{2}-\d{2})\.json$")
+
+# (calendar_key, start_iso, end_iso) -> {"fetched_at": float, "events": [PulledEvent]}
+_memory: dict[tuple[str, str, str], dict] = {}
+_lock = threading.Lock()
+
+
+# ---- (De)serialization ------------------------------------------------------
+
+def _dump_event(ev: PulledEvent) -> dict:
+    out = dict(ev)
+    for f in _DT_FIELDS:
+        if isinstance(out.get(f), datetime):
+            out[f] = out[f].isoformat()
+    return out
+
+
+def _load_event(raw: dict) -> PulledEvent:
+    ev: PulledEvent = dict(raw)  # type: ignore[assignment]
+    for f in _DT_FIELDS:
+        val = ev.get(f)
+        if isinstance(val, str) and val:
+            try:
+                ev[f] = datetime.fromisoformat(val)  # type: ignore[literal-required]
+            except ValueError:
+                ev[f] = None  # type: ignore[literal-required]
+    if not ev.get("starts_at_dt"):
+        ev["starts_at_dt"] = datetime.min.replace(tzinfo=timezone.utc)
+    return ev
+
+
+def _safe_key(calendar_key: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_-]", "-", calendar_key or "default")
+
+
+def _path(calendar_key: str, start: date, end: date) -> str:
+    name = f"{_safe_key(calendar_key)}_{start.isoformat()}_{end.isoformat()}.json"
+    return os.path.join(cache_dir("addevent"), name)
+
+
+# ---- Store -------------------------------------------------------------------
+
+def save(start: date, end: date, events: list[PulledEvent], calendar_key: str = DEFAULT_CALENDAR_KEY) -> None:
+    snap = {"fetched_at": time.time(), "events": list(events or [])}
+    with _lock:
+        _memory[(_safe_key(calendar_key), start.isoformat(), end.isoformat())] = snap
+    path = _path(calendar_key, start, end)
+    try:
+        write_json(path, {
+            "fetched_at": snap["fetched_at"],
+            "calendar_key": calendar_key,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "events": [_dump_event(ev) for ev in snap["events"]],
+        })
+        os.utime(path, (snap["fetched_at"], snap["fetched_at"]))
+    except OSError:
+        pass  # memory copy still works for this worker
+    _prune(calendar_key)
+
+
+def _covered(key: tuple[str, str], at: float, others: t.Iterable[tuple[tuple[str, str], float]]) -> bool:
+    """True if another snapshot at least as new spans the whole range `key`."""
+    s, e = key
+    return any(k != key and k[0] <= s and k[1] >= e and o_at >= at for k, o_at in others)
+
+
+def _prune(calendar_key: str) -> None:
+    """Drop covered snapshots, memory copies past the TTL and files past the keep window."""
+    now = time.time()
+    cal = _safe_key(calendar_key)
+    with _lock:
+        mine = {(s, e): snap["fetched_at"] for (c, s, e), snap in _memory.items() if c == cal}
+        for key, at in mine.items():
+            if now - at > SNAPSHOT_TTL or _covered(key, at, mine.items()):
+                _memory.pop((cal, *key), None)
+
+    files = {}
+    for s, e, path in _disk_snapshots(calendar_key):
+        try:
+            files[(s, e)] = (os.path.getmtime(path), path)
+        except OSError:
+            continue
+    stamps = [(key, at) for key, (at, _path) in files.items()]
+    for key, (at, path) in files.items():
+        if now - at > SNAPSHOT_KEEP or _covered(key, at, stamps):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _disk_snapshots(calendar_key: str) -> t.Iterator[tuple[str, str, str]]:
+    """Yield (start_iso, end_iso, path) for every snapshot file of a calendar."""
+    folder = cache_dir("addevent")
+    want = _safe_key(calendar_key)
+    try:
+        names = os.listdir(folder)
+    except OSError:
+        return
+    for name in names:
+        m = _NAME_RE.match(name)
+        if m and m.group("cal") == want:
+            yield m.group("start"), m.group("end"), os.path.join(folder, name)
+
+
+def _covering(calendar_key: str, start: date, end: date, max_age: float) -> dict | None:
+    """Freshest snapshot whose range contains [start, end], or None."""
+    now = time.time()
+    s_iso, e_iso = start.isoformat(), end.isoformat()
+    best = None
+
+    with _lock:
+        for (cal, s, e), snap in _memory.items():
+            if cal != _safe_key(calendar_key) or s > s_iso or e < e_iso:
+                continue
+            if now - snap["fetched_at"] > max_age:
+                continue
+            if best is None or snap["fetched_at"] > best["fetched_at"]:
+                best = snap
+
+    # other workers may have pulled it; check disk too. A file's mtime is its
+    # fetched_at, so only files newer than what we hold get read.
+    cal = _safe_key(calendar_key)
+    for s, e, path in _disk_snapshots(calendar_key):
+        if s > s_iso or e < e_iso:
+            continue
+        try:
+            stamp = os.path.getmtime(path)
+        except OSError:
+            continue
+        with _lock:
+            held = _memory.get((cal, s, e))
+        if held and held["fetched_at"] >= stamp:
+            continue
+        if now - stamp > max_age or (best and stamp <= best["fetched_at"]):
+            continue
+        data = read_json(path) or {}
+        fetched_at = float(data.get("fetched_at") or stamp)
+        if abs(fetched_at - stamp) > 1:
+            try:
+                os.utime(path, (fetched_at, fetched_at))   # written before mtime tracked fetched_at
+            except OSError:
+                pass
+        if now - fetched_at > max_age or (best and fetched_at <= best["fetched_at"]):
+            continue
+        snap = {"fetched_at": fetched_at, "events": [_load_event(r) for r in data.get("events") or []]}
+        with _lock:
+            _memory[(cal, s, e)] = snap
+        best = snap
+    return best
+
+
+def _within(events: list[PulledEvent], start: date, end: date) -> list[PulledEvent]:
+    min_utc, max_utc = _utc_bounds(start, end)
+    out = []
+    for ev in events:
+        sdt = _ensure_aware_local(ev.get("starts_at_dt"))
+        if sdt and min_utc <= sdt.astimezone(timezone.utc) <= max_utc:
+            out.append(ev)
+    return out
+
+
+def cached_events(start: date, end: date,
+                  calendar_key: str = DEFAULT_CALENDAR_KEY,
+                  max_age: float | None = None) -> list[PulledEvent] | None:
+    """Events for [start, end] from a fresh snapshot, or None. Never hits the network."""
+    snap = _covering(calendar_key, start, end, SNAPSHOT_TTL if max_age is None else max_age)
+    if snap is None:
+        return None
+    return _within(snap["events"], start, end)
+
+
+def get_events(start: date, end: date,
+               calendar_key: str = DEFAULT_CALENDAR_KEY,
+               refresh: bool = False) -> list[PulledEvent]:
+    """Snapshot if fresh, otherwise pull live from AddEvent and snapshot the result."""
+    if not refresh:
+        cached = cached_events(start, end, calendar_key)
+        if cached is not None:
+            return cached
+    events = search_events_between(start, end, calendar_key=calendar_key)
+    save(start, end, events, calendar_key)
+    return events
+
+
+def find_event(event_id: str,
+               calendar_key: str = DEFAULT_CALENDAR_KEY,
+               max_age: float | None = None) -> PulledEvent | None:
+    """Look an event up by id across fresh snapshots (no network)."""
+    max_age = SNAPSHOT_TTL if max_age is None else max_age
+    now = time.time()
+    eid = str(event_id)
+
+    with _lock:
+        snaps = [s for (cal, _s, _e), s in _memory.items()
+                 if cal == _safe_key(calendar_key) and now - s["fetched_at"] <= max_age]
+    for snap in sorted(snaps, key=lambda s: s["fetched_at"], reverse=True):
+        for ev in snap["events"]:
+            if str(ev.get("id")) == eid:
+                return ev
+
+    for _s, _e, path in _disk_snapshots(calendar_key):
+        try:
+            if now - os.path.getmtime(path) > max_age:
+                continue
+        except OSError:
+            continue
+        for raw in (read_json(path) or {}).get("events") or []:
+            if str(raw.get("id")) == eid:
+                return _load_event(raw)
+    return None
@@ -0,0 +1,145 @@
+# features/hearing_cache.py
+"""
+Persistent cache for hearing pages and the metadata extracted from them.
+
+Two stores, both on disk (shared by every session and worker) with an
+in-memory copy for the current process:
+
+    pages/    URL -> last body + ETag / Last-Modified, so refetches are
+              conditional GETs and a 304 reuses the stored HTML
+    extract/  (URL, hash of the page text) -> {"title", "date", "time", "location"}
+
+Extraction results are keyed on the visible text rather than the raw HTML so
+rotating nonces, analytics tags etc. don't force another LLM call; a change to
+the hearing itself changes the text and misses the cache.
+
+ENV (optional):
+    HEARING_CACHE_MAX   -> entries kept per store on disk (default 500)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+
+from features.storage import cache_dir, read_json, write_json, prune_dir
+
+HEARING_CACHE_MAX = int(os.getenv("HEARING_CACHE_MAX", "500"))
+
+# bump when the extractors or prompt change so old answers aren't reused
+EXTRACT_VERSION = "2"
+
+_pages: dict[str, dict] = {}
+_extracted: dict[str, dict] = {}
+_lock = threading.Lock()
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _path(store: str, key: str) -> str:
+    return os.path.join(cache_dir("hearings", store), f"{key}.json")
+
+
+def _remember(store: dict, key: str, value: dict) -> None:
+    """Insert under _lock, dropping the oldest entries past HEARING_CACHE_MAX."""
+    store.pop(key, None)
+    store[key] = value
+    while len(store) > HEARING_CACHE_MAX:
+        store.pop(next(iter(store)))
+
+
+def text_hash(text: str) -> str:
+    """Whitespace-insensitive hash of a page's visible text."""
+    return hashlib.sha256(" ".join((text or "").split()).encode("utf-8")).hexdigest()
+
+
+# ---- Pages -------------------------------------------------------------------
+
+def get_page(url: str) -> dict | None:
+    """{"html", "etag", "last_modified", "fetched_at"} from the last 200, or None."""
+    key = _digest(url)
+    with _lock:
+        page = _pages.get(key)
+    if page is not None:
+        return page
+    page = read_json(_path("pages", key))
+    if not page or page.get("url") != url:
+        return None
+    with _lock:
+        _remember(_pages, key, page)
+    return page
+
+
+def conditional_headers(page: dict | None) -> dict:
+    """If-None-Match / If-Modified-Since for a refetch of a cached page."""
+    headers = {}
+    if page:
+        if page.get("etag"):
+            headers["If-None-Match"] = page["etag"]
+        if page.get("last_modified"):
+            headers["If-Modified-Since"] = page["last_modified"]
+    return headers
+
+
+def save_page(url: str, html: str, etag: str | None, last_modified: str | None) -> None:
+    key = _digest(url)
+    page = {
+        "url": url,
+        "html": html,
+        "etag": etag,
+        "last_modified": last_modified,
+        "fetched_at": time.time(),
+    }
+    with _lock:
+        _remember(_pages, key, page)
+    if not (etag or last_modified):
+        return  # nothing to revalidate with; memory copy is enough
+    try:
+        folder = cache_dir("hearings", "pages")
+        write_json(_path("pages", key), page)
+        prune_dir(folder, HEARING_CACHE_MAX, suffix=".json")
+    except OSError:
+        pass
+
+
+# ---- Extraction results ------------------------------------------------------
+
+def _extract_key(url: str, content_hash: str) -> str:
+    return _digest(EXTRACT_VERSION, url, content_hash)
+
+
+def get_extracted(url: str, content_hash: str) -> dict | None:
+    key = _extract_key(url, content_hash)
+    with _lock:
+        hit = _extracted.get(key)
+    if hit is not None:
+        return dict(hit)
+    data = read_json(_path("extract", key)) or {}
+    info = data.get("info")
+    if not isinstance(info, dict):
+        return None
+    with _lock:
+        _remember(_extracted, key, info)
+    return dict(info)
+
+
+def save_extracted(url: str, content_hash: str, info: dict, method: str = "") -> None:
+    key = _extract_key(url, content_hash)
+    with _lock:
+        _remember(_extracted, key, dict(info))
+    try:
+        folder = cache_dir("hearings", "extract")
+        write_json(_path("extract", key), {
+            "url": url,
+            "content_hash": content_hash,
+            "method": method,          # "markup" or "llm", handy when debugging
+            "saved_at": time.time(),
+            "info": info,
+        })
+        prune_dir(folder, HEARING_CACHE_MAX, suffix=".json")
+    except OSError:
+        pass
@@ -0,0 +1,207 @@
+# features/hearing_extract.py
+"""
+Deterministic hearing metadata extraction.
+
+Some hearing pages carry the start date/time in markup that only ever means
+"when the hearing starts": a schema.org Event in JSON-LD, or a committee's
+own hearing field on a layout we know. Those are read here; everything else
+(unknown layouts, pages where the known field is missing) returns None and
+features/calendar.py asks the LLM. There is deliberately no "first date on
+the page" fallback: the first <time> on a page is often its publication date.
+
+Committee layouts are registered as rules keyed by host and path prefix:
+
+    rule("www.finance.senate.gov", "/hearings/", "time.dtstart")
+
+Every extractor takes (url, soup) and returns a dict shaped like the LLM
+output, {"title", "date": "YYYY-MM-DD", "time": "HH:MM", "location"}, or None.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import typing as t
+from dataclasses import dataclass
+from datetime import datetime
+from urllib.parse import urlparse
+from zoneinfo import ZoneInfo
+
+from bs4 import BeautifulSoup
+
+LOCAL_TZ = ZoneInfo("America/New_York")
+TITLE_MAX = 100
+
+
+
+@dataclass(frozen=True)
+class Rule:
+    host: str                   # exact host, e.g. "www.finance.senate.gov"
+    path: str                   # path prefix of hearing pages, e.g. "/hearings/"
+    start: str                  # CSS selector of the hearing's start field
+    formats: tuple[str, ...]    # strptime formats for its datetime attribute / text
+
+
+RULES: list[Rule] = []
+
+
+def rule(host: str, path: str, start: str, formats: t.Iterable[str] = ("%Y-%m-%dT%H:%M",)) -> Rule:
+    """Register the hearing start field of a committee layout we know."""
+    r = Rule(host.lower(), path, start, tuple(formats))
+    RULES.append(r)
+    return r
+
+
+# ---- Helpers -----------------------------------------------------------------
+
+def _clean(text: str | None) -> str:
+    return re.sub(r"\s+", " ", (text or "")).strip()
+
+
+def _short_title(title: str) -> str:
+    """Keep under TITLE_MAX characters without cutting a word in half."""
+    title = _clean(title)
+    if len(title) <= TITLE_MAX:
+        return title
+    cut = title[: TITLE_MAX - 1].rsplit(" ", 1)[0].rstrip(",;:-")
+    return cut + "…"
+
+
+def _local(dt: datetime) -> datetime:
+    """Aware datetimes go to Eastern; naive ones are already local wall time."""
+    return dt.astimezone(LOCAL_TZ) if dt.tzinfo else dt
+
+
+def _result(title: str, dt: datetime | None, location: str = "") -> dict | None:
+    title = _short_title(title)
+    if not title or not dt:
+        return None
+    dt = _local(dt)
+    return {
+        "title": title,
+        "date": dt.strftime("%Y-%m-%d"),
+        "time": dt.strftime("%H:%M"),
+        "location": _clean(location),
+    }
+
+
+def _parse_iso(value: str) -> datetime | None:
+    value = (value or "").strip()
+    if "T" not in value:  # a date without a time isn't enough for a calendar entry
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M%z"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _page_title(soup: BeautifulSoup) -> str:
+    og = soup.select_one("meta[property='og:title']")
+    if og and og.get("content"):
+        return og["content"]
+    h1 = soup.select_one("h1")
+    if h1:
+        return h1.get_text(" ", strip=True)
+    return soup.title.get_text(strip=True) if soup.title else ""
+
+
+def _labeled_location(soup: BeautifulSoup) -> str:
+    tag = soup.select_one(".location, .hearing-location, [itemprop='location'], address")
+    if tag:
+        return tag.get_text(" ", strip=True).replace("Location:", "").strip()
+    text = soup.get_text("\n")
+    m = re.search(r"Location:\s*(.+)", text)
+    return m.group(1).strip() if m else ""
+
+
+# ---- Generic extractors --------------------------------------------------------
+
+def _jsonld_events(node: t.Any) -> t.Iterator[dict]:
+    if isinstance(node, list):
+        for n in node:
+            yield from _jsonld_events(n)
+    elif isinstance(node, dict):
+        kind = node.get("@type")
+        kinds = kind if isinstance(kind, list) else [kind]
+        if any(isinstance(k, str) and k.endswith("Event") for k in kinds):
+            yield node
+        if "@graph" in node:
+            yield from _jsonld_events(node["@graph"])
+
+
+def extract_jsonld(url: str, soup: BeautifulSoup) -> dict | None:
+    """schema.org Event in JSON-LD."""
+    for script in soup.select("script[type='application/ld+json']"):
+        try:
+            data = json.loads(script.string or script.get_text() or "")
+        except ValueError:
+            continue
+        for ev in _jsonld_events(data):
+            dt = _parse_iso(str(ev.get("startDate") or ""))
+            loc = ev.get("location") or ""
+            if isinstance(loc, dict):
+                addr = loc.get("address")
+                if isinstance(addr, dict):
+                    addr = addr.get("streetAddress") or ""
+                loc = loc.get("name") or addr or ""
+            res = _result(str(ev.get("name") or _page_title(soup)), dt, str(loc))
+            if res:
+                return res
+    return None
+
+
+# ---- Committee layouts ---------------------------------------------------------
+
+# hCalendar hearing listings/pages (time.dtstart is the hearing start, not a post date)
+rule("www.appropriations.senate.gov", "/hearings/", "time.dtstart")
+rule("www.budget.senate.gov", "/hearings/", "time.dtstart")
+rule("www.finance.senate.gov", "/hearings/", "time.dtstart")
+
+
+def _rules_for(url: str) -> list[Rule]:
+    parts = urlparse(url)
+    host, path = (parts.hostname or "").lower(), parts.path or "/"
+    return [r for r in RULES if r.host == host and path.startswith(r.path)]
+
+
+def _rule_datetime(r: Rule, tag) -> datetime | None:
+    raw = (tag.get("datetime") or tag.get_text(" ", strip=True)).strip()
+    for fmt in r.formats:
+        try:
+            return datetime.strptime(raw, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def extract_committee_fields(url: str, soup: BeautifulSoup) -> dict | None:
+    """The hearing start field of a registered committee layout."""
+    for r in _rules_for(url):
+        tag = soup.select_one(r.start)
+        dt = _rule_datetime(r, tag) if tag else None
+        if dt:
+            return _result(_page_title(soup), dt, _labeled_location(soup))
+    return None
+
+
+# ---- Entry point -------------------------------------------------------------
+
+def extract_hearing(url: str, html: str) -> dict | None:
+    """Title/date/time/location from hearing-specific markup, or None (caller falls back to the LLM)."""
+    if not html:
+        return None
+    soup = BeautifulSoup(html, "html.parser")
+    for fn in (extract_jsonld, extract_committee_fields):
+        try:
+            res = fn(url, soup)
+        except Exception:
+            res = None
+        if res:
+            return res
+    return None
@@ -0,0 +1,34 @@
+# features/openai_client.py
+"""
+One OpenAI client for the whole process, created on first use.
+
+classify, categorize and calendar used to each build their own client at
+import time, which pulled `openai` (and httpx, pydantic, ...) into every
+worker at boot. Import this module freely; the SDK loads on the first call.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import typing as t
+
+from dotenv import load_dotenv
+
+if t.TYPE_CHECKING:
+    from openai import OpenAI
+
+load_dotenv()
+
+_client: "OpenAI | None" = None
+_lock = threading.Lock()
+
+
+def get_client() -> "OpenAI":
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                from openai import OpenAI
+                _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _client
@@ -0,0 +1,178 @@
+# features/pdf_export.py
+"""
+PDF export service with a render cache.
+
+Exports are keyed by a hash of the hydrated, ordered category payload plus the
+version of the template that renders it. A repeat export of an unchanged issue
+is streamed straight from disk; a miss is rendered by WeasyPrint in a worker
+process so the web worker only waits on a future instead of doing the render.
+
+ENV (optional):
+    PDF_CACHE_MAX       -> how many rendered PDFs to keep on disk (default 50)
+    PDF_WORKERS         -> size of the render process pool (default 2)
+    PDF_WAIT_SECONDS    -> how long a request waits before answering
+                           "still rendering" (default 20)
+
+The render pool is never started at import time. `python app.py` calls
+warm_up() in the serving process (not the reloader's watcher) so workers
+have fonts and stylesheets loaded before the first export; anywhere else
+the pool starts on the first export.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+import typing as t
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeout
+
+from flask import current_app
+
+from features.storage import cache_dir, atomic_write, prune_dir
+from features import pdf_renderer
+
+PDF_CACHE_MAX = int(os.getenv("PDF_CACHE_MAX", "50"))
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", "2"))
+PDF_WAIT_SECONDS = float(os.getenv("PDF_WAIT_SECONDS", "20"))
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+_template_versions: dict[str, str] = {}
+
+
+# ---- Keys --------------------------------------------------------------------
+
+def template_version(name: str) -> str:
+    """Hash of the template source as Flask resolves it (so edits bust the cache)."""
+    env = current_app.jinja_env
+    if name in _template_versions and not current_app.debug:
+        return _template_versions[name]
+    source, _filename, _uptodate = env.loader.get_source(env, name)
+    version = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+    _template_versions[name] = version
+    return version
+
+
+def payload_key(categories: t.Mapping[str, list], template_name: str, extra: t.Any = None) -> str:
+    """
+    Stable key for an export: ordered (label, items) pairs + template version.
+    `extra` is for anything else that ends up in the HTML (e.g. host for links).
+    """
+    blob = json.dumps(
+        {
+            "template": template_name,
+            "version": template_version(template_name),
+            "css": pdf_renderer.stylesheet_version(),
+            "extra": extra,
+            "categories": [[label, items] for label, items in categories.items()],
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _pdf_path(key: str) -> str:
+    return os.path.join(cache_dir("pdf"), f"{key}.pdf")
+
+
+def cached_pdf(key: str) -> str | None:
+    """Path of a finished render for `key`, or None."""
+    path = _pdf_path(key)
+    if os.path.exists(path):
+        try:
+            os.utime(path, None)  # keep recently served files out of pruning
+        except OSError:
+            pass
+        return path
+    return None
+
+
+# ---- Worker side -------------------------------------------------------------
+
+def _render_to(path: str, html: str, base_url: str | None) -> str:
+    """Runs inside the pool: render once and drop the PDF into the cache."""
+    pdf_bytes = pdf_renderer.get_renderer().render(html, base_url=base_url)
+    atomic_write(path, pdf_bytes)
+    return path
+
+
+def _ready() -> bool:
+    return True
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # spawn: never fork a threaded web worker
+            ctx = multiprocessing.get_context("spawn")
+            _executor = ProcessPoolExecutor(
+                max_workers=max(1, PDF_WORKERS),
+                mp_context=ctx,
+                initializer=pdf_renderer.warm_up,   # fonts + CSS loaded once per worker
+            )
+        return _executor
+
+
+def _forget(key: str, _fut: Future) -> None:
+    with _inflight_lock:
+        _inflight.pop(key, None)
+    prune_dir(cache_dir("pdf"), PDF_CACHE_MAX, suffix=".pdf")
+
+
+def warm_up() -> None:
+    """
+    Start the render pool in the background so workers load fonts and parse
+    the PDF stylesheets before the first export. Never blocks. Called from
+    app.py's __main__ block; nothing calls it on import.
+    """
+    try:
+        ex = _get_executor()
+        for _ in range(max(1, PDF_WORKERS)):
+            ex.submit(_ready)
+    except Exception:
+        pass
+
+
+# ---- Request side ------------------------------------------------------------
+
+def submit(key: str, html: str, base_url: str | None = None) -> Future:
+    """Start (or join) the render for `key`."""
+    with _inflight_lock:
+        fut = _inflight.get(key)
+        if fut is None:
+            fut = _get_executor().submit(_render_to, _pdf_path(key), html, base_url)
+            _inflight[key] = fut
+            fut.add_done_callback(lambda f, k=key: _forget(k, f))
+        return fut
+
+
+def is_rendering(key: str) -> bool:
+    with _inflight_lock:
+        return key in _inflight
+
+
+def render(key: str, html: str, base_url: str | None = None, wait: float | None = None) -> str | None:
+    """
+    Return the path of the PDF for `key`, rendering it in the pool if needed.
+    Returns None if the render is still running after `wait` seconds; the
+    caller should ask the browser to come back (the job keeps going).
+    Render errors are re-raised.
+    """
+    path = cached_pdf(key)
+    if path:
+        return path
+    fut = submit(key, html, base_url)
+    try:
+        return fut.result(timeout=PDF_WAIT_SECONDS if wait is None else wait)
+    except FutureTimeout:
+        return None
@@ -0,0 +1,164 @@
+# features/pdf_renderer.py
+"""
+Long-lived WeasyPrint renderer.
+
+The first render in a fresh process is slow because WeasyPrint has to load
+fonts, parse CSS and (before this) fetch our own static files over HTTP from
+request.root_url. This renderer keeps one FontConfiguration per process,
+parses the PDF stylesheets under static/pdf/ once, and serves /static/...
+URLs straight from disk through a custom url_fetcher.
+
+WeasyPrint is imported lazily so importing this module stays cheap.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+from urllib.parse import urlparse, unquote
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_DIR = os.path.join(APP_ROOT, "static")
+STATIC_URL_PATH = "/static/"
+
+# Stylesheets parsed once per process (paths relative to static/)
+PRELOADED_STYLESHEETS = ("pdf/categories.css", "pdf/addevent.css")
+
+_LINK_RE = re.compile(r"""<link\b[^>]*\bhref=["']([^"']+)["'][^>]*>""", re.IGNORECASE)
+
+_WARMUP_HTML = "<html><body><h1>PolicyCrush</h1><p>warm-up</p><table><tr><td>1</td></tr></table></body></html>"
+
+
+def stylesheet_version() -> str:
+    """Hash of the preloaded stylesheets (part of the PDF cache key)."""
+    h = hashlib.sha1()
+    for rel in PRELOADED_STYLESHEETS:
+        try:
+            with open(os.path.join(STATIC_DIR, rel), "rb") as fh:
+                h.update(fh.read())
+        except OSError:
+            h.update(rel.encode("utf-8"))
+    return h.hexdigest()[:12]
+
+
+def _static_rel_path(url: str) -> str | None:
+    """Map a /static/... URL (any host) or file:// URL under static/ to a relative path."""
+    parsed = urlparse(url)
+    if parsed.scheme in ("http", "https", ""):
+        path = unquote(parsed.path or "")
+        if not path.startswith(STATIC_URL_PATH):
+            return None
+        rel = path[len(STATIC_URL_PATH):]
+    elif parsed.scheme == "file":
+        full = os.path.abspath(unquote(parsed.path))
+        if not full.startswith(STATIC_DIR + os.sep):
+            return None
+        rel = os.path.relpath(full, STATIC_DIR)
+    else:
+        return None
+    full = os.path.abspath(os.path.join(STATIC_DIR, rel))
+    if not full.startswith(STATIC_DIR + os.sep) or not os.path.isfile(full):
+        return None
+    return rel.replace(os.sep, "/")
+
+
+class PdfRenderer:
+    """One per process; holds the shared FontConfiguration and parsed CSS."""
+
+    def __init__(self, stylesheets: tuple[str, ...] = PRELOADED_STYLESHEETS):
+        from weasyprint.text.fonts import FontConfiguration
+
+        self.font_config = FontConfiguration()
+        self._stylesheet_names = stylesheets
+        self._css: dict = {}
+        self._static_bytes: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._load_stylesheets()
+
+    def _load_stylesheets(self) -> None:
+        from weasyprint import CSS
+
+        for rel in self._stylesheet_names:
+            path = os.path.join(STATIC_DIR, rel)
+            if os.path.isfile(path):
+                self._css[rel] = CSS(filename=path, font_config=self.font_config)
+
+    def _read_static(self, rel: str) -> bytes:
+        data = self._static_bytes.get(rel)
+        if data is None:
+            with open(os.path.join(STATIC_DIR, rel), "rb") as fh:
+                data = fh.read()
+            self._static_bytes[rel] = data
+        return data
+
+    def url_fetcher(self, url: str, *args, **kwargs):
+        """Serve our static files from disk; anything else goes to WeasyPrint's fetcher."""
+        from weasyprint.urls import default_url_fetcher
+
+        rel = _static_rel_path(url)
+        if rel is None:
+            return default_url_fetcher(url, *args, **kwargs)
+        if rel in self._css:
+            # already passed in pre-parsed; don't parse the <link> copy again
+            return {"string": b"", "mime_type": "text/css", "redirected_url": url}
+        mime, _enc = mimetypes.guess_type(rel)
+        return {
+            "string": self._read_static(rel),
+            "mime_type": mime or "application/octet-stream",
+            "redirected_url": url,
+        }
+
+    def _linked_stylesheets(self, html: str) -> list:
+        found = []
+        for href in _LINK_RE.findall(html or ""):
+            rel = _static_rel_path(href)
+            if rel in self._css and self._css[rel] not in found:
+                found.append(self._css[rel])
+        return found
+
+    def render(self, html: str, base_url: str | None = None) -> bytes:
+        from weasyprint import HTML
+
+        doc = HTML(string=html, base_url=base_url, url_fetcher=self.url_fetcher)
+        # FontConfiguration isn't safe to share across concurrent renders
+        with self._lock:
+            return doc.write_pdf(
+                stylesheets=self._linked_stylesheets(html),
+                font_config=self.font_config,
+            )
+
+    def warm_up(self) -> None:
+        """Render a throwaway document so fontconfig/pango are loaded before real work."""
+        try:
+            from weasyprint import HTML
+
+            with self._lock:
+                HTML(string=_WARMUP_HTML, url_fetcher=self.url_fetcher).write_pdf(
+                    stylesheets=list(self._css.values()),
+                    font_config=self.font_config,
+                )
+        except Exception:
+            pass
+
+
+_renderer: PdfRenderer | None = None
+_renderer_lock = threading.Lock()
+
+
+def get_renderer() -> PdfRenderer:
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = PdfRenderer()
+        return _renderer
+
+
+def warm_up() -> None:
+    """Process-pool initializer: build the renderer and prime fonts/CSS."""
+    try:
+        get_renderer().warm_up()
+    except Exception:
+        pass
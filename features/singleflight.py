@@ -0,0 +1,90 @@
+# features/singleflight.py
+"""
+Request coalescing for expensive loads.
+
+    flight = SingleFlight(grace=10)
+    result = flight.do(("house", start_date, use_openai), lambda: load(...))
+
+While a call for a key is running, other callers with the same key wait for
+it and get its result instead of running the work again (double-clicks, two
+editors loading the same day). For `grace` seconds after it finishes the
+result is still handed out. Failures are shared with the callers that were
+waiting but are never cached.
+
+Every caller gets its own `copy(result)` (default: the shared object), so
+callers that reorder or annotate the top-level containers don't step on each
+other.
+
+ENV (optional):
+    SINGLEFLIGHT_GRACE  -> seconds a finished result is reused (default 10)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import typing as t
+
+GRACE = float(os.getenv("SINGLEFLIGHT_GRACE", "10"))
+
+T = t.TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "finished_at")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: t.Any = None
+        self.error: BaseException | None = None
+        self.finished_at = 0.0
+
+
+class SingleFlight:
+    def __init__(self, grace: float = GRACE):
+        self.grace = grace
+        self._calls: dict[t.Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        expired = [k for k, c in self._calls.items() if c.done.is_set() and now - c.finished_at > self.grace]
+        for k in expired:
+            del self._calls[k]
+
+    def do(self, key: t.Hashable, fn: t.Callable[[], T],
+           copy: t.Callable[[T], T] | None = None) -> T:
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+            call.finished_at = time.monotonic()
+            with self._lock:
+                if call.error is not None and self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        return copy(call.result) if copy else call.result
+
+    def forget(self, key: t.Hashable | None = None) -> None:
+        """Drop a finished result (or all of them) so the next call runs fresh."""
+        with self._lock:
+            if key is None:
+                self._calls = {k: c for k, c in self._calls.items() if not c.done.is_set()}
+            else:
+                call = self._calls.get(key)
+                if call is not None and call.done.is_set():
+                    del self._calls[key]
@@ -0,0 +1,70 @@
+# features/storage.py
+"""
+Tiny helpers for the on-disk caches the app keeps next to token.pickle.
+
+ENV (optional):
+    PC_CACHE_DIR  -> root folder for local caches (default ".cache")
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import typing as t
+
+CACHE_ROOT = os.getenv("PC_CACHE_DIR", ".cache")
+
+
+def cache_dir(*parts: str) -> str:
+    """Return (and create) a folder under the cache root."""
+    path = os.path.join(CACHE_ROOT, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """Write bytes so readers in other workers never see a half-written file."""
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=folder, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def read_json(path: str, default: t.Any = None) -> t.Any:
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return default
+
+
+def write_json(path: str, obj: t.Any) -> None:
+    blob = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+    atomic_write(path, blob.encode("utf-8"))
+
+
+def prune_dir(folder: str, keep: int, suffix: str = "") -> None:
+    """Drop the oldest files in `folder` so at most `keep` remain."""
+    try:
+        names = [n for n in os.listdir(folder) if n.endswith(suffix) and not n.startswith(".tmp-")]
+    except OSError:
+        return
+    if len(names) <= keep:
+        return
+    paths = [os.path.join(folder, n) for n in names]
+    paths.sort(key=lambda p: os.path.getmtime(p))
+    for p in paths[: len(paths) - keep]:
+        try:
+            os.remove(p)
+        except OSError:
+            pass
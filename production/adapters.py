@@ -1,56 +1,13 @@
+import dataclasses
 import hashlib
 from datetime import datetime, date
 from features.classify import classify
+from features.article import Article
+from features import dedupe
+from features.singleflight import SingleFlight
 
 from sources.messages import authenticate, get_messages, extract_html_from_email
-
-from sources.news.cms_inov import fetch_cms_inov_articles
-from sources.news.cms import fetch_cms_articles
-from sources.news.crs import fetch_crs_articles
-from sources.news.congress import fetch_congress_articles
-from sources.news.fda import fetch_fda_articles
-from sources.news.fed_reg import fetch_federal_register_articles
-from sources.news.hhs import fetch_hhs_articles
-from sources.news.whitehouse import fetch_whitehouse_articles
-from sources.news.omb import fetch_omb_articles
-
-from sources.house.appropriations_maj import fetch_appr_maj_articles
-from sources.house.appropriations_min import fetch_appr_min_articles
-from sources.house.budget_maj import fetch_budg_maj_articles
-from sources.house.budget_min import fetch_budg_min_articles
-from sources.house.education_and_workforce_maj import fetch_eaw_maj_articles
-from sources.house.education_and_workforce_min import fetch_eaw_min_articles
-from sources.house.energy_and_commerce_maj import fetch_eac_maj_articles
-from sources.house.energy_and_commerce_min import fetch_eac_min_articles
-from sources.house.homeland_maj import fetch_home_maj_articles
-from sources.house.homeland_min import fetch_home_min_articles
-from sources.house.joint_economic_maj import fetch_jec_maj_articles
-from sources.house.joint_economic_min import fetch_jec_min_articles
-from sources.house.judiciary_maj import fetch_jud_maj_articles
-from sources.house.judiciary_min import fetch_jud_min_articles
-from sources.house.natural_resources_maj import fetch_natr_maj_articles
-from sources.house.natural_resources_min import fetch_natr_min_articles
-from sources.house.oversight_maj import fetch_ovs_maj_articles
-from sources.house.oversight_min import fetch_ovs_min_articles
-from sources.house.rules_maj import fetch_rul_maj_articles
-from sources.house.rules_min import fetch_rul_min_articles
-from sources.house.small_business_maj import fetch_smb_maj_articles
-from sources.house.small_business_min import fetch_smb_min_articles
-from sources.house.veterans_maj import fetch_vet_maj_articles
-from sources.house.veterans_min import fetch_vet_min_articles
-from sources.house.ways_and_means_maj import fetch_wam_maj_articles
-from sources.house.ways_and_means_min import fetch_wam_min_articles
-
-from sources.senate.aging import fetch_age_articles
-from sources.senate.appropriations import fetch_appr_articles
-from sources.senate.budget import fetch_budg_articles
-from sources.senate.finance import fetch_fin_articles
-from sources.senate.help import fetch_help_articles
-from sources.senate.homeland import fetch_home_articles
-from sources.senate.indian import fetch_ind_articles
-from sources.senate.judiciary import fetch_jud_articles
-from sources.senate.small_business import fetch_smb_articles
-from sources.senate.veterans import fetch_vet_articles
+from sources import registry
 
 
 def fetch_gmail_unread():
@@ -71,163 +28,188 @@ def fetch_gmail_unread():
     return out
 
 
-NEWS = {
-    "CMS": fetch_cms_articles,
-    "CMS Innovation Center": fetch_cms_inov_articles,
-    "CRS": fetch_crs_articles,
-    "Congress": fetch_congress_articles,
-    "FDA": fetch_fda_articles,
-    "Federal Register Public Inspection Desk": fetch_federal_register_articles,
-    "HHS": fetch_hhs_articles,
-    "OMB First Glance Rulemaking": fetch_omb_articles,
-    "White House": fetch_whitehouse_articles,
-}
-
-def _shift_back_one_day(d):
-    try:
-        if isinstance(d, datetime.datetime):
-            return d - datetime.timedelta(days=1)
-        if isinstance(d, datetime.date):
-            return d - datetime.timedelta(days=1)
-        if isinstance(d, str) and d:
-            # try ISO first
-            try:
-                dt = datetime.datetime.fromisoformat(d.replace("Z", "+00:00"))
-                newdatetime = dt - datetime.timedelta(days=1)
-                # preserve datetime vs date-like string
-                if "T" in d or ":" in d:
-                    return newdatetime.isoformat()
-                return newdatetime.date().isoformat()
-            except ValueError:
-                # fallback: YYYY-MM-DD
-                dt = datetime.datetime.strptime(d, "%Y-%m-%d")
-                return (dt.date() - datetime.timedelta(days=1)).isoformat()
-    except Exception:
-        pass
-    return d
+def _dedupe_and_classify(items, known, use_openai: bool) -> None:
+    """
+    Cluster `items` against each other and the already-loaded `known` items,
+    then classify only the cluster representatives; duplicates inherit the
+    representative's suggestion.
+    """
+    reps = dedupe.cluster(items, known)
+    for item in items:
+        rep = reps.get(item.id)
+        if rep is not None:
+            if not rep.suggestion and use_openai:
+                rep.suggestion = classify(rep.title)
+            item.suggestion = item.suggestion or rep.suggestion
+        elif not item.suggestion and use_openai:
+            item.suggestion = classify(item.title)
+
+
+def _payload(results, source):
+    """
+    (value, stale_since) for one source out of registry.fetch_all(); raises if
+    it failed. stale_since is the local "YYYY-MM-DDTHH:MM" of a cached result.
+    """
+    res = results[source.key]
+    if isinstance(res, Exception):
+        raise res
+    if res.stale_since is None:
+        return res.value, None
+    return res.value, datetime.fromtimestamp(res.stale_since).isoformat(timespec="minutes")
+
+
+def _oldest(*stamps):
+    stamps = [s for s in stamps if s]
+    return min(stamps) if stamps else None
+
+
+# identical concurrent bundle loads (double-clicks, two editors) share one run
+_flight = SingleFlight()
+
+
+def _copy_item(item):
+    if isinstance(item, Article):
+        return dataclasses.replace(item)
+    return dict(item) if isinstance(item, dict) else item
+
+
+def _copy_bundle(bundle):
+    """
+    Per-caller copy of a bundle, items included: callers set tag, dup_of and
+    suggestion on the items they store, which must not show up in another
+    caller's load.
+    """
+    return {name: {k: [_copy_item(i) for i in v] if isinstance(v, list) else v for k, v in groups.items()}
+            for name, groups in bundle.items()}
+
+
+def _known_key(known):
+    return hashlib.sha1("|".join(sorted(a.id for a in known)).encode("utf-8")).hexdigest()
+
+
+def _coalesced(kind, build, start_date, use_openai, known):
+    known = list(known)
+    return _flight.do(
+        (kind, start_date, bool(use_openai), _known_key(known)),
+        lambda: build(start_date, use_openai, known),
+        copy=_copy_bundle,
+    )
+
+
+NEWS = registry.news_sources()
 
 def _aid(url: str, source: str) -> str:
     return hashlib.sha1(f"{source}|{url}".encode("utf-8")).hexdigest()[:16]
 
-def fetch_news_bundle(start_date: datetime.date, use_openai: bool = False):
+def fetch_news_bundle(start_date: date, use_openai: bool = False, known=()):
+    return _coalesced("news", _build_news_bundle, start_date, use_openai, known)
+
+def _build_news_bundle(start_date: date, use_openai: bool, known):
     out = {}
-    for name, fetch in NEWS.items():
+    results = registry.fetch_all(NEWS.values(), start_date)
+    for name, source in NEWS.items():
         try:
-            payload = fetch(start_date)
+            payload, stale = _payload(results, source)
             items = []
             for art in payload.get("articles", []):
-                date_val = art.get("date", "")
-                if name == "Congress" and date_val:               
-                    date_val = _shift_back_one_day(date_val)
-                item = {
-                    "id": _aid(art["url"], name),
-                    "title": art["title"],
-                    "url": art["url"],
-                    "date": date_val,
-                    "source": name,
-                }
-                if "suggestion" in art and art["suggestion"]:
-                    item["suggestion"] = art["suggestion"]
-                elif use_openai:
-                    item["suggestion"] = classify(item["title"])
+                item = Article.from_raw(
+                    id=_aid(art["url"], name),
+                    title=art["title"],
+                    url=art["url"],
+                    date=art.get("date", ""),
+                    source=name,
+                    suggestion=art.get("suggestion"),
+                )
+                if name == "Congress":
+                    # Congress.gov lists the latest action a day ahead of when it happened
+                    item = item.shifted(days=-1)
                 items.append(item)
-            out[name] = {"url": payload.get("url", ""), "items": items}
+            out[name] = {"url": payload.get("url", ""), "items": items, "stale_since": stale}
         except Exception:
             continue
+
+    _dedupe_and_classify([a for b in out.values() for a in b["items"]], known, use_openai)
+    for bundle in out.values():
+        bundle["items"] = dedupe.fold(bundle["items"])
     return out
 
 
-HOUSE = {
-    "Appropriations": {"majority": fetch_appr_maj_articles, "minority": fetch_appr_min_articles},
-    "Budget": {"majority": fetch_budg_maj_articles, "minority": fetch_budg_min_articles},
-    "Education and Workforce": {"majority": fetch_eaw_maj_articles, "minority": fetch_eaw_min_articles},
-    "Energy and Commerce (E&C)": {"majority": fetch_eac_maj_articles, "minority": fetch_eac_min_articles},
-    "Homeland Security": {"majority": fetch_home_maj_articles, "minority": fetch_home_min_articles},
-    "Joint Economic": {"majority": fetch_jec_maj_articles, "minority": fetch_jec_min_articles},
-    "Judiciary": {"majority": fetch_jud_maj_articles, "minority": fetch_jud_min_articles},
-    "Natural Resources": {"majority": fetch_natr_maj_articles, "minority": fetch_natr_min_articles},
-    "Oversight": {"majority": fetch_ovs_maj_articles, "minority": fetch_ovs_min_articles},
-    "Rules": {"majority": fetch_rul_maj_articles, "minority": fetch_rul_min_articles},
-    "Small Business": {"majority": fetch_smb_maj_articles, "minority": fetch_smb_min_articles},
-    "Veterans Affairs": {"majority": fetch_vet_maj_articles, "minority": fetch_vet_min_articles},
-    "Ways and Means": {"majority": fetch_wam_maj_articles, "minority": fetch_wam_min_articles},
-}
+HOUSE = registry.house_committees()
 
 def _hid(url: str, committee: str, side: str) -> str:
     return hashlib.sha1(f"{committee}|{side}|{url}".encode("utf-8")).hexdigest()[:16]
 
-def fetch_house_bundle(start_date: datetime.date, use_openai: bool = False):
+def fetch_house_bundle(start_date: date, use_openai: bool = False, known=()):
+    return _coalesced("house", _build_house_bundle, start_date, use_openai, known)
+
+def _build_house_bundle(start_date: date, use_openai: bool, known):
     out = {}
+    results = registry.fetch_all([s for fns in HOUSE.values() for s in fns.values()], start_date)
     for committee, fns in HOUSE.items():
         try:
-            maj = fns["majority"](start_date)
-            mino = fns["minority"](start_date)
+            maj, maj_stale = _payload(results, fns["majority"])
+            mino, min_stale = _payload(results, fns["minority"])
 
             def norm(items, side):
                 res = []
                 for a in items:
-                    item = {
-                        "id": _hid(a["url"], committee, side),
-                        "title": a["title"],
-                        "url": a["url"],
-                        "date": a.get("date", ""),
-                        "committee": committee,
-                        "side": side,
-                    }
-                    if "suggestion" in a and a["suggestion"]:
-                        item["suggestion"] = a["suggestion"]
-                    elif use_openai:
-                        item["suggestion"] = classify(item["title"])
+                    item = Article.from_raw(
+                        id=_hid(a["url"], committee, side),
+                        title=a["title"],
+                        url=a["url"],
+                        date=a.get("date", ""),
+                        committee=committee,
+                        side=side,
+                        suggestion=a.get("suggestion"),
+                    )
                     res.append(item)
                 return res
 
             out[committee] = {
                 "majority": norm(maj, "majority"),
                 "minority": norm(mino, "minority"),
+                "stale_since": _oldest(maj_stale, min_stale),
             }
         except Exception:
             continue
+
+    _dedupe_and_classify(
+        [a for b in out.values() for side in ("majority", "minority") for a in b[side]], known, use_openai
+    )
+    for bundle in out.values():
+        for side in ("majority", "minority"):
+            bundle[side] = dedupe.fold(bundle[side])
     return out
 
 
-SENATE = {
-    "Aging": fetch_age_articles,
-    "Appropriations": fetch_appr_articles,
-    "Budget": fetch_budg_articles,
-    "Finance": fetch_fin_articles,
-    "Health, Education, Labor & Pensions (HELP)": fetch_help_articles,
-    "Homeland Security and Governmental Affairs (Oversight)": fetch_home_articles,
-    "Indian Affairs": fetch_ind_articles,
-    "Judiciary": fetch_jud_articles,
-    "Veterans Affairs": fetch_vet_articles,
-    "Small Business": fetch_smb_articles,
-}
+SENATE = registry.senate_committees()
 
 def _sid(url: str, committee: str, tag: str) -> str:
     return hashlib.sha1(f"{committee}|{tag}|{url}".encode("utf-8")).hexdigest()[:16]
 
-def fetch_senate_bundle(start_date: datetime.date, use_openai: bool = False):
+def fetch_senate_bundle(start_date: date, use_openai: bool = False, known=()):
+    return _coalesced("senate", _build_senate_bundle, start_date, use_openai, known)
+
+def _build_senate_bundle(start_date: date, use_openai: bool, known):
     out = {}
-    for name, fetch in SENATE.items():
+    results = registry.fetch_all(SENATE.values(), start_date)
+    for name, source in SENATE.items():
         try:
-            payload = fetch(start_date)  # {"articles":[{title,url,date,tag?}], "base_url": "..."}
+            payload, stale = _payload(results, source)  # {"articles":[{title,url,date,tag?}], "base_url": "..."}
             base_url = payload.get("base_url", "")
             majority, minority, hearing = [], [], []
 
             for art in payload.get("articles", []):
                 tag = art.get("tag", "")
-                item = {
-                    "id": _sid(art["url"], name, tag or "article"),
-                    "title": art["title"],
-                    "url": art["url"],
-                    "date": art["date"].isoformat() if isinstance(art.get("date"), (date, datetime)) else art.get("date", ""),
-                    "committee": name,
-                    "tag": tag or "article",
-                }
-                if "suggestion" in art and art["suggestion"]:
-                    item["suggestion"] = art["suggestion"]
-                elif use_openai:
-                    item["suggestion"] = classify(item["title"])
+                item = Article.from_raw(
+                    id=_sid(art["url"], name, tag or "article"),
+                    title=art["title"],
+                    url=art["url"],
+                    date=art.get("date", ""),
+                    committee=name,
+                    tag=tag or "article",
+                    suggestion=art.get("suggestion"),
+                )
 
                 if tag == "majority":
                     majority.append(item)
@@ -238,8 +220,30 @@ def fetch_senate_bundle(start_date: datetime.date, use_openai: bool = False):
                 else:
                     majority.append(item)
 
-            out[name] = {"url": base_url, "majority": majority, "minority": minority, "hearing": hearing}
+            out[name] = {"url": base_url, "majority": majority, "minority": minority, "hearing": hearing,
+                         "stale_since": stale}
         except Exception:
             continue
+
+    kinds = ("majority", "minority", "hearing")
+    _dedupe_and_classify([a for b in out.values() for k in kinds for a in b[k]], known, use_openai)
+    for bundle in out.values():
+        for k in kinds:
+            bundle[k] = dedupe.fold(bundle[k])
     return out
 
+
+
+def link_bundles(news, house, senate, use_openai: bool = False):
+    """
+    Cross-source dedupe + classification for bundles fetched side by side
+    (each with use_openai=False and nothing `known`). News comes first, then
+    House, then Senate: the same precedence as loading the pages in order.
+    """
+    groups = ([(b, ("items",)) for b in news.values()]
+              + [(b, ("majority", "minority")) for b in house.values()]
+              + [(b, ("majority", "minority", "hearing")) for b in senate.values()])
+    _dedupe_and_classify([a for b, keys in groups for k in keys for a in b[k]], (), use_openai)
+    for bundle, keys in groups:
+        for k in keys:
+            bundle[k] = dedupe.fold(bundle[k])
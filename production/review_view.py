@@ -0,0 +1,149 @@
+# production/review_view.py
+"""
+Materialized review view for the Categories page.
+
+The session keeps the source of truth (categories_cache["index"] of refs,
+title_overrides, sublinks). Rebuilding the hydrated view from that on every
+request means resolving every ref, copying every item and re-applying
+overrides and sublinks. A ReviewView does that once per build and is then
+updated in place by move / rename / sublink edits.
+
+Views live in process memory (like the *_STORE dicts) under an id kept in the
+session. Each carries the `rev` token of the categories_cache it reflects;
+every mutation writes a new token, so a view that missed an edit (other
+worker, restart) no longer matches and is simply rebuilt from the session.
+"""
+
+from __future__ import annotations
+
+import threading
+import typing as t
+import uuid
+from collections import OrderedDict
+
+from features.article import as_dict
+
+Key = t.Tuple[str, str]           # (source, id)
+
+MAX_VIEWS = 64                    # one per active editing session is plenty
+
+_views: "OrderedDict[str, ReviewView]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def new_rev() -> str:
+    return uuid.uuid4().hex
+
+
+def ref_key(ref: t.Mapping | None) -> Key | None:
+    src = (ref or {}).get("source")
+    rid = (ref or {}).get("id")
+    return (str(src), str(rid)) if src and rid else None
+
+
+class ReviewView:
+    def __init__(self, rev: str, preferred: t.Sequence[str]):
+        self.rev = rev
+        self.preferred = list(preferred)
+        self.items: dict[Key, dict] = {}              # hydrated template dicts
+        self.order: dict[str, list[Key]] = {}         # label -> keys in display order
+        self.where: dict[Key, str] = {}               # key -> label
+
+    @classmethod
+    def build(cls, index: t.Mapping[str, list], resolve: t.Callable[[dict], t.Any],
+              overrides: t.Mapping[str, str], sublinks: t.Mapping[str, list],
+              rev: str, preferred: t.Sequence[str]) -> "ReviewView":
+        view = cls(rev, preferred)
+        for label, refs in index.items():
+            keys = view.order.setdefault(label, [])
+            for ref in refs or []:
+                key = ref_key(ref)
+                resolved = resolve(ref)
+                if not key or not resolved or key in view.items:
+                    continue
+                # copy so we don't mutate store objects when overriding
+                item = as_dict(resolved)
+                item["_ref"] = ref
+                item["_src"] = key[0]
+                skey = f"{key[0]}:{key[1]}"
+                if skey in overrides:
+                    item["title"] = overrides[skey]
+                item["_sublinks"] = list(sublinks.get(skey, []))
+                view.items[key] = item
+                view.where[key] = label
+                keys.append(key)
+        return view
+
+    # ---- Reads -------------------------------------------------------------------
+
+    def _labels(self) -> list[str]:
+        # Events first, then the fixed list; append any extras
+        labels = [lab for lab in self.preferred if lab in self.order]
+        return labels + [lab for lab in self.order if lab not in labels]
+
+    def categories(self) -> "OrderedDict[str, list[dict]]":
+        """Ordered label -> hydrated items for production_review.html."""
+        return OrderedDict(
+            (lab, [self.items[k] for k in self.order[lab]]) for lab in self._labels()
+        )
+
+    def export_categories(self) -> "OrderedDict[str, list[dict]]":
+        """Same view shaped for pdf.html (plain items + "sublinks")."""
+        out: OrderedDict[str, list[dict]] = OrderedDict()
+        for lab in self._labels():
+            rows = []
+            for k in self.order[lab]:
+                item = {f: v for f, v in self.items[k].items() if not f.startswith("_")}
+                item["sublinks"] = list(self.items[k]["_sublinks"])
+                rows.append(item)
+            out[lab] = rows
+        return out
+
+    # ---- Edits (mirror what the routes write to the session) ------------------------
+
+    def move(self, key: Key, to_label: str, new_index: int) -> None:
+        if key not in self.items:
+            return
+        src_keys = self.order.get(self.where.get(key, ""), [])
+        if key in src_keys:
+            src_keys.remove(key)
+        dest = self.order.setdefault(to_label, [])
+        dest.insert(max(0, min(int(new_index), len(dest))), key)
+        self.where[key] = to_label
+
+    def rename(self, key: Key, title: str) -> None:
+        item = self.items.get(key)
+        if item is not None:
+            item["title"] = title
+
+    def set_sublinks(self, key: Key, sublinks: list) -> None:
+        item = self.items.get(key)
+        if item is not None:
+            item["_sublinks"] = list(sublinks)
+
+
+# ---- Registry ------------------------------------------------------------------
+
+def get(view_id: str | None) -> ReviewView | None:
+    if not view_id:
+        return None
+    with _lock:
+        view = _views.get(view_id)
+        if view is not None:
+            _views.move_to_end(view_id)
+        return view
+
+
+def put(view: ReviewView, view_id: str | None = None) -> str:
+    view_id = view_id or uuid.uuid4().hex
+    with _lock:
+        _views[view_id] = view
+        _views.move_to_end(view_id)
+        while len(_views) > MAX_VIEWS:
+            _views.popitem(last=False)
+    return view_id
+
+
+def clear() -> None:
+    with _lock:
+        _views.clear()
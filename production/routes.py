@@ -1,22 +1,30 @@
-from flask import Blueprint, render_template, request, session, redirect, url_for, make_response, jsonify
+from flask import Blueprint, render_template, request, session, redirect, url_for, make_response, jsonify, send_file
 from datetime import datetime, timedelta
+import ast
 import json
 import re
-from weasyprint import HTML
 import hashlib
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from zoneinfo import ZoneInfo
 
 from production.adapters import fetch_gmail_unread
 from production.adapters import fetch_news_bundle
 from production.adapters import fetch_house_bundle
 from production.adapters import fetch_senate_bundle
-from features.categorize import categorize_article, SPECIAL_CALENDAR, CATEGORIES
+from production.adapters import link_bundles
+from features.categorize import categorize_article, merge_index, SPECIAL_CALENDAR, CATEGORIES
+from features import pdf_export
+from features.article import as_dict
+from production import review_view
+from sources import http, planner, registry, strategy
 
 from features.calendar import (
-    fetch_hearing_html,
-    extract_event_info,
+    extract_hearing_details,
     create_event_addevent,
+    find_existing_event,
 )
+from features.calendar_pull import search_events_between, LOCAL_TZ, _ensure_aware_local
 
 production = Blueprint("production", __name__, template_folder="templates")
 
@@ -25,6 +33,11 @@ NEWS_STORE = {}
 HOUSE_STORE = {}
 SENATE_STORE = {}
 
+# "Add all hearings": page fetch/extract fan-out, AddEvent create fan-out, dedupe window
+BULK_EXTRACT_WORKERS = 6
+BULK_CREATE_WORKERS = 3
+BULK_DEDUPE_WINDOW_HOURS = 3
+
 def _ensure_session_bucket():
     if "curation" not in session:
         session["curation"] = {"gmail": [], "news": [], "house": [], "senate": []}
@@ -62,6 +75,7 @@ def _reset_all():
     NEWS_STORE.clear()
     HOUSE_STORE.clear()
     SENATE_STORE.clear()
+    review_view.clear()
 
 def _signature(items):
     """
@@ -74,12 +88,87 @@ def _signature(items):
     blob = "\n".join(sorted(parts))
     return hashlib.sha1(blob.encode("utf-8")).hexdigest()
 
+def _loaded_elsewhere(*stores):
+    """Items already loaded in other stores, for cross-source dedupe."""
+    return [item for store in stores for item in store.values()]
+
+def _store_gmail(emails):
+    for e in emails:
+        GMAIL_STORE[e["id"]] = e
+    session["gmail_cache_ids"] = [e["id"] for e in emails]
+    session.modified = True
+
+def _store_news(bundle, input_date, use_openai):
+    """Put a news bundle in NEWS_STORE and session["news_cache"]; returns the per-source meta."""
+    sources = {}
+    for name, meta in bundle.items():
+        ids = []
+        for item in meta["items"]:
+            NEWS_STORE[item.id] = item
+            ids.append(item.id)
+        sources[name] = {"url": meta["url"], "ids": ids, "stale_since": meta.get("stale_since")}
+
+    session["news_cache"] = {"sources": sources, "input_date": input_date, "use_openai": use_openai}
+    session["news_ready"] = True
+    session.modified = True
+    return sources
+
+def _store_house(bundle, input_date, use_openai):
+    """Put a House bundle in HOUSE_STORE and session["house_cache"]; returns the per-committee meta."""
+    committees_meta = {}
+    for name, groups in bundle.items():
+        maj_ids, min_ids = [], []
+        for item in groups["majority"]:
+            HOUSE_STORE[item.id] = item
+            maj_ids.append(item.id)
+        for item in groups["minority"]:
+            HOUSE_STORE[item.id] = item
+            min_ids.append(item.id)
+        committees_meta[name] = {"majority": maj_ids, "minority": min_ids,
+                                 "stale_since": groups.get("stale_since")}
+
+    session["house_cache"] = {"committees": committees_meta, "input_date": input_date, "use_openai": use_openai}
+    session["house_ready"] = True
+    session.modified = True
+    return committees_meta
+
+def _store_senate(bundle, input_date, use_openai):
+    """Put a Senate bundle in SENATE_STORE and session["senate_cache"]; returns the per-committee meta."""
+    committees_meta = {}
+    for name, groups in bundle.items():
+        url = groups.get("url", "")
+        maj_ids, min_ids, hear_ids = [], [], []
+        for item in groups.get("majority", []):
+            item.tag = "majority"
+            SENATE_STORE[item.id] = item
+            maj_ids.append(item.id)
+
+        for item in groups.get("minority", []):
+            item.tag = "minority"
+            SENATE_STORE[item.id] = item
+            min_ids.append(item.id)
+
+        for item in groups.get("hearing", []):
+            item.tag = "hearing"
+            SENATE_STORE[item.id] = item
+            hear_ids.append(item.id)
+        committees_meta[name] = {"url": url, "majority": maj_ids, "minority": min_ids, "hearing": hear_ids,
+                                 "stale_since": groups.get("stale_since")}
+
+    session["senate_cache"] = {"committees": committees_meta, "input_date": input_date, "use_openai": use_openai}
+    session["senate_ready"] = True
+    session.modified = True
+    return committees_meta
+
 def _ref(item, source: str):
     """Create a tiny reference for session storage."""
     return {"id": item.get("id"), "source": source}
 
-def _resolve_ref(ref, cur):
-    """Turn a stored ref back into a full item (or None)."""
+def _resolve_ref(ref, cur, gmail_by_id=None):
+    """
+    Turn a stored ref back into a full item (or None).
+    Pass `gmail_by_id` when resolving many refs to skip the per-ref Gmail scan.
+    """
     rid = (ref or {}).get("id")
     src = (ref or {}).get("source")
     if not rid or not src:
@@ -93,6 +182,8 @@ def _resolve_ref(ref, cur):
         return SENATE_STORE.get(rid)
     if src == "gmail":
         # Gmail items are only manual and live inside session["curation"]["gmail"]
+        if gmail_by_id is not None:
+            return gmail_by_id.get(rid)
         for g in (cur.get("gmail") or []):
             if g.get("id") == rid:
                 return g
@@ -108,9 +199,14 @@ def _has_time_component(ts: str) -> bool:
     # Look for 'T' followed by HH:MM (allow more after, e.g., seconds or TZ)
     return bool(re.search(r"T\d{2}:\d{2}", ts))
 
+def _default_start_date():
+    return (datetime.today() - timedelta(days=3)).strftime("%Y-%m-%d")
+
+
 @production.get("/start")
 def production_start():
-    return render_template("production_start.html")
+    return render_template("production_start.html", input_date=_default_start_date(), use_openai=False,
+                           loaded=None, error=None)
 
 
 @production.post("/start")
@@ -121,9 +217,86 @@ def production_start_action():
     if action == "reset":
         _reset_all()
         return redirect(url_for("production.production_start"))
+    if action == "load_all":
+        return _load_all()
     return redirect(url_for("production.production_start"))
 
 
+@production.get("/diagnostics")
+def production_diagnostics():
+    """Per-source refresh plan: learned publish rate, TTL and how stale the cached result is."""
+    rows = planner.report(registry.SOURCES, registry.cached_at)
+    for row, s in zip(rows, registry.SOURCES):
+        row["strategy"] = strategy.last(s.key) or s.mode
+        row["healthy"] = http.is_healthy(s.host)
+    return render_template("production_diagnostics.html", rows=rows, planner_on=planner.ENABLED)
+
+
+@production.post("/diagnostics")
+def production_diagnostics_action():
+    if request.form.get("action") == "clear":
+        registry.clear_cache()
+    return redirect(url_for("production.production_diagnostics"))
+
+
+def _load_all():
+    """
+    Fetch Gmail, News, House and Senate at once for one date window and fill
+    every store and session cache, so the wizard pages open already loaded.
+    Wall time is the slowest stage; a failing stage is reported and its page
+    can still be loaded by hand.
+    """
+    _ensure_session_bucket()
+    input_date = (request.form.get("start_date") or "").strip()
+    use_openai = "use_openai" in request.form
+    try:
+        start_date = datetime.strptime(input_date, "%Y-%m-%d").date()
+    except ValueError:
+        return render_template("production_start.html", input_date=input_date or _default_start_date(),
+                               use_openai=use_openai, loaded=None, error="Invalid date.")
+
+    # classification waits until everything is in, so duplicates across
+    # chambers are clustered first and only representatives are classified
+    stages = {
+        "gmail": lambda: fetch_gmail_unread(),
+        "news": lambda: fetch_news_bundle(start_date),
+        "house": lambda: fetch_house_bundle(start_date),
+        "senate": lambda: fetch_senate_bundle(start_date),
+    }
+    with ThreadPoolExecutor(max_workers=len(stages)) as pool:
+        futures = {name: pool.submit(fn) for name, fn in stages.items()}
+    results, errors = {}, {}
+    for name, fut in futures.items():
+        try:
+            results[name] = fut.result()
+        except Exception as e:
+            errors[name] = str(e) or type(e).__name__
+
+    link_bundles(results.get("news", {}), results.get("house", {}), results.get("senate", {}), use_openai)
+
+    loaded = {}
+    if "gmail" in results:
+        _store_gmail(results["gmail"])
+        loaded["Gmail"] = len(results["gmail"])
+    if "news" in results:
+        meta = _store_news(results["news"], input_date, use_openai)
+        loaded["News"] = sum(len(m["ids"]) for m in meta.values())
+    if "house" in results:
+        meta = _store_house(results["house"], input_date, use_openai)
+        loaded["House"] = sum(len(m["majority"]) + len(m["minority"]) for m in meta.values())
+    if "senate" in results:
+        meta = _store_senate(results["senate"], input_date, use_openai)
+        loaded["Senate"] = sum(len(m["majority"]) + len(m["minority"]) + len(m["hearing"]) for m in meta.values())
+
+    # selections are kept; the category index is rebuilt from them on the next categorize
+    session["categorize_ready"] = False
+    session.modified = True
+
+    error = "; ".join(f"{name.title()}: {msg}" for name, msg in errors.items()) or None
+    return render_template("production_start.html", input_date=input_date, use_openai=use_openai,
+                           loaded=loaded, error=error)
+
+
 @production.get("/gmail")
 def production_gmail():
     _ensure_session_bucket()
@@ -162,9 +335,7 @@ def production_select_gmail():
     if action == "load":
         try:
             emails = fetch_gmail_unread()
-            for e in emails:
-                GMAIL_STORE[e["id"]] = e
-            session["gmail_cache_ids"] = [e["id"] for e in emails]
+            _store_gmail(emails)
             # only when reloading Gmail do we invalidate downstream News
             session["news_ready"] = False
             session.modified = True
@@ -239,8 +410,8 @@ def production_select_gmail():
     session["curation"]["gmail"] = manuals
     session.modified = True
 
+    # categories_cache is kept: the next categorize carries its labels and moves forward
     session["categorize_ready"] = False
-    session["categories_cache"] = None
     session.modified = True
 
     return redirect(url_for("production.production_news"))
@@ -262,7 +433,7 @@ def production_news():
         for name, meta in cache.get("sources", {}).items():
             ids = meta.get("ids", [])
             items = [NEWS_STORE[i] for i in ids if i in NEWS_STORE]
-            articles[name] = {"url": meta.get("url", ""), "items": items}
+            articles[name] = {"url": meta.get("url", ""), "items": items, "stale_since": meta.get("stale_since")}
 
     prechecked = {a["id"] for a in session["curation"].get("news", []) if not a.get("manual")}
     manual_rows = session.get("news_manual_drafts") or [{}]
@@ -305,20 +476,11 @@ def production_select_news():
                 manual_rows=session.get("news_manual_drafts") or [{}],
             )
 
-        bundle = fetch_news_bundle(start_date, use_openai)
-        sources = {}
-        for name, meta in bundle.items():
-            ids = []
-            for item in meta["items"]:
-                NEWS_STORE[item["id"]] = item
-                ids.append(item["id"])
-            sources[name] = {"url": meta["url"], "ids": ids}
-
-        session["news_cache"] = {"sources": sources, "input_date": input_date, "use_openai": use_openai}
-        session["news_ready"] = True
-        session.modified = True
+        bundle = fetch_news_bundle(start_date, use_openai, known=_loaded_elsewhere(HOUSE_STORE, SENATE_STORE))
+        sources = _store_news(bundle, input_date, use_openai)
 
-        articles = {name: {"url": m["url"], "items": [NEWS_STORE[i] for i in m["ids"] if i in NEWS_STORE]}
+        articles = {name: {"url": m["url"], "items": [NEWS_STORE[i] for i in m["ids"] if i in NEWS_STORE],
+                           "stale_since": m["stale_since"]}
                     for name, m in sources.items()}
         prechecked = {a["id"] for a in session["curation"].get("news", []) if not a.get("manual")}
         manual_rows = session.get("news_manual_drafts") or [{}]
@@ -363,8 +525,8 @@ def production_select_news():
     )
     session.modified = True
 
+    # categories_cache is kept: the next categorize carries its labels and moves forward
     session["categorize_ready"] = False
-    session["categories_cache"] = None
     session.modified = True
 
     if action == "back":
@@ -394,7 +556,7 @@ def production_house():
             mino = [HOUSE_STORE[i] for i in min_ids if i in HOUSE_STORE]
             if maj or mino:
                 any_items = True
-            built[name] = {"majority": maj, "minority": mino}
+            built[name] = {"majority": maj, "minority": mino, "stale_since": meta.get("stale_since")}
 
         committees = built if any_items else None
 
@@ -439,21 +601,8 @@ def production_select_house():
                 manual_rows=session.get("house_manual_drafts") or [{}],
             )
 
-        bundle = fetch_house_bundle(start_date, use_openai)
-
-        committees_meta = {}
-        for name, groups in bundle.items():
-            maj_ids, min_ids = [], []
-            for item in groups["majority"]:
-                HOUSE_STORE[item["id"]] = item
-                maj_ids.append(item["id"])
-            for item in groups["minority"]:
-                HOUSE_STORE[item["id"]] = item
-                min_ids.append(item["id"])
-            committees_meta[name] = {"majority": maj_ids, "minority": min_ids}
-
-        session["house_cache"] = {"committees": committees_meta, "input_date": input_date, "use_openai": use_openai}
-        session["house_ready"] = True
+        bundle = fetch_house_bundle(start_date, use_openai, known=_loaded_elsewhere(NEWS_STORE, SENATE_STORE))
+        committees_meta = _store_house(bundle, input_date, use_openai)
         # only when House is reloaded do we invalidate downstream Senate
         session["senate_ready"] = False
         session.modified = True
@@ -463,6 +612,7 @@ def production_select_house():
             committees[name] = {
                 "majority": [HOUSE_STORE[i] for i in meta["majority"] if i in HOUSE_STORE],
                 "minority": [HOUSE_STORE[i] for i in meta["minority"] if i in HOUSE_STORE],
+                "stale_since": meta["stale_since"],
             }
 
         prechecked = {a["id"] for a in session["curation"].get("house", []) if not a.get("manual")}
@@ -509,8 +659,8 @@ def production_select_house():
     )
     session.modified = True
 
+    # categories_cache is kept: the next categorize carries its labels and moves forward
     session["categorize_ready"] = False
-    session["categories_cache"] = None
     session.modified = True
 
     if action == "back":
@@ -542,7 +692,8 @@ def production_senate():
             hear = [SENATE_STORE[i] for i in hear_ids if i in SENATE_STORE]
             if maj or mino or hear:
                 any_items = True
-            built[name] = {"url": url, "majority": maj, "minority": mino, "hearing": hear}
+            built[name] = {"url": url, "majority": maj, "minority": mino, "hearing": hear,
+                           "stale_since": meta.get("stale_since")}
         committees = built if any_items else None
 
     prechecked = {a["id"] for a in session["curation"].get("senate", []) if not a.get("manual")}
@@ -586,31 +737,8 @@ def production_select_senate():
                 manual_rows=session.get("senate_manual_drafts") or [{}],
             )
 
-        bundle = fetch_senate_bundle(start_date, use_openai)
-
-        committees_meta = {}
-        for name, groups in bundle.items():
-            url = groups.get("url", "")
-            maj_ids, min_ids, hear_ids = [], [], []
-            for item in groups.get("majority", []):
-                item["tag"] = "majority"
-                SENATE_STORE[item["id"]] = item
-                maj_ids.append(item["id"])
-
-            for item in groups.get("minority", []):
-                item["tag"] = "minority"
-                SENATE_STORE[item["id"]] = item
-                min_ids.append(item["id"])
-
-            for item in groups.get("hearing", []):
-                item["tag"] = "hearing"
-                SENATE_STORE[item["id"]] = item
-                hear_ids.append(item["id"])
-            committees_meta[name] = {"url": url, "majority": maj_ids, "minority": min_ids, "hearing": hear_ids}
-
-        session["senate_cache"] = {"committees": committees_meta, "input_date": input_date, "use_openai": use_openai}
-        session["senate_ready"] = True
-        session.modified = True
+        bundle = fetch_senate_bundle(start_date, use_openai, known=_loaded_elsewhere(NEWS_STORE, HOUSE_STORE))
+        committees_meta = _store_senate(bundle, input_date, use_openai)
 
         committees = {}
         for name, meta in committees_meta.items():
@@ -619,6 +747,7 @@ def production_select_senate():
                 "majority": [SENATE_STORE[i] for i in meta["majority"] if i in SENATE_STORE],
                 "minority": [SENATE_STORE[i] for i in meta["minority"] if i in SENATE_STORE],
                 "hearing":  [SENATE_STORE[i] for i in meta["hearing"] if i in SENATE_STORE],
+                "stale_since": meta["stale_since"],
             }
 
         prechecked = {a["id"] for a in session["curation"].get("senate", []) if not a.get("manual")}
@@ -664,8 +793,8 @@ def production_select_senate():
     )
     session.modified = True
 
+    # categories_cache is kept: the next categorize carries its labels and moves forward
     session["categorize_ready"] = False
-    session["categories_cache"] = None
     session.modified = True
 
     if action == "back":
@@ -729,102 +858,184 @@ def production_build_categories():
         session.modified = True
         return redirect(url_for("production.production_review"))
 
-    # …(existing code that builds `categories` via categorize_article)…
-
-    # Build categories index (label -> list[ref])
-    categories_index = {
-        SPECIAL_CALENDAR: [],
-        "Congress and the Administration": [],
-        "Health Insurance": [],
-        "Health Tech": [],
-        "Medicaid": [],
-        "Medicare": [],
-        "Pharmaceuticals and Medical Devices": [],
-        "Quality and Innovation": [],
-    }
+    # Only items that aren't filed yet get classified; the rest keep their
+    # label and position (including manual moves), and deselected ones drop out.
+    def classify(a):
+        return categorize_article(a.get("title", ""), is_hearing=_has_time_component(a.get("date", "")))
+
+    categories_index, _ = merge_index(
+        cache.get("index"),
+        [(_ref(a, a.get("source")), a) for a in all_items],
+        key=review_view.ref_key,
+        classify=classify,
+        labels=[SPECIAL_CALENDAR, *CATEGORIES],
+    )
 
-    for a in all_items:
-        is_hearing = _has_time_component(a.get("date", ""))
-        label = categorize_article(a.get("title", ""), is_hearing=is_hearing)
-        if label not in categories_index:
-            label = "Quality and Innovation"
-        categories_index[label].append(_ref(a, a.get("source")))
-        
     session["categories_cache"] = {
         "built_at": datetime.now().isoformat(),
         "sig": current_sig,
         "count": len(all_items),
         "index": categories_index,   # << store refs only
+        "rev": review_view.new_rev(),
     }
     session["categorize_ready"] = True
     session.modified = True
     return redirect(url_for("production.production_review"))
 
 
-@production.get("/review")
-def production_review():
-    _ensure_session_bucket()
+def _review_view():
+    """
+    The materialized review view for this session, rebuilt from the session
+    only when it is missing or its rev doesn't match categories_cache.
+    """
     cache = session.get("categories_cache")
-
     if not isinstance(cache, dict) or "index" not in cache:
-        return redirect(url_for("production.production_categorize"))
+        return None
+
+    rev = cache.get("rev") or ""
+    view = review_view.get(session.get("review_view_id"))
+    if view is not None and rev and view.rev == rev:
+        return view
+
+    if not rev:
+        rev = cache["rev"] = review_view.new_rev()
+        session["categories_cache"] = cache
+        session.modified = True
 
     cur = session.get("curation", {})
-    index = cache.get("index") or {}
-    overrides = session.get("title_overrides") or {}
-    sublinks_map = session.get("sublinks") or {}  # <-- NEW: sublinks storage
-
-    # Hydrate
-    hydrated = {}
-    for label, refs in index.items():
-        items = []
-        for ref in refs or []:
-            resolved = _resolve_ref(ref, cur)
-            if not resolved:
-                continue
+    gmail_by_id = {g.get("id"): g for g in (cur.get("gmail") or [])}
+    view = review_view.ReviewView.build(
+        cache.get("index") or {},
+        lambda ref: _resolve_ref(ref, cur, gmail_by_id),
+        session.get("title_overrides") or {},
+        session.get("sublinks") or {},
+        rev=rev,
+        preferred=[SPECIAL_CALENDAR, *CATEGORIES],
+    )
+    session["review_view_id"] = review_view.put(view, session.get("review_view_id"))
+    session.modified = True
+    return view
+
+
+def _bump_review(apply=None):
+    """
+    Record an edit: new rev on categories_cache, and apply the same edit to
+    the live view if it was current (otherwise it rebuilds on next read).
+    """
+    cache = session.get("categories_cache")
+    if not isinstance(cache, dict) or "index" not in cache:
+        return
+    old_rev = cache.get("rev")
+    cache["rev"] = review_view.new_rev()
+    session["categories_cache"] = cache
+    session.modified = True
+
+    view = review_view.get(session.get("review_view_id"))
+    if view is not None and old_rev and view.rev == old_rev:
+        if apply is not None:
+            apply(view)
+        view.rev = cache["rev"]
 
-            # copy so we don't mutate store objects when overriding
-            item = dict(resolved) if isinstance(resolved, dict) else dict(resolved)
-            item["_ref"] = ref
-            src = (ref or {}).get("source")
-            rid = item.get("id")
-            item["_src"] = src  # <-- NEW: keep source handy for the template/JS
-
-            # apply title override if present (keyed by "source:id")
-            if src and rid:
-                key = f"{src}:{rid}"
-                if key in overrides:
-                    item["title"] = overrides[key]
-                # attach sublinks for UI (list of {"heading","url"})
-                item["_sublinks"] = list(sublinks_map.get(key, []))  # <-- NEW
-
-            items.append(item)
-        hydrated[label] = items
-
-    # ---- Reorder just-in-time (no session changes, no template changes) ----
-    preferred = [SPECIAL_CALENDAR, *CATEGORIES]  # Events first, then your fixed list
-    ordered = OrderedDict((lab, hydrated.get(lab, [])) for lab in preferred if lab in hydrated)
-    # append any unexpected categories at the end (robust to future additions)
-    for lab, items in hydrated.items():
-        if lab not in ordered:
-            ordered[lab] = items
 
+@production.get("/review")
+def production_review():
+    _ensure_session_bucket()
+    view = _review_view()
+    if view is None or not session.get("categorize_ready"):
+        # the selection changed since the last build: categorize merges it in first
+        return redirect(url_for("production.production_categorize"))
+
+    cache = session.get("categories_cache") or {}
     return render_template(
         "production_review.html",
-        categories=ordered,
+        categories=view.categories(),
         built_at=cache.get("built_at"),
+        special_calendar=SPECIAL_CALENDAR,
     )
 
 
+def _move_index(op):
+    """An op's new_index as a non-negative int (missing -> 0), or None if it isn't one."""
+    raw = op.get("new_index")
+    if raw is None:
+        return 0
+    if isinstance(raw, bool) or not isinstance(raw, (int, float, str)):
+        return None
+    try:
+        value = int(raw)
+    except (ValueError, OverflowError):
+        return None
+    if value < 0 or (isinstance(raw, float) and value != raw):
+        return None
+    return value
+
+
+def _apply_moves(ops):
+    """
+    Apply [{source, id, to_category, new_index}, ...] in order.
+
+    Lookups go through the review view's position index (key -> category),
+    and only the categories that actually changed are rewritten in
+    session["categories_cache"]["index"] (once per batch, not per drag).
+    Returns (applied, missing, invalid): ops whose article isn't in the view
+    are missing, ops with a bad to_category or new_index are invalid; both
+    are skipped and the rest still applied.
+    """
+    cache = session.get("categories_cache")
+    view = _review_view()
+    if view is None:
+        return 0, list(ops), []
+
+    index = cache.get("index") or {}
+    touched = set()
+    applied, missing, invalid = 0, [], []
+    for op in ops:
+        to_cat = op.get("to_category")
+        new_index = _move_index(op)
+        if not isinstance(to_cat, str) or not to_cat or new_index is None:
+            invalid.append(op)
+            continue
+        key = (str(op.get("source") or ""), str(op.get("id") or ""))
+        from_cat = view.where.get(key)
+        if from_cat is None:
+            missing.append(op)
+            continue
+        view.move(key, to_cat, new_index)
+        touched.update((from_cat, to_cat))
+        applied += 1
+
+    if applied:
+        for label in touched:
+            # refs the view couldn't resolve stay put, after the visible ones
+            keep = [r for r in index.get(label) or [] if review_view.ref_key(r) not in view.items]
+            index[label] = [view.items[k]["_ref"] for k in view.order.get(label, [])] + keep
+        cache["index"] = index
+        cache["built_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        cache["rev"] = view.rev = review_view.new_rev()
+        session["categories_cache"] = cache
+        session.modified = True
+    return applied, missing, invalid
+
+
+def _legacy_move_key(art_id: str, payload: dict):
+    """Old clients post data-id, i.e. the ref dict rendered as a string."""
+    if payload.get("source"):
+        return str(payload["source"]), art_id
+    try:
+        ref = ast.literal_eval(art_id)
+    except (ValueError, SyntaxError):
+        return None
+    return review_view.ref_key(ref) if isinstance(ref, dict) else None
+
+
 @production.post("/move-article")
 def production_move_article():
     """
-    Body: { id: str, from_category: str|None, to_category: str, new_index: int }
-    Mutates session['categories_cache']['index'] so export sees the new order/category.
+    Body: { id: str, source?: str, from_category: str|None, to_category: str, new_index: int }
+    Single move; kept for old pages. New pages batch through /move-articles.
     """
     payload = request.get_json(silent=True) or {}
     art_id = (payload.get("id") or "").strip()
-    from_cat = payload.get("from_category")
     to_cat = payload.get("to_category")
     new_index = payload.get("new_index")
 
@@ -836,47 +1047,40 @@ def production_move_article():
     if not isinstance(cache, dict) or "index" not in cache:
         return jsonify(ok=False, error="No category index in session"), 400
 
-    index = cache.get("index") or {}
-    # Ensure destination exists
-    dest_list = index.setdefault(to_cat, [])
-
-    # 1) Find which string we’re storing in `index` for this article.
-    #    Your index stores "refs" (keys used by _resolve_ref). Sometimes `id == ref`,
-    #    but to be safe, try to locate by either:
-    def _remove_first_match():
-        # try exact matches (id == ref)
-        for cat, lst in index.items():
-            for i, ref in enumerate(lst or []):
-                if str(ref) == str(art_id):
-                    return cat, lst.pop(i), i
-        # if your hydrated items use a separate key, add a resolver here
-        return None, None, None
-
-    # Remove from source (if provided), else search globally
-    removed_from, ref_value, old_pos = None, None, None
-    if from_cat in index:
-        lst = index[from_cat] or []
-        for i, ref in enumerate(lst):
-            if str(ref) == str(art_id):
-                removed_from, ref_value, old_pos = from_cat, lst.pop(i), i
-                break
-    if ref_value is None:
-        removed_from, ref_value, old_pos = _remove_first_match()
-
-    if ref_value is None:
+    key = _legacy_move_key(art_id, payload)
+    if key is None:
         return jsonify(ok=False, error="Article not found in index"), 404
 
-    # 2) Insert into destination at requested position (clamped)
-    insert_at = max(0, min(int(new_index), len(dest_list)))
-    dest_list.insert(insert_at, ref_value)
+    applied, _missing, invalid = _apply_moves([
+        {"source": key[0], "id": key[1], "to_category": to_cat, "new_index": new_index}
+    ])
+    if invalid:
+        return jsonify(ok=False, error="Invalid to_category/new_index"), 400
+    if not applied:
+        return jsonify(ok=False, error="Article not found in index"), 404
+    return jsonify(ok=True)
 
-    # 3) Persist & optionally bump the built_at to reflect edits
-    cache["index"] = index
-    cache["built_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    session["categories_cache"] = cache
-    session.modified = True
 
-    return jsonify(ok=True)
+@production.post("/move-articles")
+def production_move_articles():
+    """
+    Body: { ops: [ { source, id, to_category, new_index }, ... ] }
+    Applied in order (same order the drags happened in the browser). Ops
+    that can't be applied are skipped and listed back as `missing` (article
+    not in the view) or `invalid` (bad to_category / new_index).
+    """
+    payload = request.get_json(silent=True) or {}
+    ops = [op for op in (payload.get("ops") or []) if isinstance(op, dict)]
+    if not ops:
+        return jsonify(ok=False, error="No ops"), 400
+
+    _ensure_session_bucket()
+    cache = session.get("categories_cache")
+    if not isinstance(cache, dict) or "index" not in cache:
+        return jsonify(ok=False, error="No category index in session"), 400
+
+    applied, missing, invalid = _apply_moves(ops)
+    return jsonify(ok=not (missing or invalid), applied=applied, missing=missing, invalid=invalid)
 
 
 @production.post("/rename-article")
@@ -894,6 +1098,7 @@ def production_rename_article():
     overrides[f"{src}:{rid}"] = title
     session["title_overrides"] = overrides
     session.modified = True
+    _bump_review(lambda v: v.rename((src, rid), title))
     return jsonify(ok=True)
 
 
@@ -902,52 +1107,36 @@ def production_export_categories_pdf():
     _ensure_session_bucket()
     cache = session.get("categories_cache") or {}
     index = cache.get("index")
-    if not index:
+    if not index or not session.get("categorize_ready"):
         return redirect(url_for("production.production_categorize"))
 
-    cur = session.get("curation", {})
-    overrides    = session.get("title_overrides") or {}   # renamed titles
-    sublinks_map = session.get("sublinks") or {}          # { "source:id": [ {heading,url}, ... ] }
-
-    # Hydrate with overrides + sublinks
-    hydrated = {}
-    for label, refs in index.items():
-        items = []
-        for ref in refs or []:
-            resolved = _resolve_ref(ref, cur)
-            if not resolved:
-                continue
-
-            item = dict(resolved) if isinstance(resolved, dict) else dict(resolved)
-            src = (ref or {}).get("source")
-            rid = item.get("id")
-            if src and rid:
-                key = f"{src}:{rid}"
-                if key in overrides:
-                    item["title"] = overrides[key]
-                item["sublinks"] = list(sublinks_map.get(key, []))
-            items.append(item)
-        hydrated[label] = items
-
-    # ---- Order categories: Events first, then fixed list; append any extras
-    preferred = [SPECIAL_CALENDAR, *CATEGORIES]
-    ordered = OrderedDict((lab, hydrated.get(lab, [])) for lab in preferred if lab in hydrated)
-    for lab, items in hydrated.items():
-        if lab not in ordered:
-            ordered[lab] = items
-
-    html = render_template(
-        "pdf.html",
-        generated_at=datetime.now(),
-        categories=ordered,   # pass ordered mapping to the template
-    )
+    # Hydrated, ordered (Events first) with overrides + sublinks applied
+    ordered = _review_view().export_categories()
+
+    # Same payload + same template -> same PDF; only render on a miss
+    key = pdf_export.payload_key(ordered, "pdf.html", extra=request.root_url)
+    path = pdf_export.cached_pdf(key)
+    if not path:
+        html = render_template(
+            "pdf.html",
+            generated_at=datetime.now(),
+            categories=ordered,   # pass ordered mapping to the template
+        )
+        path = pdf_export.render(key, html, base_url=request.root_url)
+    if not path:
+        # still rendering in the pool; the page refreshes back here
+        return render_template(
+            "pdf_pending.html",
+            back_href=url_for("production.production_review"),
+        ), 202
 
-    pdf_bytes = HTML(string=html, base_url=request.root_url).write_pdf()
     stamp = datetime.now().strftime("%m/%d")
-    resp = make_response(pdf_bytes)
-    resp.headers["Content-Type"] = "application/pdf"
-    resp.headers["Content-Disposition"] = f'attachment; filename="PolicyCrush_Categories_{stamp}.pdf"'
-    return resp
+    return send_file(
+        path,
+        mimetype="application/pdf",
+        as_attachment=True,
+        download_name=f"PolicyCrush_Categories_{stamp}.pdf",
+    )
 
 
 @production.post("/sublink/add")
@@ -973,6 +1162,7 @@ def production_sublink_add():
     sl[key] = lst
     session["sublinks"] = sl
     session.modified = True
+    _bump_review(lambda v: v.set_sublinks((src, rid), lst))
     return jsonify(ok=True, sublinks=lst)
 
 
@@ -999,9 +1189,52 @@ def production_sublink_remove():
     sl[key] = lst
     session["sublinks"] = sl
     session.modified = True
+    _bump_review(lambda v: v.set_sublinks((src, rid), lst))
     return jsonify(ok=True, sublinks=lst)
 
 
+def _effective_title(info: dict, src: str, rid: str, override_title: str = "") -> str:
+    """Pick the best title: edited > session override > extracted."""
+    effective_title = (override_title or "").strip()
+
+    if not effective_title and src and rid:
+        # honor server-side rename overrides saved earlier
+        overrides = session.get("title_overrides") or {}
+        key = f"{src}:{rid}"
+        if key in overrides:
+            effective_title = (overrides[key] or "").strip()
+
+    if not effective_title:
+        effective_title = info.get("title") or ""
+    return effective_title
+
+
+def _addevent_idem_key(url: str, dt_start: datetime) -> str:
+    """Key on URL + exact start minute so retries/double-clicks don't duplicate."""
+    idem_key_src = f"{url}|{dt_start.isoformat(timespec='minutes')}"
+    return hashlib.sha1(idem_key_src.encode("utf-8")).hexdigest()
+
+
+def _addevent_payload(url: str, info: dict, title: str, dt_start: datetime, minutes: int, tz: str) -> dict:
+    """AddEvent create payload (keep your prefix behavior if desired)."""
+    dt_end = dt_start + timedelta(minutes=minutes)
+    return {
+        "title": "[AUTO-TEST]" + title,   # preserve your prefix
+        "datetime_start": dt_start.strftime("%Y-%m-%d %H:%M"),
+        "datetime_end": dt_end.strftime("%Y-%m-%d %H:%M"),
+        "location": info.get("location") or "",
+        "description": url,                         # keep the source link for traceability
+        "timezone": tz,
+    }
+
+
+def _addevent_ids(res: dict) -> tuple:
+    """Normalize (event_id, event_url) from an AddEvent create/dedupe response."""
+    event_id = res.get("id") or res.get("event", {}).get("id")
+    event_url = res.get("url") or res.get("event", {}).get("url") or res.get("link")
+    return event_id, event_url
+
+
 @production.post("/addevent")
 def production_addevent():
     """Create an AddEvent calendar entry for a hearing URL, idempotent by URL+start."""
@@ -1019,32 +1252,17 @@ def production_addevent():
         return jsonify({"ok": False, "error": "Missing 'url'."}), 400
 
     try:
-        # 1) scrape + extract
-        page_text = fetch_hearing_html(url)
-        info_raw = extract_event_info(page_text)  # JSON string from your model
-        info = json.loads(info_raw)
+        # 1) scrape + extract (structured markup first, LLM only for unknown layouts)
+        info = extract_hearing_details(url)
 
         # 2) combine date + time
         dt_start = datetime.strptime(f"{info['date']} {info['time']}", "%Y-%m-%d %H:%M")
-        dt_end = dt_start + timedelta(minutes=default_minutes)
 
         # 3) pick the best title: edited > session override > extracted
-        effective_title = (override_title or "").strip()
-
-        if not effective_title and src and rid:
-            # honor server-side rename overrides saved earlier
-            overrides = session.get("title_overrides") or {}
-            key = f"{src}:{rid}"
-            if key in overrides:
-                effective_title = (overrides[key] or "").strip()
-
-        if not effective_title:
-            effective_title = info.get("title") or ""
+        effective_title = _effective_title(info, src, rid, override_title)
 
         # 4) local idempotency guard (per-session)
-        #    key on URL + exact start minute so retries/double-clicks don't duplicate
-        idem_key_src = f"{url}|{dt_start.isoformat(timespec='minutes')}"
-        idem_key = hashlib.sha1(idem_key_src.encode("utf-8")).hexdigest()
+        idem_key = _addevent_idem_key(url, dt_start)
 
         idx = session.get("addevent_index") or {}
         if idem_key in idx:
@@ -1057,22 +1275,14 @@ def production_addevent():
                 "duplicate": True
             })
 
-        # 5) build AddEvent payload (keep your prefix behavior if desired)
-        addevent_data = {
-            "title": "[AUTO-TEST]" + effective_title,   # preserve your prefix
-            "datetime_start": dt_start.strftime("%Y-%m-%d %H:%M"),
-            "datetime_end": dt_end.strftime("%Y-%m-%d %H:%M"),
-            "location": info.get("location") or "",
-            "description": url,                         # keep the source link for traceability
-            "timezone": tz,
-        }
+        # 5) build AddEvent payload
+        addevent_data = _addevent_payload(url, info, effective_title, dt_start, default_minutes, tz)
 
         # 6) create event
         res = create_event_addevent(addevent_data)
 
         # 7) normalize response fields
-        event_id = res.get("id") or res.get("event", {}).get("id")
-        event_url = res.get("url") or res.get("event", {}).get("url") or res.get("link")
+        event_id, event_url = _addevent_ids(res)
 
         # 8) store in session so subsequent calls are deduped during this session
         idx[idem_key] = {"event_id": event_id, "event_url": event_url}
@@ -1082,3 +1292,152 @@ def production_addevent():
         return jsonify({"ok": True, "event_id": event_id, "event_url": event_url})
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 500
+
+
+def _existing_addevent_events(starts: list, window_hours: int, tz: str) -> list | None:
+    """
+    One AddEvent range query covering every start (± window), flattened to the
+    shape find_existing_event() expects. None if the query fails.
+    """
+    if not starts:
+        return []
+    win = timedelta(hours=window_hours)
+    try:
+        zone = ZoneInfo(tz)
+    except Exception:
+        zone = LOCAL_TZ
+    try:
+        pulled = search_events_between((min(starts) - win).date(), (max(starts) + win).date())
+    except Exception:
+        return None
+    out = []
+    for ev in pulled:
+        sdt = _ensure_aware_local(ev.get("starts_at_dt"))
+        if sdt:
+            sdt = sdt.astimezone(zone)
+        out.append({
+            "id": ev.get("id"),
+            "url": ev.get("addevent_url"),
+            "description": ev.get("description") or "",
+            # compare on local wall clock, same as the create payload
+            "datetime_start": sdt.strftime("%Y-%m-%d %H:%M") if sdt else "",
+        })
+    return out
+
+
+@production.post("/addevent/bulk")
+def production_addevent_bulk():
+    """
+    Create AddEvent entries for every item in the Events category in one go.
+    Body (optional): { timezone, duration_minutes }
+
+    Pages are fetched + extracted concurrently, existing calendar entries are
+    found with a single range query, and creates run with bounded parallelism.
+    Same per-session idempotency as /production/addevent.
+    """
+    _ensure_session_bucket()
+    payload = request.get_json(silent=True) or {}
+    tz = payload.get("timezone") or "America/New_York"
+    default_minutes = int(payload.get("duration_minutes") or 60)
+
+    cache = session.get("categories_cache") or {}
+    refs = list(((cache.get("index") or {}).get(SPECIAL_CALENDAR)) or [])
+    if not refs:
+        return jsonify({"ok": True, "results": []})
+
+    # every ref gets a result row; ones that can't be extracted carry the reason
+    cur = session.get("curation", {})
+    items = []
+    for ref in refs:
+        item = _resolve_ref(ref, cur)
+        url = ((item or {}).get("url") or "").strip()
+        items.append({
+            "source": ref.get("source"),
+            "id": (item or {}).get("id") or ref.get("id"),
+            "url": url,
+            "_skip": None if url else ("no hearing URL" if item else "article not found"),
+        })
+
+    # 1) fetch + extract concurrently (I/O bound; the LLM is only hit for unknown layouts)
+    def _extract(it):
+        if it["_skip"]:
+            return None, it["_skip"]
+        try:
+            return extract_hearing_details(it["url"]), None
+        except Exception as e:
+            return None, str(e)
+
+    with ThreadPoolExecutor(max_workers=BULK_EXTRACT_WORKERS) as ex:
+        extracted = list(ex.map(_extract, items))
+
+    idx = session.get("addevent_index") or {}
+    results = []
+    pending = {}   # idem_key -> (result, addevent_data)
+    for it, (info, err) in zip(items, extracted):
+        it.pop("_skip")
+        res = {**it, "ok": False, "event_id": None, "event_url": None, "duplicate": False, "error": err}
+        results.append(res)
+        if info is None:
+            continue
+        try:
+            dt_start = datetime.strptime(f"{info['date']} {info['time']}", "%Y-%m-%d %H:%M")
+        except (KeyError, TypeError, ValueError) as e:
+            res["error"] = f"Bad date/time: {e}"
+            continue
+
+        idem_key = _addevent_idem_key(it["url"], dt_start)
+        res["_key"] = idem_key
+        if idem_key in idx:
+            res.update(ok=True, duplicate=True,
+                       event_id=idx[idem_key].get("event_id"), event_url=idx[idem_key].get("event_url"))
+            continue
+        if idem_key in pending:
+            continue   # same hearing listed twice; filled in from the first one below
+        title = _effective_title(info, it["source"] or "", it["id"] or "")
+        pending[idem_key] = (res, dt_start, _addevent_payload(it["url"], info, title, dt_start, default_minutes, tz))
+
+    # 2) dedupe against one pre-fetched range query instead of a search per event
+    existing = _existing_addevent_events([dt for _r, dt, _d in pending.values()], BULK_DEDUPE_WINDOW_HOURS, tz)
+    to_create = []
+    for idem_key, (res, dt_start, data) in pending.items():
+        hit = None
+        if existing is not None:
+            hit = find_existing_event(existing, data["description"], dt_start, BULK_DEDUPE_WINDOW_HOURS)
+        if hit:
+            res.update(ok=True, duplicate=True, event_id=hit.get("id"), event_url=hit.get("url"))
+            idx[idem_key] = {"event_id": hit.get("id"), "event_url": hit.get("url")}
+        else:
+            to_create.append((idem_key, res, data))
+
+    # 3) create with bounded parallelism (per-event search only if the range query failed)
+    def _create(job):
+        _key, _res, data = job
+        try:
+            return create_event_addevent(data, dedupe=existing is None), None
+        except Exception as e:
+            return None, str(e)
+
+    with ThreadPoolExecutor(max_workers=BULK_CREATE_WORKERS) as ex:
+        created = list(ex.map(_create, to_create))
+
+    for (idem_key, res, _data), (out, err) in zip(to_create, created):
+        if out is None:
+            res["error"] = err
+            continue
+        event_id, event_url = _addevent_ids(out)
+        res.update(ok=True, event_id=event_id, event_url=event_url, duplicate=bool(out.get("deduped")))
+        idx[idem_key] = {"event_id": event_id, "event_url": event_url}
+
+    session["addevent_index"] = idx
+    session.modified = True
+
+    # repeated hearings share the outcome of the first occurrence
+    for res in results:
+        key = res.pop("_key", None)
+        if key and not res["ok"] and not res["error"] and key in idx:
+            res.update(ok=True, duplicate=True,
+                       event_id=idx[key].get("event_id"), event_url=idx[key].get("event_url"))
+        elif key and not res["ok"] and not res["error"]:
+            res["error"] = "Not created"
+
+    return jsonify({"ok": all(r["ok"] for r in results), "results": results})
@@ -1,6 +1,5 @@
 from flask import Blueprint, render_template, request
-from features.calendar import fetch_hearing_html, extract_event_info, create_event_addevent
-import json
+from features.calendar import extract_hearing_details, create_event_addevent
 from datetime import datetime, timedelta
 
 add_event = Blueprint("add_event", __name__)
@@ -16,10 +15,7 @@ def hearing_form():
             error = "Please enter a URL."
         else:
             try:
-                raw_text = fetch_hearing_html(url)
-                extracted = extract_event_info(raw_text)    
-
-                parsed = json.loads(extracted)
+                parsed = extract_hearing_details(url)
                 start_dt = datetime.strptime(f"{parsed['date']} {parsed['time']}", "%Y-%m-%d %H:%M")
                 end_dt = start_dt + timedelta(hours=1)
 
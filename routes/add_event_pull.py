@@ -1,24 +1,31 @@
 # routes/add_event_pull.py
 from __future__ import annotations
 
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from io import BytesIO
 
-from flask import Blueprint, render_template, request, send_file, url_for, redirect, abort, make_response, session, jsonify
-from features.categorize import categorize_article, CATEGORIES
+from flask import Blueprint, Response, render_template, request, send_file, url_for, redirect, abort, make_response, session, jsonify
+from features.categorize import categorize_article, merge_index, CATEGORIES
 from collections import OrderedDict
 import hashlib, json
 
+from features import pdf_export
+from features import event_snapshots
 from features.calendar_pull import (
-    search_events_between,
     retrieve_event,
     make_ics_for_event,
+    iter_ics_feed,
+    ics_feed_etag,
     group_by_day,
     DEFAULT_CALENDAR_KEY,
 )
 
 add_event_pull = Blueprint("add_event_pull", __name__)
 
+# default window for the subscribable feed when no ?start/?end is given
+FEED_PAST_DAYS = 7
+FEED_FUTURE_DAYS = 60
+
 def _parse_date(s: str, fallback: date | None = None) -> date | None:
     try:
         return datetime.strptime(s, "%Y-%m-%d").date()
@@ -33,6 +40,7 @@ def add_event_pull_home():
 
     start_str = request.form.get("start_date") or request.args.get("start")
     end_str   = request.form.get("end_date")   or request.args.get("end")
+    refresh   = bool(request.form.get("refresh"))
 
 
     pulled, grouped, error = [], {}, None
@@ -54,7 +62,7 @@ def add_event_pull_home():
             error = "End date must be on or after Start date."
         else:
             try:
-                events  = search_events_between(start, end, calendar_key=DEFAULT_CALENDAR_KEY)
+                events  = event_snapshots.get_events(start, end, calendar_key=DEFAULT_CALENDAR_KEY, refresh=refresh)
                 pulled  = events
                 grouped = group_by_day(events)
 
@@ -115,8 +123,16 @@ def add_event_pull_export_pdf():
     if not start or not end or end < start:
         abort(400, "Invalid date range")
 
-    # Re-pull full events so PDF has full fields (starts_at_dt, original_link, etc.)
-    events_full = search_events_between(start, end, calendar_key=DEFAULT_CALENDAR_KEY) or []
+    # Full events (starts_at_dt, original_link, etc.) come from the local snapshot
+    # of this range; only goes back to AddEvent if it's stale or ?refresh=1
+    refresh = request.args.get("refresh") == "1"
+    try:
+        events_full = event_snapshots.get_events(start, end, calendar_key=DEFAULT_CALENDAR_KEY, refresh=refresh) or []
+    except Exception as e:
+        print("AddEvent pull (export) error:", e)
+        events_full = event_snapshots.cached_events(start, end, DEFAULT_CALENDAR_KEY, max_age=float("inf"))
+        if events_full is None:
+            abort(503, "Events are temporarily unavailable")
     by_id = {str((e.get("id") if isinstance(e, dict) else getattr(e, "id", ""))): e for e in events_full}
 
     # Build ordered categories from cache index -> list of full event objs
@@ -157,7 +173,13 @@ def add_event_pull_export_pdf():
         # nothing matched the current range; bounce to review
         return redirect(url_for("add_event_pull.add_event_categories_review"))
 
-    # Render HTML (category-grouped) then to PDF
+    # Render HTML (category-grouped) then to PDF; repeat exports come from the cache
+    key = pdf_export.payload_key(ordered, "pdf.html", extra=[request.host_url, "addevent"])
+    fname = f"addevent-categories-{start.strftime('%m_%d')}to{end.strftime('%m_%d')}.pdf"
+    path = pdf_export.cached_pdf(key)
+    if path:
+        return send_file(path, mimetype="application/pdf", as_attachment=True, download_name=fname)
+
     html = render_template(
         "pdf.html",
         title="AddEvent Categories",
@@ -167,10 +189,13 @@ def add_event_pull_export_pdf():
     )
 
     try:
-        from weasyprint import HTML  # type: ignore
-        pdf_bytes = HTML(string=html, base_url=request.host_url).write_pdf()
-        fname = f"addevent-categories-{start.strftime('%m_%d')}to{end.strftime('%m_%d')}.pdf"
-        return send_file(BytesIO(pdf_bytes), mimetype="application/pdf", as_attachment=True, download_name=fname)
+        path = pdf_export.render(key, html, base_url=request.host_url)
+        if not path:
+            return render_template(
+                "pdf_pending.html",
+                back_href=url_for("add_event_pull.add_event_categories_review"),
+            ), 202
+        return send_file(path, mimetype="application/pdf", as_attachment=True, download_name=fname)
     except Exception:
         pass
     try:
@@ -187,9 +212,14 @@ def add_event_pull_export_pdf():
 @add_event_pull.route("/add-event-pull/ics/<event_id>.ics", methods=["GET"])
 def add_event_pull_event_ics(event_id: str):
     """
-    Build and return a per-event .ics using live data from AddEvent.
+    Build and return a per-event .ics, from the local snapshot when we have one
+    (?refresh=1 forces live data from AddEvent).
     """
-    ev = retrieve_event(event_id)
+    ev = None
+    if request.args.get("refresh") != "1":
+        ev = event_snapshots.find_event(event_id)
+    if not ev:
+        ev = retrieve_event(event_id)
     if not ev:
         abort(404, "Event not found")
 
@@ -202,6 +232,46 @@ def add_event_pull_event_ics(event_id: str):
         download_name=fname,
     )
 
+@add_event_pull.route("/add-event-pull/feed.ics", methods=["GET"])
+def add_event_pull_feed_ics():
+    """
+    One VCALENDAR with every event in ?start=YYYY-MM-DD&end=YYYY-MM-DD (default:
+    a rolling window around today, so calendar clients can subscribe to it).
+    Built from the local snapshot store, streamed, and ETag-validated so
+    polling clients usually get a 304.
+    """
+    today = date.today()
+    start = _parse_date(request.args.get("start") or "", today - timedelta(days=FEED_PAST_DAYS))
+    end   = _parse_date(request.args.get("end") or "", today + timedelta(days=FEED_FUTURE_DAYS))
+    if not start or not end or end < start:
+        abort(400, "Invalid date range")
+
+    try:
+        events = event_snapshots.get_events(start, end, calendar_key=DEFAULT_CALENDAR_KEY)
+    except Exception as e:
+        print("AddEvent feed error:", e)
+        # serve the last thing we had rather than breaking subscribers
+        events = event_snapshots.cached_events(start, end, DEFAULT_CALENDAR_KEY, max_age=float("inf"))
+        if events is None:
+            abort(503, "Events are temporarily unavailable")
+
+    etag = ics_feed_etag(events, start.isoformat(), end.isoformat())
+    refresh_minutes = max(5, event_snapshots.SNAPSHOT_TTL // 60)
+    if request.if_none_match.contains(etag):
+        resp = make_response("", 304)
+        resp.set_etag(etag)
+        return resp
+
+    resp = Response(
+        iter_ics_feed(events, name="PolicyCrush Events", refresh_minutes=refresh_minutes),
+        mimetype="text/calendar",
+    )
+    resp.headers["Content-Type"] = "text/calendar; charset=utf-8"
+    resp.headers["Content-Disposition"] = 'inline; filename="policycrush-events.ics"'
+    resp.headers["Cache-Control"] = f"public, max-age={refresh_minutes * 60}"
+    resp.set_etag(etag)
+    return resp
+
 def _event_minimal(ev: dict) -> dict:
     """Normalize an AddEvent record into the minimal shape used for categorizing."""
     title = (ev.get("title") or "")[:240]  # trim to keep cookie small
@@ -238,7 +308,7 @@ def add_event_pull_build_categories():
         e = _parse_date(end_str)
         if s and e and e >= s:
             try:
-                fresh = search_events_between(s, e, calendar_key=DEFAULT_CALENDAR_KEY)
+                fresh = event_snapshots.get_events(s, e, calendar_key=DEFAULT_CALENDAR_KEY)
                 events = [_event_minimal(ev) for ev in (fresh or [])]
                 # write back so the review page can hydrate
                 session["addevent_pulled"] = events
@@ -257,22 +327,14 @@ def add_event_pull_build_categories():
         session.modified = True
         return redirect(url_for("add_event_pull.add_event_categories_review"))
 
-    categories_index = {
-        "Congress and the Administration": [],
-        "Health Insurance": [],
-        "Health Tech": [],
-        "Medicaid": [],
-        "Medicare": [],
-        "Pharmaceuticals and Medical Devices": [],
-        "Quality and Innovation": [],
-    }
-
-    # AddEvent pulls are all "events"
-    for ev in events:
-        label = categorize_article(ev.get("title", ""), is_hearing=False)
-        if label not in categories_index:
-            label = "Quality and Innovation"
-        categories_index[label].append(str(ev.get("id")))
+    # AddEvent pulls are all "events"; only events not filed yet get classified
+    categories_index, _ = merge_index(
+        cache.get("index"),
+        [(str(ev.get("id")), ev) for ev in events],
+        key=str,
+        classify=lambda ev: categorize_article(ev.get("title", ""), is_hearing=False),
+        labels=CATEGORIES,
+    )
 
     session["addevent_categories_cache"] = {
         "built_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -294,6 +356,21 @@ def add_event_categories_review():
     events = session.get("addevent_pulled") or []
     by_id = {str(e.get("id")): e for e in events}
 
+    # fill in fields the cookie copy doesn't carry (date/link) from the snapshot, if fresh
+    last_range = session.get("addevent_last_range") or {}
+    s, e = _parse_date(last_range.get("start") or ""), _parse_date(last_range.get("end") or "")
+    snapshot = event_snapshots.cached_events(s, e, DEFAULT_CALENDAR_KEY) if (s and e and e >= s) else None
+    for full in snapshot or []:
+        mini = by_id.get(str(full.get("id")))
+        if mini is None:
+            continue
+        mini = dict(mini)
+        if not mini.get("date") and full.get("starts_at"):
+            mini["date"] = full["starts_at"]
+        if not mini.get("url"):
+            mini["url"] = full.get("original_link") or full.get("addevent_url") or ""
+        by_id[str(full.get("id"))] = mini
+
     hydrated = {}
     for label, refs in index.items():
         items = []
@@ -312,7 +389,6 @@ def add_event_categories_review():
         if lab not in ordered:
             ordered[lab] = items
 
-    last_range = session.get("addevent_last_range") or {}
     return render_template(
         "add_event_categories.html",
         categories=ordered,
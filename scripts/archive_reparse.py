@@ -0,0 +1,86 @@
+# scripts/archive_reparse.py
+"""
+Re-run today's parsers over archived listing pages (no network).
+
+Lists what the archive holds, or parses archived pages again with the
+current code in sources/, e.g. after fixing a selector, to recover items
+that have already rolled off a committee's listing.
+
+Usage:
+    python scripts/archive_reparse.py --list                       # pages per source
+    python scripts/archive_reparse.py house.budget_maj             # every archived page
+    python scripts/archive_reparse.py senate --since 2026-10-01    # a chamber, a window
+    python scripts/archive_reparse.py news.fda --latest --json     # items as JSON
+
+By default the start_date the page was fetched with is ignored, so every
+item on the page is returned; --as-fetched keeps it. Items are printed
+once per (title, url) across pages.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sources import archive  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("source", nargs="?", help='source key or prefix, e.g. "house.budget_maj" or "senate"')
+    parser.add_argument("--since", type=datetime.fromisoformat, help="only pages fetched on/after (ISO date)")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="only pages fetched on/before (ISO date)")
+    parser.add_argument("--latest", action="store_true", help="only the most recent page per parser")
+    parser.add_argument("--as-fetched", action="store_true", help="keep the original start_date")
+    parser.add_argument("--list", action="store_true", help="summarize the archive instead of parsing")
+    parser.add_argument("--json", action="store_true", help="print items as JSON lines")
+    args = parser.parse_args(argv)
+
+    found = archive.entries(args.source, since=args.since, until=args.until)
+    if args.latest:
+        found = archive.latest(found)
+    if not found:
+        print("no archived pages match", file=sys.stderr)
+        return 1
+
+    if args.list:
+        pages = Counter(e["source"] for e in found)
+        blobs = {e["source"]: set() for e in found}
+        for e in found:
+            blobs[e["source"]].add(e["sha"])
+        for source in sorted(pages):
+            print(f"  {source:32s} {pages[source]:5d} fetches  {len(blobs[source]):5d} distinct pages")
+        return 0
+
+    seen: set[tuple[str, str]] = set()
+    failed = 0
+    for entry in found:
+        try:
+            items = archive.reparse(entry, keep_dates=args.as_fetched)
+        except Exception as e:
+            failed += 1
+            print(f"{entry['source']} @ {entry['at']}: {e}", file=sys.stderr)
+            continue
+        for item in items:
+            key = (item.get("title", ""), item.get("url", ""))
+            if key in seen:
+                continue
+            seen.add(key)
+            if args.json:
+                print(json.dumps({"source": entry["source"], **item}, ensure_ascii=False))
+            else:
+                print(f"{entry['source']:24s} {item.get('date', ''):10s}  {item.get('title', '')}\n{'':36s}{item.get('url', '')}")
+
+    print(f"\n{len(seen)} items from {len(found)} pages ({failed} failed)", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
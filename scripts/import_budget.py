@@ -0,0 +1,96 @@
+# scripts/import_budget.py
+"""
+Import-time budget for the web app.
+
+Runs `python -X importtime -c "import app"` in a fresh interpreter and fails if:
+
+  * the cumulative import time of `app` is over budget, or
+  * any of the heavy, use-on-demand packages got imported at startup
+    (selenium, weasyprint, google client, openai, ...).
+
+Usage:
+    python scripts/import_budget.py                 # default budget
+    python scripts/import_budget.py --budget-ms 600 --top 20
+
+ENV (optional):
+    IMPORT_BUDGET_MS  -> default budget in milliseconds (default 800)
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded lazily on first use; importing any of these at startup is a regression.
+FORBIDDEN = (
+    "selenium",
+    "webdriver_manager",
+    "weasyprint",
+    "pdfkit",
+    "googleapiclient",
+    "google_auth_oauthlib",
+    "openai",
+)
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def measure(module: str = "app") -> list[tuple[str, int, int, int]]:
+    """[(name, self_us, cumulative_us, depth)] for one cold import of `module`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr)
+        raise SystemExit(f"import {module} failed (exit {proc.returncode})")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            depth = (len(m.group(3)) - 1) // 2
+            rows.append((m.group(4), int(m.group(1)), int(m.group(2)), depth))
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("IMPORT_BUDGET_MS", "800")))
+    parser.add_argument("--top", type=int, default=15, help="how many of the slowest imports to list")
+    args = parser.parse_args(argv)
+
+    rows = measure(args.module)
+    total_us = next((cum for name, _s, cum, depth in rows if name == args.module and depth == 0), 0)
+
+    print(f"import {args.module}: {total_us / 1000:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"\nslowest {args.top} by self time:")
+    for name, self_us, cum_us, _d in sorted(rows, key=lambda r: r[1], reverse=True)[: args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  (cum {cum_us / 1000:8.1f} ms)  {name}")
+
+    failed = False
+    heavy = sorted({name for name, *_ in rows if name.split(".")[0] in FORBIDDEN})
+    if heavy:
+        failed = True
+        print("\nFAIL: imported at startup but should load on first use:")
+        for name in heavy:
+            print(f"  {name}")
+    if total_us / 1000 > args.budget_ms:
+        failed = True
+        print(f"\nFAIL: over budget by {total_us / 1000 - args.budget_ms:.1f} ms")
+
+    if not failed:
+        print("\nOK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
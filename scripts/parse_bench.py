@@ -0,0 +1,135 @@
+# scripts/parse_bench.py
+"""
+Listing-page parse benchmark: serial vs. the parser process pool.
+
+First record every source's listing pages once (live fetch, 45 sources):
+
+    python scripts/parse_bench.py --record .cache/parse_bench
+
+then time parsing the recorded pages in-process against pools of 1, 2, 4, 8
+worker processes (no network involved):
+
+    python scripts/parse_bench.py .cache/parse_bench
+    python scripts/parse_bench.py .cache/parse_bench --workers 1 2 4 8 16 --rounds 5
+
+or use the newest archived page per parser instead of a recording
+(sources/archive.py keeps every page the app has parsed):
+
+    python scripts/parse_bench.py --archive
+
+Pools are warmed up (processes spawned, parser modules imported) before they
+are timed, so the numbers are steady-state parse throughput. The app parses
+in-process unless PARSE_WORKERS is set; set it only where the pool clearly
+wins here. Without spare cores it doesn't: page text goes to the worker and
+items come back through pickling, for no parallelism.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import multiprocessing
+import os
+import pickle
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sources import archive, parsing, registry  # noqa: E402
+
+
+def record(out_dir: str, days: int) -> int:
+    """Fetch every registry source once, saving each page handed to parsing.parse()."""
+    os.makedirs(out_dir, exist_ok=True)
+    lock = threading.Lock()
+    count = 0
+
+    def save(name: str, html: str, args: tuple, kwargs: dict) -> None:
+        nonlocal count
+        with lock:
+            count += 1
+            path = os.path.join(out_dir, f"{count:03d}.pickle")
+        with open(path, "wb") as f:
+            pickle.dump((name, html, args, kwargs), f)
+
+    parsing.recorder = save
+    try:
+        results = registry.fetch_all(registry.SOURCES, date.today() - timedelta(days=days))
+    finally:
+        parsing.recorder = None
+
+    failed = sorted(k for k, r in results.items() if isinstance(r, Exception) or r.error)
+    print(f"recorded {count} pages from {len(results)} sources into {out_dir}")
+    for key in failed:
+        print(f"  failed: {key}")
+    return 0
+
+
+def load(in_dir: str) -> list[tuple[str, str, tuple, dict]]:
+    calls = []
+    for path in sorted(glob.glob(os.path.join(in_dir, "*.pickle"))):
+        with open(path, "rb") as f:
+            calls.append(pickle.load(f))
+    return calls
+
+
+def load_archive() -> list[tuple[str, str, tuple, dict]]:
+    return [archive.call(e) for e in archive.latest(archive.entries())]
+
+
+def run_serial(calls) -> int:
+    return sum(len(parsing.resolve(name)(html, *args, **kwargs)) for name, html, args, kwargs in calls)
+
+
+def run_pool(pool: ProcessPoolExecutor, calls) -> int:
+    futures = [pool.submit(parsing.run, name, html, args, kwargs) for name, html, args, kwargs in calls]
+    return sum(len(f.result()) for f in futures)
+
+
+def best_of(rounds: int, fn, *args) -> tuple[float, int]:
+    best, items = float("inf"), 0
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        items = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best, items
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("pages", nargs="?", default=os.path.join(ROOT, ".cache", "parse_bench"))
+    parser.add_argument("--record", metavar="DIR", help="fetch all sources and save their pages to DIR")
+    parser.add_argument("--archive", action="store_true", help="bench the latest archived page per parser")
+    parser.add_argument("--days", type=int, default=14, help="start_date for --record, in days back")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--rounds", type=int, default=3, help="timed rounds per setting (best is kept)")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        return record(args.record, args.days)
+
+    calls = load_archive() if args.archive else load(args.pages)
+    if not calls:
+        raise SystemExit(f"no recorded pages in {args.pages} (run with --record first)")
+    size = sum(len(html) for _n, html, _a, _k in calls)
+    print(f"{len(calls)} pages, {size / 1e6:.1f} MB of HTML, {os.cpu_count()} CPUs\n")
+
+    serial, items = best_of(args.rounds, run_serial, calls)
+    print(f"  serial       {serial * 1000:8.0f} ms  {items} items")
+
+    ctx = multiprocessing.get_context("spawn")
+    for n in args.workers:
+        with ProcessPoolExecutor(max_workers=n, mp_context=ctx, initializer=parsing._mark_worker) as pool:
+            run_pool(pool, calls)   # warm-up: spawn workers, import parser modules
+            elapsed, items = best_of(args.rounds, run_pool, pool, calls)
+        print(f"  {n:2d} workers   {elapsed * 1000:8.0f} ms  {items} items  x{serial / elapsed:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
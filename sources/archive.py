@@ -0,0 +1,296 @@
+# sources/archive.py
+"""
+Archive of every listing page the parsers have seen.
+
+Whenever parsing.parse() runs a parser, the page text is stored here so it
+can be parsed again later without the network (streamed listings archive
+the bytes they read through streaming.items(archive_as=...)): after a selector fix (to
+recover items that have since rolled off the listing), to reproduce a bad
+parse, or as benchmark fixtures (scripts/parse_bench.py --archive).
+
+Layout under .cache/archive/:
+
+    blobs/ab/abcdef....zst     page text, zstd-compressed, named by the SHA-256
+                               of the uncompressed bytes (same page twice ->
+                               one blob); .gz when zstandard isn't installed
+    index.jsonl                one line per fetch:
+                               {"at", "source", "parser", "sha", "args", "kwargs"}
+
+`source` is the registry-style key derived from the parser's module
+("house.budget_maj", "senate.aging", ...). Dates in args/kwargs are kept as
+{"$date": "YYYY-MM-DD"} so they round-trip through JSON.
+
+    archive.entries(source="senate.aging", since=datetime(2026, 10, 1))
+    archive.reparse(entry, keep_dates=False)   # -> items from today's parser
+
+scripts/archive_reparse.py is the command-line front end.
+
+The archive is capped: at most once every PRUNE_EVERY seconds, record()
+drops index lines older than PAGE_ARCHIVE_MAX_AGE days, then the oldest
+lines until the blobs still referenced fit in PAGE_ARCHIVE_MAX_MB, and
+deletes blobs no line refers to any more.
+
+ENV (optional):
+    PAGE_ARCHIVE          -> 0 to stop archiving pages (default 1)
+    PAGE_ARCHIVE_LEVEL    -> zstd compression level (default 10)
+    PAGE_ARCHIVE_MAX_AGE  -> days a page is kept (default 30)
+    PAGE_ARCHIVE_MAX_MB   -> total size of the kept pages, compressed (default 500)
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+import typing as t
+from datetime import date, datetime, timedelta
+
+from features.storage import atomic_write, cache_dir
+
+ENABLED = os.getenv("PAGE_ARCHIVE", "1") != "0"
+LEVEL = int(os.getenv("PAGE_ARCHIVE_LEVEL", "10"))
+MAX_AGE_DAYS = float(os.getenv("PAGE_ARCHIVE_MAX_AGE", "30"))
+MAX_BYTES = int(float(os.getenv("PAGE_ARCHIVE_MAX_MB", "500")) * 1024 * 1024)
+
+PRUNE_EVERY = 3600.0    # seconds between prunes in one process
+BLOB_GRACE = 300.0      # never delete a blob written or reused this recently
+
+_index_lock = threading.Lock()
+_last_prune = 0.0
+
+
+def _root() -> str:
+    return cache_dir("archive")
+
+
+def _index_path() -> str:
+    return os.path.join(_root(), "index.jsonl")
+
+
+def source_of(parser_name: str) -> str:
+    """ "sources.house.budget_maj:parse_..." -> "house.budget_maj" """
+    module = parser_name.partition(":")[0]
+    return module[len("sources."):] if module.startswith("sources.") else module
+
+
+# ---- Compression -------------------------------------------------------------
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def _compress(data: bytes) -> tuple[bytes, str]:
+    zstd = _zstd()
+    if zstd is not None:
+        return zstd.ZstdCompressor(level=LEVEL).compress(data), ".zst"
+    return gzip.compress(data, compresslevel=6), ".gz"
+
+
+def _decompress(blob: bytes, suffix: str) -> bytes:
+    if suffix == ".gz":
+        return gzip.decompress(blob)
+    zstd = _zstd()
+    if zstd is None:
+        raise RuntimeError("archived page is zstd-compressed; install zstandard to read it")
+    return zstd.ZstdDecompressor().decompress(blob)
+
+
+# ---- Blobs -------------------------------------------------------------------
+
+def _blob_base(sha: str) -> str:
+    return os.path.join(_root(), "blobs", sha[:2], sha)
+
+
+def _find_blob(sha: str) -> str | None:
+    base = _blob_base(sha)
+    for suffix in (".zst", ".gz"):
+        if os.path.exists(base + suffix):
+            return base + suffix
+    return None
+
+
+def put_blob(text: str) -> str:
+    """Store page text once; returns its SHA-256."""
+    data = text.encode("utf-8")
+    sha = hashlib.sha256(data).hexdigest()
+    path = _find_blob(sha)
+    if path is None:
+        blob, suffix = _compress(data)
+        atomic_write(_blob_base(sha) + suffix, blob)
+    else:
+        os.utime(path)      # reused: keep it out of a concurrent prune's reach
+    return sha
+
+
+def get_blob(sha: str) -> str:
+    path = _find_blob(sha)
+    if path is None:
+        raise KeyError(sha)
+    with open(path, "rb") as fh:
+        return _decompress(fh.read(), os.path.splitext(path)[1]).decode("utf-8")
+
+
+# ---- Arguments ---------------------------------------------------------------
+
+def _encode(value: t.Any) -> t.Any:
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    return value
+
+
+def _decode(value: t.Any, keep_dates: bool = True) -> t.Any:
+    if isinstance(value, dict):
+        if "$date" in value:
+            return date.fromisoformat(value["$date"]) if keep_dates else None
+        if "$datetime" in value:
+            return datetime.fromisoformat(value["$datetime"]) if keep_dates else None
+    return value
+
+
+# ---- Index -------------------------------------------------------------------
+
+def record(parser_name: str, html: str, args: tuple = (), kwargs: dict | None = None) -> None:
+    """Archive one page handed to a parser. Never raises: archiving is best-effort."""
+    if not ENABLED:
+        return
+    try:
+        entry = {
+            "at": datetime.now().isoformat(timespec="seconds"),
+            "source": source_of(parser_name),
+            "parser": parser_name,
+            "sha": put_blob(html),
+            "args": [_encode(a) for a in args],
+            "kwargs": {k: _encode(v) for k, v in (kwargs or {}).items()},
+        }
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with _index_lock, open(_index_path(), "a", encoding="utf-8") as fh:
+            fh.write(line)
+    except (OSError, TypeError, ValueError):
+        pass
+    _maybe_prune()
+
+
+def _maybe_prune() -> None:
+    global _last_prune
+    now = time.time()
+    if now - _last_prune < PRUNE_EVERY:
+        return
+    _last_prune = now
+    try:
+        prune()
+    except OSError:
+        pass
+
+
+def _blob_size(sha: str) -> int:
+    path = _find_blob(sha)
+    try:
+        return os.path.getsize(path) if path else 0
+    except OSError:
+        return 0
+
+
+def prune(now: datetime | None = None) -> int:
+    """
+    Enforce PAGE_ARCHIVE_MAX_AGE and PAGE_ARCHIVE_MAX_MB: rewrite the index
+    without the dropped lines and delete unreferenced blobs. Returns the
+    number of index lines dropped.
+    """
+    now = now or datetime.now()
+    cutoff = now - timedelta(days=MAX_AGE_DAYS)
+    with _index_lock:
+        current = entries()
+        kept = [e for e in current if datetime.fromisoformat(e["at"]) >= cutoff]
+
+        # newest first, keep lines while the distinct blobs they need fit
+        sizes: dict[str, int] = {}
+        total = 0
+        for i in range(len(kept) - 1, -1, -1):
+            sha = kept[i]["sha"]
+            if sha not in sizes:
+                sizes[sha] = _blob_size(sha)
+                total += sizes[sha]
+                if total > MAX_BYTES:
+                    del sizes[sha]
+                    kept = kept[i + 1:]
+                    break
+
+        # a line another worker appends during this rewrite can be lost; its
+        # blob survives (BLOB_GRACE), and losing an archive line is harmless
+        dropped = len(current) - len(kept)
+        if dropped:
+            lines = "".join(json.dumps(e, ensure_ascii=False, separators=(",", ":")) + "\n" for e in kept)
+            atomic_write(_index_path(), lines.encode("utf-8"))
+
+    referenced = {e["sha"] for e in kept}
+    blobs = os.path.join(_root(), "blobs")
+    for folder, _dirs, names in os.walk(blobs):
+        for name in names:
+            sha, suffix = os.path.splitext(name)
+            path = os.path.join(folder, name)
+            if sha in referenced or suffix not in (".zst", ".gz"):
+                continue
+            try:
+                if time.time() - os.path.getmtime(path) > BLOB_GRACE:
+                    os.remove(path)
+            except OSError:
+                pass
+    return dropped
+
+
+def entries(source: str | None = None, since: datetime | None = None,
+            until: datetime | None = None) -> list[dict]:
+    """Index entries (oldest first), optionally for one source key or prefix ("senate")."""
+    out = []
+    try:
+        fh = open(_index_path(), "r", encoding="utf-8")
+    except OSError:
+        return out
+    with fh:
+        for line in fh:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue            # torn last line from a crashed writer
+            if source and entry["source"] != source and not entry["source"].startswith(source + "."):
+                continue
+            at = datetime.fromisoformat(entry["at"])
+            if (since and at < since) or (until and at > until):
+                continue
+            out.append(entry)
+    return out
+
+
+def latest(entries_: t.Iterable[dict]) -> list[dict]:
+    """The most recent entry per parser."""
+    by_parser: dict[str, dict] = {}
+    for entry in entries_:
+        by_parser[entry["parser"]] = entry
+    return list(by_parser.values())
+
+
+def call(entry: dict, keep_dates: bool = True) -> tuple[str, str, tuple, dict]:
+    """(parser name, page text, args, kwargs) as originally handed to the parser."""
+    args = tuple(_decode(a, keep_dates) for a in entry["args"])
+    kwargs = {k: _decode(v, keep_dates) for k, v in entry["kwargs"].items()}
+    return entry["parser"], get_blob(entry["sha"]), args, kwargs
+
+
+def reparse(entry: dict, keep_dates: bool = False) -> list[dict]:
+    """
+    Run the current parser over an archived page. By default the recorded
+    start_date is dropped, so everything on the page comes back.
+    """
+    from sources import parsing
+
+    name, html, args, kwargs = call(entry, keep_dates)
+    return parsing.resolve(name)(html, *args, **kwargs)
@@ -0,0 +1,72 @@
+# sources/browser.py
+"""
+Chrome/Selenium helpers for the few sources that need a real browser.
+
+selenium and webdriver_manager are imported inside these functions so that
+importing a source module (or the blueprints that list them) stays cheap;
+the browser stack only loads when one of those sources is actually fetched.
+
+    with chrome(headless=True) as driver:
+        driver.get(url)
+        wait_for_css(driver, ".listing", 20)
+        html = driver.page_source
+
+chrome() holds one of SELENIUM_SLOTS while the browser is open, so a
+concurrent load never runs more than that many Chromes at once.
+
+ENV (optional):
+    SELENIUM_SLOTS   -> concurrent browsers (default 2)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+import typing as t
+
+if t.TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+SELENIUM_SLOTS = int(os.getenv("SELENIUM_SLOTS", "2"))
+
+_slots = threading.BoundedSemaphore(max(1, SELENIUM_SLOTS))
+
+
+def chrome_driver(headless: bool = True, args: t.Iterable[str] = ()) -> "WebDriver":
+    """A Chrome driver with the flags every source uses; caller must quit() it."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    for arg in args:
+        options.add_argument(arg)
+
+    return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+
+
+@contextlib.contextmanager
+def chrome(headless: bool = True, args: t.Iterable[str] = ()) -> t.Iterator["WebDriver"]:
+    """chrome_driver() inside a browser slot; quits the driver on exit."""
+    with _slots:
+        driver = chrome_driver(headless=headless, args=args)
+        try:
+            yield driver
+        finally:
+            driver.quit()
+
+
+def wait_for_css(driver: "WebDriver", selector: str, timeout: float) -> None:
+    """Block until an element matching `selector` is present (raises on timeout)."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    WebDriverWait(driver, timeout).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+    )
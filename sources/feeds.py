@@ -0,0 +1,202 @@
+# sources/feeds.py
+"""
+RSS / Atom feeds as a source type.
+
+Many of the sites we scrape also publish a feed, which is smaller than the
+listing page, changes markup far less often and answers conditional GETs:
+
+    items = feeds.fetch("news.whitehouse", "https://www.whitehouse.gov/news/feed/")
+    # -> [{"title", "url", "date": "YYYY-MM-DD"}, ...] newest first
+
+Per source the module keeps the feed's ETag / Last-Modified and the entries
+already seen (.cache/feeds/<key>.json):
+
+  * the request carries If-None-Match / If-Modified-Since; a 304 returns the
+    stored entries without downloading anything,
+  * otherwise the body is streamed into lxml's pull parser and parsing stops
+    (and the download is dropped) at the cursor: the first already-stored
+    entry that is dated no older than the newest stored entry. A stored
+    entry dated older than that is out of order (pinned, or re-sorted) and
+    is skipped without ending the read, so new entries listed after it are
+    still found. Only entries not stored yet are normalized and added.
+
+RSS 2.0 (<item>, <guid>, <pubDate>, dc:date) and Atom (<entry>, <id>,
+<link rel="alternate">, <published>/<updated>) are both understood. fetch()
+returns every stored entry; callers apply their start_date (strategy.since).
+
+ENV (optional):
+    FEED_KEEP  -> entries remembered per feed (default 200)
+"""
+
+from __future__ import annotations
+
+import email.utils
+import os
+import threading
+from datetime import datetime
+
+from lxml import etree
+
+from features.storage import cache_dir, read_json, write_json
+from sources import http
+
+KEEP = int(os.getenv("FEED_KEEP", "200"))
+CHUNK = 16384
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+DC = "{http://purl.org/dc/elements/1.1/}"
+
+ENTRY_TAGS = frozenset({"item", ATOM + "entry"})
+
+_locks: dict[str, threading.Lock] = {}
+_locks_lock = threading.Lock()
+
+
+class FeedError(ValueError):
+    """The response was not a feed we could read."""
+
+
+def _lock(key: str) -> threading.Lock:
+    with _locks_lock:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = _locks[key] = threading.Lock()
+        return lock
+
+
+def _state_path(key: str) -> str:
+    return os.path.join(cache_dir("feeds"), f"{key}.json")
+
+
+# ---- Entries -----------------------------------------------------------------
+
+def _text(el: etree._Element, *tags: str) -> str:
+    for tag in tags:
+        child = el.find(tag)
+        if child is not None and child.text:
+            return child.text.strip()
+    return ""
+
+
+def _atom_link(el: etree._Element) -> str:
+    fallback = ""
+    for link in el.iterfind(ATOM + "link"):
+        rel = link.get("rel", "alternate")
+        if rel == "alternate":
+            return link.get("href", "").strip()
+        fallback = fallback or link.get("href", "").strip()
+    return fallback
+
+
+def _date(raw: str) -> str:
+    """RFC 822 (RSS) or ISO 8601 (Atom, dc:date) -> "YYYY-MM-DD" ("" if unreadable)."""
+    if not raw:
+        return ""
+    try:
+        return email.utils.parsedate_to_datetime(raw).strftime("%Y-%m-%d")
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(raw.replace("Z", "+00:00")).strftime("%Y-%m-%d")
+    except ValueError:
+        return ""
+
+
+def normalize(el: etree._Element, tag: str | None = None) -> dict | None:
+    """One <item>/<entry> -> {"guid", "title", "url", "date"[, "tag"]}, or None if incomplete."""
+    if el.tag == "item":
+        url = _text(el, "link")
+        guid = _text(el, "guid") or url
+        date = _date(_text(el, "pubDate", DC + "date"))
+        title = _text(el, "title")
+    else:
+        url = _atom_link(el)
+        guid = _text(el, ATOM + "id") or url
+        date = _date(_text(el, ATOM + "published", ATOM + "updated"))
+        title_el = el.find(ATOM + "title")
+        title = "".join(title_el.itertext()).strip() if title_el is not None else ""
+
+    if not title or not url or not date:
+        return None
+    entry = {"guid": guid, "title": title, "url": url, "date": date}
+    if tag:
+        entry["tag"] = tag
+    return entry
+
+
+def _public(entry: dict) -> dict:
+    return {k: v for k, v in entry.items() if k != "guid"}
+
+
+# ---- Fetch -------------------------------------------------------------------
+
+def _read_new(response, known: set[str], newest: str, tag: str | None) -> list[dict]:
+    """
+    Stream-parse entries not in `known` until the cursor: a known entry dated
+    `newest` (the newest stored date) or later.
+    """
+    parser = etree.XMLPullParser(events=("end",), resolve_entities=False, no_network=True)
+    new: list[dict] = []
+    seen_root = False
+    try:
+        for chunk in response.iter_content(CHUNK):
+            parser.feed(chunk)
+            for _event, el in parser.read_events():
+                seen_root = True
+                if el.tag not in ENTRY_TAGS:
+                    continue
+                entry = normalize(el, tag)
+                el.clear()
+                if entry is None:
+                    continue
+                if entry["guid"] in known:
+                    if entry["date"] >= newest:
+                        return new
+                    continue        # an older entry out of order, e.g. pinned
+                new.append(entry)
+        parser.close()
+    except etree.XMLSyntaxError as e:
+        raise FeedError(str(e)) from e
+    finally:
+        response.close()
+    if not seen_root:
+        raise FeedError("empty response")
+    return new
+
+
+def fetch(key: str, url: str, tag: str | None = None,
+          headers: dict[str, str] | None = None) -> list[dict]:
+    """Every known entry of the feed at `url`, newest first, after a conditional GET."""
+    with _lock(key):
+        state = read_json(_state_path(key), {}) or {}
+        if state.get("url") != url:
+            state = {"url": url}
+        stored: list[dict] = state.get("entries", [])
+
+        request_headers = dict(headers or {})
+        if state.get("etag"):
+            request_headers["If-None-Match"] = state["etag"]
+        if state.get("modified"):
+            request_headers["If-Modified-Since"] = state["modified"]
+
+        response = http.get(url, headers=request_headers, stream=True)
+        if response.status_code == 304:
+            response.close()
+            return [_public(e) for e in stored]
+        if response.status_code != 200:
+            response.close()
+            raise FeedError(f"{url}: HTTP {response.status_code}")
+
+        etag = response.headers.get("ETag")
+        modified = response.headers.get("Last-Modified")
+        newest = max((e["date"] for e in stored), default="")
+        new = _read_new(response, {e["guid"] for e in stored}, newest, tag)
+
+        # new entries can be dated older than stored ones; keep newest first
+        entries = sorted(new + stored, key=lambda e: e["date"], reverse=True)[:KEEP]
+        state.update(entries=entries, etag=etag, modified=modified)
+        try:
+            write_json(_state_path(key), state)
+        except OSError:
+            pass
+        return [_public(e) for e in entries]
@@ -1,4 +1,4 @@
-import requests
+from sources import http, parsing
 from bs4 import BeautifulSoup
 from datetime import datetime
 
@@ -6,14 +6,19 @@ def fetch_appr_min_articles(start_date=None):
     results = []
     url = "https://democrats-appropriations.house.gov/news/press-releases"
 
-    response = requests.get(url, headers={
+    response = http.get(url, headers={
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"
     })
 
     if response.status_code != 200:
         return results
+    return parsing.parse(parse_appr_min_articles, response.text, start_date)
 
-    soup = BeautifulSoup(response.text, "html.parser")
+
+@parsing.parser
+def parse_appr_min_articles(html, start_date=None):
+    results = []
+    soup = BeautifulSoup(html, "html.parser")
     articles = soup.select("div.views-row")
 
     for article in articles:
@@ -1,15 +1,20 @@
-import requests
+from sources import http, parsing
 from bs4 import BeautifulSoup
 from datetime import datetime
 
 def fetch_jec_maj_articles(start_date=None):
     results = []
     url = "https://www.jec.senate.gov/public/index.cfm/republicans/newsroom"
-    response = requests.get(url)
+    response = http.get(url)
     if response.status_code != 200:
         return results
+    return parsing.parse(parse_jec_maj_articles, response.text, start_date)
 
-    soup = BeautifulSoup(response.text, "html.parser")
+
+@parsing.parser
+def parse_jec_maj_articles(html, start_date=None):
+    results = []
+    soup = BeautifulSoup(html, "html.parser")
     items = soup.select("a[href*='/republicans/newsroom?id=']")
 
     for item in items:
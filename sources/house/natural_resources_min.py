@@ -1,15 +1,20 @@
-import requests
+from sources import http, parsing
 from bs4 import BeautifulSoup
 from datetime import datetime
 
 def fetch_natr_min_articles(start_date=None):
     results = []
     url = "https://democrats-naturalresources.house.gov/media/press-releases"
-    response = requests.get(url)
+    response = http.get(url)
     if response.status_code != 200:
         return results
+    return parsing.parse(parse_natr_min_articles, response.text, start_date)
 
-    soup = BeautifulSoup(response.text, "html.parser")
+
+@parsing.parser
+def parse_natr_min_articles(html, start_date=None):
+    results = []
+    soup = BeautifulSoup(html, "html.parser")
     press_div = soup.find("div", id="press")
     if not press_div:
         return results
@@ -1,4 +1,4 @@
-import requests
+from sources import http, parsing
 from bs4 import BeautifulSoup
 from datetime import datetime
 
@@ -6,13 +6,18 @@ def fetch_ovs_maj_articles(start_date=None):
     results = []
     url = "https://oversight.house.gov/release/"
 
-    response = requests.get(url, headers={
+    response = http.get(url, headers={
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"
     })
     if response.status_code != 200:
         return results
+    return parsing.parse(parse_ovs_maj_articles, response.text, start_date)
 
-    soup = BeautifulSoup(response.text, "html.parser")
+
+@parsing.parser
+def parse_ovs_maj_articles(html, start_date=None):
+    results = []
+    soup = BeautifulSoup(html, "html.parser")
     posts = soup.select("div.post.featured-post")
 
     for post in posts:
@@ -1,4 +1,4 @@
-import requests
+from sources import http, parsing
 from bs4 import BeautifulSoup
 from datetime import datetime
 
@@ -7,13 +7,18 @@ def fetch_ovs_min_articles(start_date=None):
     base_url = "https://oversightdemocrats.house.gov"
     url = f"{base_url}/news/press-releases"
 
-    response = requests.get(url, headers={
+    response = http.get(url, headers={
         "User-Agent": "Mozilla/5.0"
     })
     if response.status_code != 200:
         return results
+    return parsing.parse(parse_ovs_min_articles, response.text, base_url, start_date)
 
-    soup = BeautifulSoup(response.text, "html.parser")
+
+@parsing.parser
+def parse_ovs_min_articles(html, base_url, start_date=None):
+    results = []
+    soup = BeautifulSoup(html, "html.parser")
     rows = soup.select("div.views-row.evo-views-row")
 
     for row in rows:
@@ -1,4 +1,4 @@
-import requests
+from sources import http, parsing
 from bs4 import BeautifulSoup
 from datetime import datetime
 
@@ -7,11 +7,16 @@ def fetch_smb_min_articles(start_date=None):
     base_url = "https://democrats-smallbusiness.house.gov/"
     url = base_url + "news/"
 
-    response = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
+    response = http.get(url, headers={"User-Agent": "Mozilla/5.0"})
     if response.status_code != 200:
         return results
+    return parsing.parse(parse_smb_min_articles, response.text, base_url, start_date)
 
-    soup = BeautifulSoup(response.text, "html.parser")
+
+@parsing.parser
+def parse_smb_min_articles(html, base_url, start_date=None):
+    results = []
+    soup = BeautifulSoup(html, "html.parser")
     articles = soup.select("article.newsblocker")
 
     for article in articles:
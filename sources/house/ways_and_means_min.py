@@ -1,44 +1,66 @@
-import requests
-from bs4 import BeautifulSoup
+from sources import http, parsing, streaming
 from datetime import datetime
 
+# The listing is newest first, but a pinned or re-dated item can sit out of
+# order, so a single older item doesn't end it: reading stops only after
+# this many older items in a row.
+OLD_RUN = 3
+
 def fetch_wam_min_articles(start_date=None):
     results = []
     url = "https://democrats-waysandmeans.house.gov/media-center"
 
-    response = requests.get(url, headers={
+    # the listing sits near the top of a large page: stream it and stop
+    # reading once the listing (or the requested date range) ends
+    response = http.get(url, stream=True, headers={
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"
     })
 
     if response.status_code != 200:
+        response.close()
         return results
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    items = soup.select("div.views-row")
+    rows = streaming.items(response, "div", "views-row",
+                           archive_as=parse_wam_min_articles, args=(start_date,))
+    return _read_listing(rows, start_date)
+
+
+@parsing.parser
+def parse_wam_min_articles(html, start_date=None):
+    """The same listing from page text (archived pages; see sources/archive.py)."""
+    return _read_listing(streaming.parse_items(html, "div", "views-row"), start_date)
 
-    for item in items:
+
+def _read_listing(rows, start_date=None):
+    results = []
+    old_in_a_row = 0
+    for item in rows:
         try:
-            media_body = item.select_one("div.media-body")
-            if not media_body:
+            media_body = streaming.find(item, "div", "media-body")
+            if media_body is None:
                 continue
 
-            title_div = media_body.select_one("div.h3 a")
-            if not title_div:
+            title_div = streaming.find(streaming.find(media_body, "div", "h3"), "a")
+            if title_div is None:
                 continue
 
-            title = title_div.text.strip()
-            href = title_div["href"].strip()
+            title = streaming.text(title_div)
+            href = title_div.get("href", "").strip()
             full_url = "https://democrats-waysandmeans.house.gov" + href
 
-            date_div = title_div.find_parent("div").find_next_sibling("div")
-            if not date_div:
+            date_div = streaming.next_sibling(title_div.getparent(), "div")
+            if date_div is None:
                 continue
 
-            raw_date = date_div.text.strip()
+            raw_date = streaming.text(date_div)
             pub_date = datetime.strptime(raw_date, "%B %d, %Y")
 
             if start_date and pub_date.date() < start_date:
+                old_in_a_row += 1
+                if old_in_a_row >= OLD_RUN:
+                    break   # assumes newest first: the rest is older too
                 continue
+            old_in_a_row = 0
 
             results.append({
                 "title": title,
@@ -46,7 +68,8 @@ def fetch_wam_min_articles(start_date=None):
                 "date": pub_date.strftime("%Y-%m-%d")
             })
 
-        except:
+        except Exception:
             continue
 
+    rows.close()    # stopped early: release the connection (and archive what was read) now
     return results
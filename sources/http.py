@@ -0,0 +1,212 @@
+# sources/http.py
+"""
+Polite HTTP for the scrapers.
+
+Every fetcher goes through get() instead of requests.get(), which adds:
+
+  * a timeout on every request (no hung host stalls a load),
+  * a token bucket per host, so a concurrent fan-out never sends more than
+    HTTP_RATE requests/second (burst HTTP_BURST) to one site,
+  * retries with exponential backoff and full jitter on 429 / 5xx and
+    connection errors, honouring Retry-After,
+  * a circuit breaker per host: after HTTP_BREAKER_FAILS failed requests in
+    a row the host is skipped for HTTP_BREAKER_COOLDOWN seconds (then one
+    probe request is let through).
+
+A host that is still failing after its retries returns the last response
+(so callers keep their `status_code != 200` handling); an open breaker or a
+connection error raises, which callers already treat as "no results". The
+registry uses breaker state to serve a source's last good result instead
+(see sources/registry.py).
+
+ENV (optional):
+    HTTP_TIMEOUT            -> seconds per request (default 20)
+    HTTP_RETRIES            -> retries after the first attempt (default 2)
+    HTTP_RATE / HTTP_BURST  -> per-host requests/second and burst (default 2 / 4)
+    HTTP_BREAKER_FAILS      -> failures in a row that open a breaker (default 3)
+    HTTP_BREAKER_COOLDOWN   -> seconds a breaker stays open (default 300)
+"""
+
+from __future__ import annotations
+
+import email.utils
+import os
+import random
+import threading
+import time
+import typing as t
+from urllib.parse import urlsplit
+
+import requests
+import requests.adapters
+
+TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "20"))
+RETRIES = int(os.getenv("HTTP_RETRIES", "2"))
+RATE = float(os.getenv("HTTP_RATE", "2"))
+BURST = float(os.getenv("HTTP_BURST", "4"))
+BREAKER_FAILS = int(os.getenv("HTTP_BREAKER_FAILS", "3"))
+BREAKER_COOLDOWN = float(os.getenv("HTTP_BREAKER_COOLDOWN", "300"))
+
+BACKOFF_BASE = 0.5        # seconds; attempt n waits up to BACKOFF_BASE * 2**n
+BACKOFF_MAX = 20.0
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpen(requests.ConnectionError):
+    """Raised instead of contacting a host whose breaker is open."""
+
+
+# ---- Per-host state ----------------------------------------------------------
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float):
+        self.rate = max(rate, 0.01)
+        self.burst = max(burst, 1.0)
+        self._tokens = self.burst
+        self._at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until one token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._at) * self.rate)
+                self._at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class Breaker:
+    def __init__(self):
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def is_open(self) -> bool:
+        return self.failures >= BREAKER_FAILS and time.monotonic() - self.opened_at < BREAKER_COOLDOWN
+
+    def allow(self) -> bool:
+        """False while open; after the cooldown, lets a single probe through."""
+        with self._lock:
+            if self.failures < BREAKER_FAILS:
+                return True
+            if time.monotonic() - self.opened_at < BREAKER_COOLDOWN or self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            self._probing = False
+            if ok:
+                self.failures = 0
+                return
+            self.failures += 1
+            if self.failures >= BREAKER_FAILS:
+                self.opened_at = time.monotonic()
+
+
+_buckets: dict[str, TokenBucket] = {}
+_breakers: dict[str, Breaker] = {}
+_state_lock = threading.Lock()
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def host_of(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+
+def _bucket(host: str) -> TokenBucket:
+    with _state_lock:
+        b = _buckets.get(host)
+        if b is None:
+            b = _buckets[host] = TokenBucket(RATE, BURST)
+        return b
+
+
+def breaker(host: str) -> Breaker:
+    with _state_lock:
+        b = _breakers.get(host)
+        if b is None:
+            b = _breakers[host] = Breaker()
+        return b
+
+
+def is_healthy(host: str) -> bool:
+    """True unless the host's last request failed or its breaker is open."""
+    b = _breakers.get(host.lower())
+    return b is None or b.failures == 0
+
+
+def session() -> requests.Session:
+    """One keep-alive session shared by every fetcher thread."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            s = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=16)
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            _session = s
+        return _session
+
+
+# ---- Requests ----------------------------------------------------------------
+
+def _retry_after(resp: requests.Response) -> float | None:
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff(attempt: int) -> float:
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def request(method: str, url: str, *, timeout: float | None = None, retries: int | None = None,
+            **kwargs: t.Any) -> requests.Response:
+    host = host_of(url)
+    brk = breaker(host)
+    retries = RETRIES if retries is None else retries
+    kwargs.setdefault("timeout", timeout or TIMEOUT)
+
+    for attempt in range(retries + 1):
+        if not brk.allow():
+            raise CircuitOpen(f"{host}: circuit open after repeated failures")
+        _bucket(host).acquire()
+        try:
+            resp = session().request(method, url, **kwargs)
+        except requests.RequestException:
+            brk.record(False)
+            if attempt >= retries:
+                raise
+            time.sleep(_backoff(attempt))
+            continue
+
+        if resp.status_code not in RETRY_STATUS:
+            brk.record(True)
+            return resp
+        brk.record(False)
+        if attempt >= retries:
+            return resp
+        wait = _retry_after(resp)
+        time.sleep(min(BACKOFF_MAX, wait) if wait is not None else _backoff(attempt))
+    raise AssertionError("unreachable")
+
+
+def get(url: str, **kwargs: t.Any) -> requests.Response:
+    """requests.get() with timeout, per-host rate limit, retries and circuit breaker."""
+    return request("GET", url, **kwargs)
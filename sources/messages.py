@@ -4,14 +4,16 @@ import base64
 import email
 from email.header import decode_header
 from email.utils import parseaddr
-from googleapiclient.discovery import build
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
 
 SCOPES = ['https://www.googleapis.com/auth/gmail.modify']
 
 # log in - stays logged in with token.pickle
 def authenticate():
+    # Google client libraries are heavy; only load them when Gmail is actually used
+    from googleapiclient.discovery import build
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.auth.transport.requests import Request
+
     creds = None
 
     # load credentials if they exist
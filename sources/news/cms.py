@@ -1,4 +1,4 @@
-import requests
+from sources import http, parsing
 from bs4 import BeautifulSoup
 from datetime import datetime
 
@@ -6,11 +6,20 @@ def fetch_cms_articles(start_date=None):
     results = []
     url = "https://www.cms.gov/about-cms/contact/newsroom"
 
-    response = requests.get(url)
+    response = http.get(url)
     if response.status_code != 200:
         return results
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    return {
+        "url": url,
+        "articles": parsing.parse(parse_cms_articles, response.text, start_date),
+    }
+
+
+@parsing.parser
+def parse_cms_articles(html, start_date=None):
+    results = []
+    soup = BeautifulSoup(html, "html.parser")
     items = soup.select("div.views-field.views-field-nothing")
 
     for item in items:
@@ -35,7 +44,4 @@ def fetch_cms_articles(start_date=None):
             "date": pub_date.strftime("%Y-%m-%d")
         })
 
-    return {
-        "url": url,
-        "articles": results,
-    }
+    return results
@@ -1,59 +1,66 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 from datetime import datetime
 
+from sources import http, parsing, strategy
+from sources.browser import chrome, wait_for_css
+
+URL = "https://www.cms.gov/priorities/innovation/models/recent-milestones-updates"
+
+
 def fetch_cms_inov_articles(start_date=None):
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
+    articles = strategy.first_valid("news.cms_inov", [
+        ("http", _fetch_http),
+        ("selenium", _fetch_browser),
+    ], start_date)
+
+    return {
+        "url": URL,
+        "articles": articles,
+    }
 
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
 
-    try:
-        url = "https://www.cms.gov/priorities/innovation/models/recent-milestones-updates"
-        driver.get(url)
+def _fetch_http():
+    response = http.get(URL)
+    response.raise_for_status()
+    return parsing.parse(parse_cms_inov_articles, response.text)
 
-        WebDriverWait(driver, 100).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "milestone-updates__results"))
-        )
 
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        items = soup.select("ul.milestone-updates__results > li.ds-u-display--flex")
+def _fetch_browser():
+    with chrome(headless=True) as driver:
+        driver.get(URL)
+        wait_for_css(driver, ".milestone-updates__results", 100)
+        html = driver.page_source
 
-        results = []
+    return parsing.parse(parse_cms_inov_articles, html)
 
-        for item in items:
-            try:
-                date_tag = item.select_one(".cms-news--desktop-date")
-                title_tag = item.select_one(".cms-news--title p")
-                link_tag = item.select_one(".cms-news--title a")
 
-                if not (date_tag and title_tag and link_tag):
-                    continue
+@parsing.parser
+def parse_cms_inov_articles(html, start_date=None):
+    soup = BeautifulSoup(html, "html.parser")
+    items = soup.select("ul.milestone-updates__results > li.ds-u-display--flex")
 
-                pub_date = datetime.strptime(date_tag.text.strip(), "%Y-%m-%d")
-                if start_date and pub_date.date() < start_date:
-                    continue
+    results = []
 
-                results.append({
-                    "title": title_tag.text.strip(),
-                    "url": link_tag["href"],
-                    "date": pub_date.strftime("%Y-%m-%d"),
-                })
+    for item in items:
+        try:
+            date_tag = item.select_one(".cms-news--desktop-date")
+            title_tag = item.select_one(".cms-news--title p")
+            link_tag = item.select_one(".cms-news--title a")
 
-            except Exception as e:
+            if not (date_tag and title_tag and link_tag):
                 continue
 
-        return {
-            "url": url,
-            "articles": results,
-        }
+            pub_date = datetime.strptime(date_tag.text.strip(), "%Y-%m-%d")
+            if start_date and pub_date.date() < start_date:
+                continue
+
+            results.append({
+                "title": title_tag.text.strip(),
+                "url": link_tag["href"],
+                "date": pub_date.strftime("%Y-%m-%d"),
+            })
+
+        except Exception as e:
+            continue
 
-    finally:
-        driver.quit()
+    return results
@@ -1,62 +1,70 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 from datetime import datetime
 
+from sources import http, parsing, strategy
+from sources.browser import chrome, wait_for_css
+
+URL = "https://www.congress.gov/search?q=%7B%22source%22%3A%22legislation%22%7D"
+
+
 def fetch_congress_articles(start_date=None):
-    url = "https://www.congress.gov/search?q=%7B%22source%22%3A%22legislation%22%7D"
+    articles = strategy.first_valid("news.congress", [
+        ("http", _fetch_http),
+        ("selenium", _fetch_browser),
+    ], start_date)
 
-    options = webdriver.ChromeOptions()
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
+    return {
+        "url": URL,
+        "articles": articles,
+    }
 
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
 
-    try:
-        driver.get(url)
-        WebDriverWait(driver, 100).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "li.expanded"))
-        )
+def _fetch_http():
+    response = http.get(URL)
+    response.raise_for_status()
+    return parsing.parse(parse_congress_articles, response.text)
 
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        items = soup.select("li.expanded")
 
-        results = []
+def _fetch_browser():
+    with chrome(headless=False) as driver:
+        driver.get(URL)
+        wait_for_css(driver, "li.expanded", 100)
+        html = driver.page_source
 
-        for item in items:
-            title_tag = item.select_one("span.result-title")
-            link_tag = item.select_one("span.result-heading a")
-            latest_action_span = next(
-                (span for span in item.select("span.result-item") if "Latest Action:" in span.text), None
-            )
+    return parsing.parse(parse_congress_articles, html)
 
-            if not title_tag or not link_tag or not latest_action_span:
-                continue
 
-            try:
-                action_text = latest_action_span.text.strip()
-                date_part = action_text.split(" - ")[-1].split()[0]
-                pub_date = datetime.strptime(date_part, "%m/%d/%Y")
-            except Exception:
-                continue
+@parsing.parser
+def parse_congress_articles(html, start_date=None):
+    soup = BeautifulSoup(html, "html.parser")
+    items = soup.select("li.expanded")
+
+    results = []
+
+    for item in items:
+        title_tag = item.select_one("span.result-title")
+        link_tag = item.select_one("span.result-heading a")
+        latest_action_span = next(
+            (span for span in item.select("span.result-item") if "Latest Action:" in span.text), None
+        )
+
+        if not title_tag or not link_tag or not latest_action_span:
+            continue
 
-            if start_date and pub_date.date() < start_date:
-                continue
+        try:
+            action_text = latest_action_span.text.strip()
+            date_part = action_text.split(" - ")[-1].split()[0]
+            pub_date = datetime.strptime(date_part, "%m/%d/%Y")
+        except Exception:
+            continue
 
-            results.append({
-                "title": title_tag.text.strip(),
-                "url": "https://www.congress.gov" + link_tag["href"],
-                "date": pub_date.strftime("%Y-%m-%d")
-            })
+        if start_date and pub_date.date() < start_date:
+            continue
 
-        return {
-            "url": url,
-            "articles": results
-        }
+        results.append({
+            "title": title_tag.text.strip(),
+            "url": "https://www.congress.gov" + link_tag["href"],
+            "date": pub_date.strftime("%Y-%m-%d")
+        })
 
-    finally:
-        driver.quit()
+    return results
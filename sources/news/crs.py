@@ -1,72 +1,80 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 from datetime import datetime
 
+from sources import http, parsing, strategy
+from sources.browser import chrome, wait_for_css
+
+URL = "https://www.congress.gov/crs-products"
+
+
 def fetch_crs_articles(start_date=None):
-    options = webdriver.ChromeOptions()
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-
-    try:
-        url = "https://www.congress.gov/crs-products"
-        driver.get(url)  
-      
-        WebDriverWait(driver, 10).until(
-          EC.presence_of_element_located((By.CLASS_NAME, "column-equal"))
-        )
-        
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-
-        containers = soup.select("div.column-equal")
-
-        # Look for the one containing the 'Recent' header
-        recent_div = None
-        for div in containers:
-            if div.find("h2") and div.find("h2").text.strip() == "Recent":
-                recent_div = div
-                break
-
-        if not recent_div:
-            return []
-
-        p_tags = recent_div.find_all("p")
-
-        results = []
-
-        for p in p_tags:
-            try:
-                link = p.find("a")
-                title = p.find("strong")
-                parts = list(p.stripped_strings)
-               
-                if not link or not title or len(parts) < 2:
-                    continue
-
-                date_text = parts[-1].strip()
-                pub_date = datetime.strptime(date_text, "%B %d, %Y")
-                if start_date and pub_date.date() < start_date:
-                    continue
-
-                results.append({
-                    "title": title.text.strip(),
-                    "url": "https://www.congress.gov" + link["href"],
-                    "date": pub_date.strftime("%Y-%m-%d")
-                })
-                
-            except Exception as e:
-              continue
-
-        return {
-            "url": url,
-            "articles": results,
-        }
-
-    finally:
-        driver.quit()
+    articles = strategy.first_valid("news.crs", [
+        ("http", _fetch_http),
+        ("selenium", _fetch_browser),
+    ], start_date)
+
+    return {
+        "url": URL,
+        "articles": articles,
+    }
+
+
+def _fetch_http():
+    response = http.get(URL)
+    response.raise_for_status()
+    return parsing.parse(parse_crs_articles, response.text)
+
+
+def _fetch_browser():
+    with chrome(headless=False) as driver:
+        driver.get(URL)
+        wait_for_css(driver, ".column-equal", 10)
+        html = driver.page_source
+
+    return parsing.parse(parse_crs_articles, html)
+
+
+@parsing.parser
+def parse_crs_articles(html, start_date=None):
+    soup = BeautifulSoup(html, "html.parser")
+
+    containers = soup.select("div.column-equal")
+
+    # Look for the one containing the 'Recent' header
+    recent_div = None
+    for div in containers:
+        if div.find("h2") and div.find("h2").text.strip() == "Recent":
+            recent_div = div
+            break
+
+    if not recent_div:
+        return []
+
+    p_tags = recent_div.find_all("p")
+
+    results = []
+
+    for p in p_tags:
+        try:
+            link = p.find("a")
+            title = p.find("strong")
+            parts = list(p.stripped_strings)
+           
+            if not link or not title or len(parts) < 2:
+                continue
+
+            date_text = parts[-1].strip()
+            pub_date = datetime.strptime(date_text, "%B %d, %Y")
+            if start_date and pub_date.date() < start_date:
+                continue
+
+            results.append({
+                "title": title.text.strip(),
+                "url": "https://www.congress.gov" + link["href"],
+                "date": pub_date.strftime("%Y-%m-%d")
+            })
+            
+        except Exception as e:
+          continue
+
+    return results
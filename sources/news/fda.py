@@ -1,19 +1,34 @@
-import requests
+from sources import feeds, http, parsing, strategy
 from bs4 import BeautifulSoup
 from datetime import datetime
 
+URL = "https://www.fda.gov/news-events/fda-newsroom/press-announcements"
+FEED_URL = "https://www.fda.gov/about-fda/contact-fda/stay-informed/rss-feeds/press-releases/rss.xml"
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
+
+
 def fetch_fda_articles(start_date=None):
-    results = []
-    url = "https://www.fda.gov/news-events/fda-newsroom/press-announcements"
+    articles = strategy.first_valid("news.fda", [
+        ("feed", lambda: feeds.fetch("news.fda", FEED_URL, headers={"User-Agent": USER_AGENT})),
+        ("http", _fetch_page),
+    ], start_date)
+
+    return {
+        "url": URL,
+        "articles": articles,
+    }
 
-    response = requests.get(url, headers={
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
-    })
-    
-    if response.status_code != 200:
-        return results
 
-    soup = BeautifulSoup(response.text, "html.parser")
+def _fetch_page():
+    response = http.get(URL, headers={"User-Agent": USER_AGENT})
+    response.raise_for_status()
+    return parsing.parse(parse_fda_articles, response.text)
+
+
+@parsing.parser
+def parse_fda_articles(html, start_date=None):
+    results = []
+    soup = BeautifulSoup(html, "html.parser")
     items = soup.select("div.views-field.views-field-title span.field-content")
 
     for item in items:
@@ -37,7 +52,4 @@ def fetch_fda_articles(start_date=None):
             "date": pub_date.strftime("%Y-%m-%d")
         })
 
-    return {
-        "url": url,
-        "articles": results,
-    }
+    return results
@@ -1,20 +1,145 @@
+import os
+import re
+from datetime import date, datetime, timedelta
+from urllib.parse import urlencode
+
 import requests
 from bs4 import BeautifulSoup
-from datetime import datetime
+
+from sources import http, parsing
+
+# ENV (optional):
+#   FED_REG_MODE      -> "api" (default) or "html" to skip the JSON API
+#   FED_REG_API_BASE  -> API root, e.g. a local stub (default https://www.federalregister.gov/api/v1)
+MODE = os.getenv("FED_REG_MODE", "api")
+API_BASE = os.getenv("FED_REG_API_BASE", "https://www.federalregister.gov/api/v1").rstrip("/")
+
+PUBLIC_URL = "https://www.federalregister.gov/public-inspection/"
+SEARCH_URL = "https://www.federalregister.gov/public-inspection/search"
+
+AGENCIES = (
+    "agency-for-healthcare-research-and-quality",
+    "centers-for-medicare-medicaid-services",
+    "children-and-families-administration",
+    "defense-department",
+    "drug-enforcement-administration",
+    "employment-standards-administration",
+    "food-and-drug-administration",
+    "health-and-human-services-department",
+    "health-resources-and-services-administration",
+    "internal-revenue-service",
+    "justice-department",
+    "national-institutes-of-health",
+    "occupational-safety-and-health-administration",
+    "substance-abuse-and-mental-health-services-administration",
+    "treasury-department",
+    "centers-for-disease-control-and-prevention",
+)
+
+API_FIELDS = ("document_number", "title", "html_url", "publication_date", "filed_at")
+PER_PAGE = 100
+MAX_PAGES = 10      # per day queried
+MAX_DAYS = 14       # oldest public-inspection day asked for
+
+_DATE_ON = re.compile(r"\bon\s+(\d{1,2}/\d{1,2}/\d{4})")
+
 
 def fetch_federal_register_articles(start_date=None):
+    if MODE == "api":
+        try:
+            articles = fetch_federal_register_api(start_date)
+        except (requests.RequestException, ValueError, KeyError, TypeError):
+            articles = None
+        if articles is not None:
+            return {"url": PUBLIC_URL, "articles": articles}
+
+    return fetch_federal_register_html(start_date)
+
+
+def _api_days(start_date):
+    """Public-inspection days to ask for: start_date..today, or just the current list."""
+    if not start_date:
+        return [None]
+    today = date.today()
+    first = max(start_date, today - timedelta(days=MAX_DAYS))
+    return [first + timedelta(days=n) for n in range((today - first).days + 1)]
+
+
+def fetch_federal_register_api(start_date=None):
+    """
+    Public-inspection documents from the JSON API, with only the fields we
+    show. The server filters by agency and by the day a document was on
+    public inspection. Returns None when the API doesn't answer usefully, so
+    the caller falls back to the HTML page.
+    """
     results = []
-    public_url = "https://www.federalregister.gov/public-inspection/"
-    url = "https://www.federalregister.gov/public-inspection/search?conditions%5Bagencies%5D%5B%5D=agency-for-healthcare-research-and-quality&conditions%5Bagencies%5D%5B%5D=centers-for-medicare-medicaid-services&conditions%5Bagencies%5D%5B%5D=children-and-families-administration&conditions%5Bagencies%5D%5B%5D=defense-department&conditions%5Bagencies%5D%5B%5D=drug-enforcement-administration&conditions%5Bagencies%5D%5B%5D=employment-standards-administration&conditions%5Bagencies%5D%5B%5D=food-and-drug-administration&conditions%5Bagencies%5D%5B%5D=health-and-human-services-department&conditions%5Bagencies%5D%5B%5D=health-resources-and-services-administration&conditions%5Bagencies%5D%5B%5D=internal-revenue-service&conditions%5Bagencies%5D%5B%5D=justice-department&conditions%5Bagencies%5D%5B%5D=national-institutes-of-health&conditions%5Bagencies%5D%5B%5D=occupational-safety-and-health-administration&conditions%5Bagencies%5D%5B%5D=substance-abuse-and-mental-health-services-administration&conditions%5Bagencies%5D%5B%5D=treasury-department&conditions%5Bagencies%5D%5B%5D=centers-for-disease-control-and-prevention"
+    seen = set()
+    url = f"{API_BASE}/public-inspection-documents.json"
+
+    for day in _api_days(start_date):
+        page = 1
+        while page <= MAX_PAGES:
+            params = [("per_page", PER_PAGE), ("page", page)]
+            params += [("fields[]", f) for f in API_FIELDS]
+            params += [("conditions[agencies][]", a) for a in AGENCIES]
+            if day:
+                params.append(("conditions[available_on]", day.isoformat()))
+
+            response = http.get(url, params=params, headers={"Accept": "application/json"})
+            if response.status_code != 200:
+                return None
+            data = response.json()
+
+            for doc in data.get("results") or []:
+                key = doc.get("document_number") or doc.get("html_url")
+                if key in seen:
+                    continue
+                seen.add(key)
 
-    response = requests.get(url, headers={
+                raw_date = doc.get("publication_date") or (doc.get("filed_at") or "")[:10]
+                try:
+                    pub_date = datetime.strptime(raw_date, "%Y-%m-%d")
+                except ValueError:
+                    continue
+                if start_date and pub_date.date() < start_date:
+                    continue
+                if not doc.get("title") or not doc.get("html_url"):
+                    continue
+
+                results.append({
+                    "title": doc["title"].strip(),
+                    "url": doc["html_url"],
+                    "date": pub_date.strftime("%Y-%m-%d")
+                })
+
+            if page >= int(data.get("total_pages") or 1):
+                break
+            page += 1
+
+    return results
+
+
+def fetch_federal_register_html(start_date=None):
+    results = []
+    url = SEARCH_URL + "?" + urlencode([("conditions[agencies][]", a) for a in AGENCIES])
+
+    response = http.get(url, headers={
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"
     })
 
     if response.status_code != 200:
         return results
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    return {
+        "url": PUBLIC_URL,
+        "articles": parsing.parse(parse_federal_register_articles, response.text, start_date),
+    }
+
+
+@parsing.parser
+def parse_federal_register_articles(html, start_date=None):
+    results = []
+    soup = BeautifulSoup(html, "html.parser")
     articles = soup.select("li.search-result-document")
 
     for i, article in enumerate(articles):
@@ -24,19 +149,19 @@ def fetch_federal_register_articles(start_date=None):
 
             if not link_tag:
                 continue
-            
+
             title = link_tag.text.strip()
             url = link_tag["href"]
-            
+
             if not meta_div:
                 continue
 
-            meta_text = meta_div.get_text(strip=True)
-            if "on" not in meta_text:
+            # the last "on MM/DD/YYYY" in the metadata line
+            dates = _DATE_ON.findall(meta_div.get_text(" ", strip=True))
+            if not dates:
                 continue
 
-            date_str = meta_text.split("on")[-1].strip().rstrip(".")
-            pub_date = datetime.strptime(date_str, "%m/%d/%Y")
+            pub_date = datetime.strptime(dates[-1], "%m/%d/%Y")
 
             if start_date and pub_date.date() < start_date:
                 continue
@@ -45,12 +170,9 @@ def fetch_federal_register_articles(start_date=None):
                 "title": title,
                 "url": url,
                 "date": pub_date.strftime("%Y-%m-%d")
-            })          
+            })
 
         except Exception as e:
             continue
 
-    return {
-        "url": public_url,
-        "articles": results,
-    }
+    return results
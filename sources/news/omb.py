@@ -1,73 +1,147 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+import xml.etree.ElementTree as ET
 from bs4 import BeautifulSoup
 from datetime import datetime
+from urllib.parse import parse_qs, urlsplit
+
+from sources import http, parsing, strategy
+from sources.browser import chrome, wait_for_css
+
+URL = "https://www.reginfo.gov/public/jsp/EO/eoDashboard.myjsp?agency_cd=0900&agency_nm=HHS&stage_cd=4&from_page=index.jsp&sub_index=0"
+
+# reginfo.gov's XML report of the rules currently under EO 12866 review
+XML_URL = "https://www.reginfo.gov/public/do/XMLViewFileAction?f=EO_RULES_UNDER_REVIEW.xml"
+
+HHS_AGENCY_PREFIX = "09"    # HHS department and its operating divisions (0900, 0938, 0910, ...)
+
+RULE_URL = "https://www.reginfo.gov/public/do/eAgendaViewRule?RIN={rin}"
+
+
+def rule_url(rin):
+    """The one URL a rule gets from either strategy, so its article id doesn't change."""
+    return RULE_URL.format(rin=rin)
+
+
+def _rin_of(link):
+    """RIN of a dashboard link: its RIN= parameter (the href also carries a pubId), else its text."""
+    rin = parse_qs(urlsplit(link.get("href", "")).query).get("RIN", [""])[0]
+    return (rin or link.get_text(strip=True)).strip()
+
 
 def fetch_omb_articles(start_date=None):
-    url = "https://www.reginfo.gov/public/jsp/EO/eoDashboard.myjsp?agency_cd=0900&agency_nm=HHS&stage_cd=4&from_page=index.jsp&sub_index=0"
+    articles = strategy.first_valid("news.omb", [
+        ("http", _fetch_xml),
+        ("selenium", _fetch_browser),
+    ], start_date)
 
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
+    return {
+        "url": URL,
+        "articles": articles,
+    }
 
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
 
-    try:
-        driver.get(url)
-        WebDriverWait(driver, 100).until(EC.presence_of_element_located((By.CLASS_NAME, "generalTxt")))
+def _fetch_xml():
+    response = http.get(XML_URL)
+    response.raise_for_status()
+    return parsing.parse(parse_omb_xml, response.text)
 
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        tables = soup.select("table.generalTxt")
 
-        results = []
+def _fetch_browser():
+    with chrome(headless=True) as driver:
+        driver.get(URL)
+        wait_for_css(driver, ".generalTxt", 100)
+        html = driver.page_source
 
-        for table in tables:
-            agency_text = table.find("b", string="AGENCY:")
-            if not agency_text:
-                continue
+    return parsing.parse(parse_omb_articles, html)
 
-            agency_cell = agency_text.parent
-            agency_name = agency_cell.get_text(strip=True).replace("AGENCY:", "").strip()
 
-            if not agency_name.startswith("HHS-"):
-                continue
+@parsing.parser
+def parse_omb_xml(xml, start_date=None):
+    root = ET.fromstring(xml.encode("utf-8"))
 
-            title_tag = table.select_one("span.TCJATitle")
-            rin_tag = table.select_one("td a[href*='eAgendaViewRule']")
-            stage_td = next((td for td in table.find_all("td") if "STAGE:" in td.text), None)
-            date_td = next((td for td in table.find_all("td") if "RECEIVED DATE:" in td.text), None)
+    results = []
 
-            if not title_tag or not rin_tag or not date_td or not stage_td:
-                continue
+    for regact in root.iter("REGACT"):
+        agency_code = (regact.findtext("AGENCY_CODE") or "").strip()
+        if not agency_code.startswith(HHS_AGENCY_PREFIX):
+            continue
+
+        rin = (regact.findtext("RIN") or "").strip()
+        title = (regact.findtext("TITLE") or "").strip()
+        stage = (regact.findtext("STAGE") or "").strip()
+        date_str = (regact.findtext("DATE_RECEIVED") or "").strip()
 
+        if not rin or not title or not stage:
+            continue
+
+        pub_date = None
+        for fmt in ("%Y-%m-%d", "%m/%d/%Y"):
             try:
-                date_str = date_td.text.split("RECEIVED DATE:")[-1].strip()
-                pub_date = datetime.strptime(date_str, "%m/%d/%Y")
+                pub_date = datetime.strptime(date_str, fmt)
+                break
             except ValueError:
                 continue
+        if pub_date is None:
+            continue
 
-            if start_date and pub_date.date() < start_date:
-                continue
+        if start_date and pub_date.date() < start_date:
+            continue
+
+        results.append({
+            "title": f"{stage} - {title}",
+            "url": rule_url(rin),
+            "date": pub_date.strftime("%Y-%m-%d")
+        })
+
+    return results
+
+
+@parsing.parser
+def parse_omb_articles(html, start_date=None):
+    soup = BeautifulSoup(html, "html.parser")
+    tables = soup.select("table.generalTxt")
+
+    results = []
+
+    for table in tables:
+        agency_text = table.find("b", string="AGENCY:")
+        if not agency_text:
+            continue
+
+        agency_cell = agency_text.parent
+        agency_name = agency_cell.get_text(strip=True).replace("AGENCY:", "").strip()
+
+        if not agency_name.startswith("HHS-"):
+            continue
+
+        title_tag = table.select_one("span.TCJATitle")
+        rin_tag = table.select_one("td a[href*='eAgendaViewRule']")
+        stage_td = next((td for td in table.find_all("td") if "STAGE:" in td.text), None)
+        date_td = next((td for td in table.find_all("td") if "RECEIVED DATE:" in td.text), None)
+
+        if not title_tag or not rin_tag or not date_td or not stage_td:
+            continue
+
+        try:
+            date_str = date_td.text.split("RECEIVED DATE:")[-1].strip()
+            pub_date = datetime.strptime(date_str, "%m/%d/%Y")
+        except ValueError:
+            continue
+
+        if start_date and pub_date.date() < start_date:
+            continue
 
-            stage = stage_td.text.split("STAGE:")[-1].strip()
-            title = f"{stage} - {title_tag.text.strip()}"
-            article_url = "https://www.reginfo.gov" + rin_tag["href"]
+        rin = _rin_of(rin_tag)
+        if not rin:
+            continue
 
-            results.append({
-                "title": title,
-                "url": article_url,
-                "date": pub_date.strftime("%Y-%m-%d")
-            })
+        stage = stage_td.text.split("STAGE:")[-1].strip()
+        title = f"{stage} - {title_tag.text.strip()}"
+        article_url = rule_url(rin)
 
-        return {
-            "url": url,
-            "articles": results,
-        }
+        results.append({
+            "title": title,
+            "url": article_url,
+            "date": pub_date.strftime("%Y-%m-%d")
+        })
 
-    finally:
-        driver.quit()
+    return results
@@ -1,49 +1,74 @@
-import requests
+from sources import feeds, http, parsing, strategy
 from bs4 import BeautifulSoup
 from datetime import datetime
 
+URL = "https://www.whitehouse.gov/news/"
+FEED_URL = "https://www.whitehouse.gov/news/feed/"
+
+
 def fetch_whitehouse_articles(start_date=None):
+    articles = strategy.first_valid("news.whitehouse", [
+        ("feed", lambda: feeds.fetch("news.whitehouse", FEED_URL)),
+        ("http", lambda: _fetch_pages(start_date)),
+    ], start_date)
+
+    return {
+        "url": URL,
+        "articles": articles,
+    }
+
+
+def _fetch_pages(start_date=None):
     results = []
     page = 1
     keep_going = True
 
     while keep_going and page < 5:
         url = f"https://www.whitehouse.gov/news/page/{page}/"
-        response = requests.get(url)
+        response = http.get(url)
         if response.status_code != 200:
             break
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        items = soup.select("div.wp-block-whitehouse-post-template")
+        items = parsing.parse(parse_whitehouse_page, response.text)
 
         if not items:
             break 
 
         for item in items:
-            title_tag = item.select_one("h2.wp-block-post-title a")
-            date_tag = item.select_one("div.wp-block-post-date")
-
-            if not title_tag or not date_tag:
-                continue
-
-            try:
-                pub_date = datetime.strptime(date_tag.text.strip(), "%B %d, %Y")
-            except ValueError:
-                continue
-
-            if start_date and pub_date.date() < start_date:
+            if start_date and datetime.strptime(item["date"], "%Y-%m-%d").date() < start_date:
                 keep_going = False
                 break
 
-            results.append({
-                "title": title_tag.text.strip(),
-                "url": title_tag["href"],
-                "date": pub_date.strftime("%Y-%m-%d")
-            })
+            results.append(item)
 
         page += 1
 
-    return {
-        "url": url,
-        "articles": results,
-    }
+    return results
+
+
+@parsing.parser
+def parse_whitehouse_page(html):
+    """Every post on one listing page, newest first (the caller stops at start_date)."""
+    results = []
+    soup = BeautifulSoup(html, "html.parser")
+    items = soup.select("div.wp-block-whitehouse-post-template")
+
+    for item in items:
+        title_tag = item.select_one("h2.wp-block-post-title a")
+        date_tag = item.select_one("div.wp-block-post-date")
+
+        if not title_tag or not date_tag:
+            continue
+
+        try:
+            pub_date = datetime.strptime(date_tag.text.strip(), "%B %d, %Y")
+        except ValueError:
+            continue
+
+        results.append({
+            "title": title_tag.text.strip(),
+            "url": title_tag["href"],
+            "date": pub_date.strftime("%Y-%m-%d")
+        })
+
+    return results
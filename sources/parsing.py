@@ -0,0 +1,146 @@
+# sources/parsing.py
+"""
+Listing-page parsing, in-process or in worker processes.
+
+With fetching concurrent, the remaining cost of a load is BeautifulSoup tree
+building and .select() calls: pure-Python CPU work that threads serialize
+on the GIL. Fetchers therefore only do the HTTP part and hand the page text
+to a module-level parse function:
+
+    @parsing.parser
+    def parse_budg_maj_articles(html, start_date=None):
+        ...
+        return results          # [{"title", "url", "date", "tag"?}, ...]
+
+    def fetch_budg_maj_articles(start_date=None):
+        response = http.get(url)
+        ...
+        return parsing.parse(parse_budg_maj_articles, response.text, start_date)
+
+By default parse() just calls the function. With PARSE_WORKERS > 0 it runs
+it in a shared ProcessPoolExecutor instead. Only turn that on where
+scripts/parse_bench.py shows the pool beating in-process parsing: it needs
+spare cores, and every page and its items cross a process boundary.
+
+Workers receive the parser by registered name ("module:function", resolved
+by import in the worker), and send items back as compact tuples in FIELDS
+order. The caller rebuilds the dicts, so fetchers' return values are
+unchanged.
+
+Every page handed to parse() is also kept in the raw-page archive
+(sources/archive.py) for offline re-parsing.
+
+ENV (optional):
+    PARSE_WORKERS   -> parser processes (default 0: parse in-process)
+"""
+
+from __future__ import annotations
+
+import importlib
+import multiprocessing
+import os
+import threading
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from sources import archive
+
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "0"))
+
+FIELDS = ("title", "url", "date", "tag")
+
+_parsers: dict[str, t.Callable[..., list]] = {}
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+_in_worker = False
+
+# set by scripts/parse_bench.py to capture (parser, html, args, kwargs) calls
+recorder: t.Callable[[str, str, tuple, dict], None] | None = None
+
+
+def parser(fn: t.Callable[..., list]) -> t.Callable[..., list]:
+    """Register a module-level parse function so workers can look it up by name."""
+    fn.parser_name = f"{fn.__module__}:{fn.__name__}"
+    _parsers[fn.parser_name] = fn
+    return fn
+
+
+def resolve(name: str) -> t.Callable[..., list]:
+    fn = _parsers.get(name)
+    if fn is None:
+        module, _, attr = name.partition(":")
+        fn = getattr(importlib.import_module(module), attr)
+    return fn
+
+
+def _pack(items: list[dict]) -> list[tuple]:
+    return [tuple(item.get(f) for f in FIELDS) for item in items]
+
+
+def _unpack(rows: list[tuple]) -> list[dict]:
+    out = []
+    for row in rows:
+        item = dict(zip(FIELDS, row))
+        if item["tag"] is None:
+            del item["tag"]
+        out.append(item)
+    return out
+
+
+def _mark_worker() -> None:
+    global _in_worker
+    _in_worker = True
+
+
+def run(name: str, html: str, args: tuple = (), kwargs: dict | None = None) -> list[tuple]:
+    """Worker entry point: parse one page and return packed items."""
+    return _pack(resolve(name)(html, *args, **(kwargs or {})))
+
+
+def _get_pool() -> ProcessPoolExecutor | None:
+    global _pool
+    if PARSE_WORKERS <= 0 or _in_worker:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # spawn: forking a threaded web worker can copy held locks into the child
+            _pool = ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_mark_worker,
+            )
+        return _pool
+
+
+def _reset_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def parse(fn: t.Callable[..., list], html: str, *args, **kwargs) -> list[dict]:
+    """Run a registered parser on page text, in the worker pool if PARSE_WORKERS is set."""
+    name = getattr(fn, "parser_name", None)
+    if name is None:
+        raise ValueError(f"{fn!r} is not registered with @parsing.parser")
+    if recorder is not None:
+        recorder(name, html, args, kwargs)
+    archive.record(name, html, args, kwargs)
+
+    pool = _get_pool()
+    if pool is None:
+        return fn(html, *args, **kwargs)
+    try:
+        rows = pool.submit(run, name, html, args, kwargs).result()
+    except BrokenProcessPool:
+        _reset_pool()
+        return fn(html, *args, **kwargs)
+    return _unpack(rows)
+
+
+def shutdown() -> None:
+    _reset_pool()
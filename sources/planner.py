@@ -0,0 +1,170 @@
+# sources/planner.py
+"""
+Per-source refresh planning from publishing history.
+
+Committees publish at very different rates (Joint Economic about weekly,
+E&C several times a day), so one fixed TTL either refetches quiet sources
+for nothing or serves busy ones stale. The planner learns each source's
+rate from what its fetches return:
+
+  * observe() records, for every item not seen before, when it arrived:
+    the item's own date (noon that day, never in the future), else the time
+    it was first seen. It also records how far back the source has been
+    watched (the start_date of the fetch, or the first fetch).
+  * rate() is items per day over the last WINDOW_DAYS of that history,
+    smoothed so a source that published nothing yet isn't "never".
+  * ttl() is how long a fetched result may be reused before we expect to
+    be missing more than MISS_TARGET new items: MISS_TARGET / rate, clamped
+    to [TTL_MIN, TTL_MAX]. Without history it is the source's registry TTL.
+
+registry.Source.fetch() serves results younger than ttl() from its result
+cache. report() feeds the /production/diagnostics page: rate, TTL, age of
+the cached result and the expected number of items published since.
+
+History is kept per source in .cache/planner/<key>.json.
+
+ENV (optional):
+    PLANNER          -> 0 to turn off result reuse (every load refetches)
+    PLANNER_MISS     -> expected new items a cached result may miss (default 0.1)
+    PLANNER_TTL_MIN  -> shortest TTL in seconds (default 300)
+    PLANNER_TTL_MAX  -> longest TTL in seconds (default 21600)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import threading
+import time
+import typing as t
+from datetime import date, datetime
+
+from features.storage import cache_dir, read_json, write_json
+
+if t.TYPE_CHECKING:
+    from sources.registry import Source
+
+ENABLED = os.getenv("PLANNER", "1") != "0"
+MISS_TARGET = float(os.getenv("PLANNER_MISS", "0.1"))
+TTL_MIN = int(os.getenv("PLANNER_TTL_MIN", "300"))
+TTL_MAX = int(os.getenv("PLANNER_TTL_MAX", "21600"))
+
+WINDOW_DAYS = 28
+HISTORY = 500           # item ids remembered per source
+DAY = 86400.0
+
+_history: dict[str, dict] = {}
+_lock = threading.Lock()
+
+
+def _path(key: str) -> str:
+    return os.path.join(cache_dir("planner"), f"{key}.json")
+
+
+def _load(key: str) -> dict:
+    h = _history.get(key)
+    if h is None:
+        h = read_json(_path(key), None) or {"since": None, "last_fetch": None, "seen": {}}
+        _history[key] = h
+    return h
+
+
+def items_of(value: t.Any) -> list[dict]:
+    """The item list of a fetcher result (a list, or a dict with "articles")."""
+    if isinstance(value, dict):
+        value = value.get("articles") or []
+    return [item for item in value if isinstance(item, dict)] if isinstance(value, list) else []
+
+
+def _item_id(item: dict) -> str:
+    raw = item.get("url") or item.get("title") or ""
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+
+def _arrival(item: dict, now: float) -> float:
+    try:
+        day = datetime.strptime(str(item.get("date", ""))[:10], "%Y-%m-%d")
+    except ValueError:
+        return now
+    return min(now, day.replace(hour=12).timestamp())
+
+
+def _watch_start(args: tuple, now: float) -> float:
+    for arg in args:
+        if isinstance(arg, date):
+            return datetime(arg.year, arg.month, arg.day).timestamp()
+    return now
+
+
+def observe(source: "Source", value: t.Any, args: tuple = (), now: float | None = None) -> None:
+    """Record a successful fetch of `source` (called by the registry)."""
+    now = now or time.time()
+    with _lock:
+        h = _load(source.key)
+        seen: dict[str, float] = h["seen"]
+        for item in items_of(value):
+            seen.setdefault(_item_id(item), _arrival(item, now))
+        if len(seen) > HISTORY:
+            h["seen"] = seen = dict(sorted(seen.items(), key=lambda kv: kv[1])[-HISTORY:])
+        start = _watch_start(args, now)
+        h["since"] = min(h["since"] or start, start, *(seen.values() or [start]))
+        h["last_fetch"] = now
+        snapshot = {"since": h["since"], "last_fetch": now, "seen": dict(seen)}
+    try:
+        write_json(_path(source.key), snapshot)
+    except OSError:
+        pass
+
+
+def rate(key: str, now: float | None = None) -> float | None:
+    """Estimated items per day, or None before the first fetch."""
+    now = now or time.time()
+    with _lock:
+        h = _load(key)
+        if h["since"] is None:
+            return None
+        cutoff = now - WINDOW_DAYS * DAY
+        n = sum(1 for at in h["seen"].values() if at >= cutoff)
+        span = (now - max(h["since"], cutoff)) / DAY
+    return (n + 0.5) / max(span, 1.0)
+
+
+def ttl(source: "Source", now: float | None = None) -> int:
+    """Seconds a fetched result of `source` may be reused (0 when the planner is off)."""
+    if not ENABLED:
+        return 0
+    r = rate(source.key, now)
+    if r is None:
+        return source.fresh_for
+    return int(min(TTL_MAX, max(TTL_MIN, MISS_TARGET / r * DAY)))
+
+
+def report(sources: t.Iterable["Source"], cached_at: t.Callable[[str], float | None],
+           now: float | None = None) -> list[dict]:
+    """One row per source for the diagnostics page."""
+    now = now or time.time()
+    rows = []
+    for s in sources:
+        r = rate(s.key, now)
+        with _lock:
+            h = _load(s.key)
+            last_fetch = h["last_fetch"]
+            known = len(h["seen"])
+        at = cached_at(s.key)
+        age = now - at if at else None
+        expected = r * age / DAY if (r is not None and age is not None) else None
+        rows.append({
+            "key": s.key,
+            "chamber": s.chamber,
+            "name": s.name + (f" ({s.side})" if s.side else ""),
+            "rate": r,
+            "ttl": ttl(s, now),
+            "last_fetch": last_fetch,
+            "known": known,
+            "cache_age": age,
+            "expected_new": expected,
+            "p_missed": 1 - math.exp(-expected) if expected is not None else None,
+            "fresh": age is not None and age < ttl(s, now),
+        })
+    return rows
@@ -0,0 +1,332 @@
+# sources/registry.py
+"""
+Single manifest of every scraper source.
+
+Each entry records what the UI needs (chamber, committee/display name, side)
+and what a scheduler or cache needs (host, fetch mode, expected cost, TTL),
+plus a "module:function" target that is only imported the first time the
+source actually runs. Routes and production adapters read their committee
+maps from here instead of importing all 45 fetcher modules at startup.
+
+    from sources import registry
+    registry.house_committees()   # {"Budget": {"majority": Source, "minority": Source}, ...}
+    registry.senate_committees()  # {"Aging": Source, ...}
+    registry.news_sources()       # {"CMS": Source, ...}
+
+A Source is callable with the same signature as the fetcher it wraps.
+
+Calls go through Source.fetch(), which keeps the last good result per source
+(in memory and under .cache/sources/). When the host's circuit breaker is
+open (sources/http.py), or the fetch fails while the host is unhealthy, that
+last good result is served instead, marked with `stale_since`. fetch_all()
+runs many sources concurrently, longest expected cost first (sources/browser.py
+caps how many of them have a browser open at a time).
+
+SELENIUM sources try plain HTTP first and FEED sources read their RSS/Atom
+feed first (sources/strategy.py, sources/feeds.py); their expected cost
+follows the strategy that worked last time.
+
+A successful result is also reused, for the same arguments, until it is
+older than the source's TTL as learned from its publishing rate
+(sources/planner.py), so quiet committees aren't refetched on every load.
+
+ENV (optional):
+    FETCH_WORKERS    -> sources fetched in parallel (default 8)
+"""
+
+from __future__ import annotations
+
+import copy
+import importlib
+import os
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from features.storage import cache_dir, read_json, write_json
+from sources import http, planner, strategy
+
+HTTP = "http"
+SELENIUM = "selenium"
+FEED = "feed"
+
+# rough wall-clock seconds per fetch, by mode (hints, not limits)
+DEFAULT_COST = {HTTP: 2.0, SELENIUM: 20.0, FEED: 0.5}
+
+# how long a result is worth keeping before re-fetching, by chamber
+DEFAULT_TTL = {"house": 1800, "senate": 1800, "news": 900}
+
+FETCH_WORKERS = int(os.getenv("FETCH_WORKERS", "8"))
+
+
+@dataclass(frozen=True)
+class Source:
+    key: str                    # stable id, e.g. "house.budget_maj"
+    chamber: str                # "house" | "senate" | "news"
+    name: str                   # committee / display name
+    host: str
+    target: str                 # "package.module:function"
+    side: str | None = None     # "majority" | "minority" (House only)
+    mode: str = HTTP            # HTTP, SELENIUM (may need a browser) or FEED (RSS/Atom first)
+    cost: float = 0.0           # expected seconds per fetch (0 -> DEFAULT_COST[mode])
+    ttl: int = 0                # seconds a result stays fresh (0 -> DEFAULT_TTL[chamber])
+
+    @property
+    def expected_cost(self) -> float:
+        mode = strategy.last(self.key) or self.mode
+        return self.cost or DEFAULT_COST.get(mode, DEFAULT_COST[HTTP])
+
+    @property
+    def fresh_for(self) -> int:
+        return self.ttl or DEFAULT_TTL.get(self.chamber, 900)
+
+    def load(self) -> t.Callable[..., dict]:
+        """Import the fetcher module (first call only) and return the function."""
+        fn = _loaded.get(self.key)
+        if fn is None:
+            with _load_lock:
+                fn = _loaded.get(self.key)
+                if fn is None:
+                    module, _, attr = self.target.partition(":")
+                    fn = _loaded[self.key] = getattr(importlib.import_module(module), attr)
+        return fn
+
+    def fetch(self, *args, **kwargs) -> "Fetched":
+        """Run the fetcher, falling back to the last good result if the host is failing."""
+        cached = _cached(self, args, kwargs)
+        if cached is not None:
+            return Fetched(self, cached, from_cache=True)
+        if http.breaker(self.host.lower()).is_open():
+            return _stale(self, "circuit open")
+        try:
+            value = self.load()(*args, **kwargs)
+        except Exception as e:
+            return _stale(self, str(e) or type(e).__name__, cause=e)
+        if not value and not http.is_healthy(self.host):
+            # fetchers return an empty result on a bad status; don't let that replace good data
+            return _stale(self, "host failing", empty=value)
+        _remember(self, value)
+        _cache(self, args, kwargs, value)
+        planner.observe(self, value, args)
+        return Fetched(self, value)
+
+    def __call__(self, *args, **kwargs) -> dict:
+        return self.fetch(*args, **kwargs).value
+
+
+@dataclass
+class Fetched:
+    source: Source
+    value: t.Any
+    stale_since: float | None = None    # epoch seconds of the result served, when not fresh
+    error: str = ""
+    from_cache: bool = False            # reused within the planner's TTL, not refetched
+
+
+_loaded: dict[str, t.Callable[..., dict]] = {}
+_load_lock = threading.Lock()
+
+_last_good: dict[str, dict] = {}
+_last_good_lock = threading.Lock()
+
+
+_results: dict[tuple, tuple[float, t.Any]] = {}
+_results_lock = threading.Lock()
+
+
+def _call_key(source: Source, args: tuple, kwargs: dict) -> tuple:
+    return (source.key, repr(args), repr(sorted(kwargs.items())))
+
+
+def _cached(source: Source, args: tuple, kwargs: dict) -> t.Any:
+    """A copy of a result for the same call that is still within the source's TTL."""
+    with _results_lock:
+        hit = _results.get(_call_key(source, args, kwargs))
+    if hit is None or time.time() - hit[0] >= planner.ttl(source):
+        return None
+    return copy.deepcopy(hit[1])
+
+
+def _cache(source: Source, args: tuple, kwargs: dict, value: t.Any) -> None:
+    with _results_lock:
+        # one entry per source and arguments; drop this source's other calls
+        for k in [k for k in _results if k[0] == source.key]:
+            del _results[k]
+        _results[_call_key(source, args, kwargs)] = (time.time(), copy.deepcopy(value))
+
+
+def cached_at(key: str) -> float | None:
+    """When the cached result of `key` was fetched (None if nothing is cached)."""
+    with _results_lock:
+        times = [at for k, (at, _v) in _results.items() if k[0] == key]
+    return max(times) if times else None
+
+
+def clear_cache() -> None:
+    """Forget reusable results so the next load refetches every source."""
+    with _results_lock:
+        _results.clear()
+
+
+def _last_good_path(key: str) -> str:
+    return f"{cache_dir('sources')}/{key}.json"
+
+
+def _remember(source: Source, value: t.Any) -> None:
+    entry = {"at": time.time(), "value": value}
+    with _last_good_lock:
+        _last_good[source.key] = entry
+    try:
+        write_json(_last_good_path(source.key), entry)
+    except Exception:
+        pass
+
+
+def _stale(source: Source, error: str, cause: Exception | None = None, empty: t.Any = None) -> Fetched:
+    with _last_good_lock:
+        entry = _last_good.get(source.key)
+    if entry is None:
+        entry = read_json(_last_good_path(source.key))
+        if entry:
+            with _last_good_lock:
+                _last_good.setdefault(source.key, entry)
+    if entry:
+        return Fetched(source, entry["value"], stale_since=entry["at"], error=error)
+    if cause is not None:
+        raise cause
+    if empty is not None:
+        return Fetched(source, empty, error=error)
+    raise http.CircuitOpen(f"{source.host}: {error}")
+
+SOURCES: list[Source] = []
+_by_key: dict[str, Source] = {}
+
+
+def register(source: Source) -> Source:
+    if source.key in _by_key:
+        raise ValueError(f"Duplicate source key: {source.key}")
+    SOURCES.append(source)
+    _by_key[source.key] = source
+    return source
+
+
+def _house(name: str, stem: str, fn: str, maj_host: str, min_host: str, **kw) -> None:
+    for side, suffix, host in (("majority", "maj", maj_host), ("minority", "min", min_host)):
+        register(Source(
+            key=f"house.{stem}_{suffix}",
+            chamber="house",
+            name=name,
+            side=side,
+            host=host,
+            target=f"sources.house.{stem}_{suffix}:fetch_{fn}_{suffix}_articles",
+            **kw,
+        ))
+
+
+def _senate(name: str, stem: str, fn: str, host: str, **kw) -> None:
+    register(Source(
+        key=f"senate.{stem}",
+        chamber="senate",
+        name=name,
+        host=host,
+        target=f"sources.senate.{stem}:fetch_{fn}_articles",
+        **kw,
+    ))
+
+
+def _news(name: str, stem: str, fn: str, host: str, **kw) -> None:
+    register(Source(
+        key=f"news.{stem}",
+        chamber="news",
+        name=name,
+        host=host,
+        target=f"sources.news.{stem}:{fn}",
+        **kw,
+    ))
+
+
+# ---- Manifest (order is display order) ------------------------------------------
+
+_house("Appropriations", "appropriations", "appr", "appropriations.house.gov", "democrats-appropriations.house.gov")
+_house("Budget", "budget", "budg", "budget.house.gov", "democrats-budget.house.gov")
+_house("Education and Workforce", "education_and_workforce", "eaw", "edworkforce.house.gov", "democrats-edworkforce.house.gov")
+_house("Energy and Commerce (E&C)", "energy_and_commerce", "eac", "energycommerce.house.gov", "democrats-energycommerce.house.gov")
+_house("Homeland Security", "homeland", "home", "homeland.house.gov", "democrats-homeland.house.gov")
+_house("Joint Economic", "joint_economic", "jec", "www.jec.senate.gov", "www.jec.senate.gov")
+_house("Judiciary", "judiciary", "jud", "judiciary.house.gov", "democrats-judiciary.house.gov")
+_house("Natural Resources", "natural_resources", "natr", "naturalresources.house.gov", "democrats-naturalresources.house.gov")
+_house("Oversight", "oversight", "ovs", "oversight.house.gov", "oversightdemocrats.house.gov")
+_house("Rules", "rules", "rul", "rules.house.gov", "democrats-rules.house.gov")
+_house("Small Business", "small_business", "smb", "smallbusiness.house.gov", "democrats-smallbusiness.house.gov")
+_house("Veterans Affairs", "veterans", "vet", "veterans.house.gov", "democrats-veterans.house.gov")
+_house("Ways and Means", "ways_and_means", "wam", "waysandmeans.house.gov", "democrats-waysandmeans.house.gov")
+
+_senate("Aging", "aging", "age", "www.aging.senate.gov")
+_senate("Appropriations", "appropriations", "appr", "www.appropriations.senate.gov")
+_senate("Budget", "budget", "budg", "www.budget.senate.gov")
+_senate("Finance", "finance", "fin", "www.finance.senate.gov")
+_senate("Health, Education, Labor & Pensions (HELP)", "help", "help", "www.help.senate.gov")
+_senate("Homeland Security and Governmental Affairs (Oversight)", "homeland", "home", "www.hsgac.senate.gov")
+_senate("Indian Affairs", "indian", "ind", "www.indian.senate.gov")
+_senate("Judiciary", "judiciary", "jud", "www.judiciary.senate.gov")
+_senate("Veterans Affairs", "veterans", "vet", "www.veterans.senate.gov")
+_senate("Small Business", "small_business", "smb", "www.sbc.senate.gov")
+
+_news("CMS", "cms", "fetch_cms_articles", "www.cms.gov")
+_news("CMS Innovation Center", "cms_inov", "fetch_cms_inov_articles", "www.cms.gov", mode=SELENIUM)
+_news("CRS", "crs", "fetch_crs_articles", "www.congress.gov", mode=SELENIUM)
+_news("Congress", "congress", "fetch_congress_articles", "www.congress.gov", mode=SELENIUM)
+_news("FDA", "fda", "fetch_fda_articles", "www.fda.gov", mode=FEED)
+_news("Federal Register Public Inspection Desk", "fed_reg", "fetch_federal_register_articles", "www.federalregister.gov")
+_news("HHS", "hhs", "fetch_hhs_articles", "www.hhs.gov", mode=SELENIUM)
+_news("OMB First Glance Rulemaking", "omb", "fetch_omb_articles", "www.reginfo.gov", mode=SELENIUM)
+_news("White House", "whitehouse", "fetch_whitehouse_articles", "www.whitehouse.gov", mode=FEED)
+
+
+# ---- Lookups -----------------------------------------------------------------
+
+def get(key: str) -> Source:
+    return _by_key[key]
+
+
+def fetch_all(sources: t.Iterable[Source], *args, workers: int | None = None,
+              **kwargs) -> "dict[str, Fetched | Exception]":
+    """
+    Fetch many sources concurrently -> {source.key: Fetched or the exception}.
+    Slow sources start first so they don't end up alone at the tail.
+    """
+    sources = sorted(sources, key=lambda s: s.expected_cost, reverse=True)
+    if not sources:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers or FETCH_WORKERS, len(sources)))) as pool:
+        futures = {s.key: pool.submit(s.fetch, *args, **kwargs) for s in sources}
+    out: dict[str, Fetched | Exception] = {}
+    for key, fut in futures.items():
+        try:
+            out[key] = fut.result()
+        except Exception as e:
+            out[key] = e
+    return out
+
+
+def by_chamber(chamber: str) -> list[Source]:
+    return [s for s in SOURCES if s.chamber == chamber]
+
+
+def house_committees() -> "OrderedDict[str, dict[str, Source]]":
+    """{committee: {"majority": Source, "minority": Source}} in display order."""
+    out: OrderedDict[str, dict[str, Source]] = OrderedDict()
+    for s in by_chamber("house"):
+        out.setdefault(s.name, {})[s.side or "majority"] = s
+    return out
+
+
+def senate_committees() -> "OrderedDict[str, Source]":
+    return OrderedDict((s.name, s) for s in by_chamber("senate"))
+
+
+def news_sources() -> "OrderedDict[str, Source]":
+    return OrderedDict((s.name, s) for s in by_chamber("news"))
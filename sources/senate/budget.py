@@ -1,4 +1,4 @@
-import requests
+from sources import http, parsing
 from bs4 import BeautifulSoup
 from datetime import datetime
 from dateutil import parser
@@ -8,85 +8,95 @@ def fetch_budg_articles(start_date=None):
     results = []
 
     def parse_press(url, tag):
-        response = requests.get(url)
+        response = http.get(url)
         if response.status_code != 200:
             return []
-        soup = BeautifulSoup(response.text, "html.parser")
-        rows = soup.select("table#browser_table tr")
-        items = []
+        return parsing.parse(parse_budg_press, response.text, base_url, tag, start_date)
 
-        for row in rows:
-            date_tag = row.select_one("td.date time")
-            link_tag = row.select_one("td a")
+    def parse_hearings():
+        url = base_url + "/hearings"
+        response = http.get(url)
+        if response.status_code != 200:
+            return []
+        return parsing.parse(parse_budg_hearings, response.text, base_url, start_date)
 
-            if not date_tag or not link_tag:
-                continue
+    results += parse_press("https://www.budget.senate.gov/chairman/newsroom/press/table/", "majority")
+    results += parse_press("https://www.budget.senate.gov/ranking-member/newsroom/press/table/", "minority")
+    results += parse_hearings()
 
-            try:
-                pub_date = datetime.strptime(date_tag["datetime"], "%Y-%m-%d")
-            except ValueError:
-                continue
+    return {
+        "base_url": base_url,
+        "articles": results,
+    }
 
-            if start_date and pub_date.date() < start_date:
-                continue
 
-            title = link_tag.get_text(strip=True)
-            url = link_tag["href"].strip()
-            if not url.startswith("http"):
-                url = base_url + url
+@parsing.parser
+def parse_budg_press(html, base_url, tag, start_date=None):
+    soup = BeautifulSoup(html, "html.parser")
+    rows = soup.select("table#browser_table tr")
+    items = []
 
-            items.append({
-                "title": title,
-                "url": url,
-                "date": pub_date.date() if pub_date.time().isoformat() == "00:00:00" else pub_date,
-                "tag": tag,
-            })
+    for row in rows:
+        date_tag = row.select_one("td.date time")
+        link_tag = row.select_one("td a")
 
-        return items
+        if not date_tag or not link_tag:
+            continue
 
-    def parse_hearings():
-        url = base_url + "/hearings"
-        response = requests.get(url)
-        if response.status_code != 200:
-            return []
-        soup = BeautifulSoup(response.text, "html.parser")
-        rows = soup.select("tr.vevent")
-        items = []
+        try:
+            pub_date = datetime.strptime(date_tag["datetime"], "%Y-%m-%d")
+        except ValueError:
+            continue
 
-        for row in rows:
-            title_tag = row.select_one("a.url.summary")
-            date_tag = row.select_one("time.dtstart")
+        if start_date and pub_date.date() < start_date:
+            continue
 
-            if not title_tag or not date_tag:
-                continue
+        title = link_tag.get_text(strip=True)
+        url = link_tag["href"].strip()
+        if not url.startswith("http"):
+            url = base_url + url
 
-            try:
-                pub_date = parser.isoparse(date_tag["datetime"])
-            except ValueError:
-                continue
+        items.append({
+            "title": title,
+            "url": url,
+            "date": pub_date.date() if pub_date.time().isoformat() == "00:00:00" else pub_date,
+            "tag": tag,
+        })
 
-            if start_date and pub_date.date() < start_date:
-                continue
+    return items
 
-            title = title_tag.get_text(strip=True)
-            url = title_tag["href"].strip()
-            if not url.startswith("http"):
-                url = base_url + url
 
-            items.append({
-                "title": title,
-                "url": url,
-                "date": pub_date,
-                "tag": "hearing",
-            })
+@parsing.parser
+def parse_budg_hearings(html, base_url, start_date=None):
+    soup = BeautifulSoup(html, "html.parser")
+    rows = soup.select("tr.vevent")
+    items = []
 
-        return items
+    for row in rows:
+        title_tag = row.select_one("a.url.summary")
+        date_tag = row.select_one("time.dtstart")
 
-    results += parse_press("https://www.budget.senate.gov/chairman/newsroom/press/table/", "majority")
-    results += parse_press("https://www.budget.senate.gov/ranking-member/newsroom/press/table/", "minority")
-    results += parse_hearings()
+        if not title_tag or not date_tag:
+            continue
 
-    return {
-        "base_url": base_url,
-        "articles": results,
-    }
+        try:
+            pub_date = parser.isoparse(date_tag["datetime"])
+        except ValueError:
+            continue
+
+        if start_date and pub_date.date() < start_date:
+            continue
+
+        title = title_tag.get_text(strip=True)
+        url = title_tag["href"].strip()
+        if not url.startswith("http"):
+            url = base_url + url
+
+        items.append({
+            "title": title,
+            "url": url,
+            "date": pub_date,
+            "tag": "hearing",
+        })
+
+    return items
@@ -1,4 +1,4 @@
-import requests
+from sources import http, parsing
 from bs4 import BeautifulSoup
 from datetime import datetime
 
@@ -7,90 +7,98 @@ def fetch_ind_articles(start_date=None):
     results = []
 
     def parse_section(url, tag):
-        response = requests.get(url)
+        response = http.get(url)
         if response.status_code != 200:
             return []
+        return parsing.parse(parse_ind_section, response.text, base_url, tag, start_date)
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        articles = soup.select("div.jet-listing-grid__item")
-        items = []
+    def parse_hearings():
+        url = base_url + "/hearings"
+        response = http.get(url)
+        if response.status_code != 200:
+            return []
+        return parsing.parse(parse_ind_hearings, response.text, base_url, start_date)
+    
+    results += parse_section(base_url + "/newsroom/republican-news", "majority")
+    results += parse_section(base_url + "/newsroom/democratic-news", "minority")
+    results += parse_hearings()
 
-        for article in articles:
-            date_tag = article.select_one("div.jet-listing-dynamic-field__content")
-            title_tag = article.select_one("div.elementor-heading-title a")
+    return {
+        "base_url": base_url,
+        "articles": results,
+    }
 
-            if not date_tag or not title_tag:
-                continue
 
-            try:
-                pub_date = datetime.strptime(date_tag.get_text(strip=True), "%B %d, %Y")
-            except ValueError:
-                continue
+@parsing.parser
+def parse_ind_section(html, base_url, tag, start_date=None):
+    soup = BeautifulSoup(html, "html.parser")
+    articles = soup.select("div.jet-listing-grid__item")
+    items = []
 
-            if start_date and pub_date.date() < start_date:
-                continue
+    for article in articles:
+        date_tag = article.select_one("div.jet-listing-dynamic-field__content")
+        title_tag = article.select_one("div.elementor-heading-title a")
 
-            title = title_tag.get_text(strip=True)
-            url = title_tag["href"].strip()
-            if not url.startswith("http"):
-                url = base_url + url
+        if not date_tag or not title_tag:
+            continue
 
-            items.append({
-                "title": title,
-                "url": url,
-                "date": pub_date.date() if pub_date.time().isoformat() == "00:00:00" else pub_date,
-                "tag": tag,
-            })
+        try:
+            pub_date = datetime.strptime(date_tag.get_text(strip=True), "%B %d, %Y")
+        except ValueError:
+            continue
 
-        return items
+        if start_date and pub_date.date() < start_date:
+            continue
 
-    def parse_hearings():
-        url = base_url + "/hearings"
-        response = requests.get(url)
-        if response.status_code != 200:
-            return []
+        title = title_tag.get_text(strip=True)
+        url = title_tag["href"].strip()
+        if not url.startswith("http"):
+            url = base_url + url
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        hearings = soup.select("div.jet-listing-grid__item")
-        items = []
+        items.append({
+            "title": title,
+            "url": url,
+            "date": pub_date.date() if pub_date.time().isoformat() == "00:00:00" else pub_date,
+            "tag": tag,
+        })
 
-        for hearing in hearings:
-            date_tag = hearing.select_one("div.jet-listing-dynamic-field__content")
-            title_tag = hearing.select_one("div.elementor-heading-title a")
+    return items
 
-            if not date_tag or not title_tag:
-                continue
 
+@parsing.parser
+def parse_ind_hearings(html, base_url, start_date=None):
+    soup = BeautifulSoup(html, "html.parser")
+    hearings = soup.select("div.jet-listing-grid__item")
+    items = []
+
+    for hearing in hearings:
+        date_tag = hearing.select_one("div.jet-listing-dynamic-field__content")
+        title_tag = hearing.select_one("div.elementor-heading-title a")
+
+        if not date_tag or not title_tag:
+            continue
+
+        try:
+            pub_date = datetime.strptime(date_tag.get_text(strip=True), "%B %d, %Y at %I:%M %p")
+        except ValueError:
             try:
-                pub_date = datetime.strptime(date_tag.get_text(strip=True), "%B %d, %Y at %I:%M %p")
+                pub_date = datetime.strptime(date_tag.get_text(strip=True), "%B %d, %Y")
             except ValueError:
-                try:
-                    pub_date = datetime.strptime(date_tag.get_text(strip=True), "%B %d, %Y")
-                except ValueError:
-                    continue
-
-            if start_date and pub_date.date() < start_date:
                 continue
 
-            title = title_tag.get_text(strip=True)
-            url = title_tag["href"].strip()
-            if not url.startswith("http"):
-                url = base_url + url
+        if start_date and pub_date.date() < start_date:
+            continue
 
-            items.append({
-                "title": title,
-                "url": url,
-                "date": pub_date,
-                "tag": "hearing",
-            })
+        title = title_tag.get_text(strip=True)
+        url = title_tag["href"].strip()
+        if not url.startswith("http"):
+            url = base_url + url
 
-        return items
-    
-    results += parse_section(base_url + "/newsroom/republican-news", "majority")
-    results += parse_section(base_url + "/newsroom/democratic-news", "minority")
-    results += parse_hearings()
+        items.append({
+            "title": title,
+            "url": url,
+            "date": pub_date,
+            "tag": "hearing",
+        })
 
-    return {
-        "base_url": base_url,
-        "articles": results,
-    }
+    return items
@@ -1,4 +1,4 @@
-import requests
+from sources import http, parsing
 from bs4 import BeautifulSoup
 from datetime import datetime
 from zoneinfo import ZoneInfo
@@ -8,84 +8,94 @@ def fetch_jud_articles(start_date=None):
     results = []
 
     def parse_news(url, tag):
-        response = requests.get(url)
+        response = http.get(url)
         if response.status_code != 200:
             return []
-        soup = BeautifulSoup(response.text, "html.parser")
-        items = []
+        return parsing.parse(parse_jud_news, response.text, base_url, tag, start_date)
 
-        for li in soup.select("li.PageList__item"):
-            date_tag = li.select_one("p.Heading--time")
-            link_tag = li.select_one("a.ArticleBlockLink")
-            title_tag = link_tag.select_one("h2") if link_tag else None
+    def parse_hearings():
+        url = base_url + "/committee-activity/hearings"
+        response = http.get(url)
+        if response.status_code != 200:
+            return []
+        return parsing.parse(parse_jud_hearings, response.text, base_url, start_date)
 
-            if not date_tag or not link_tag or not title_tag:
-                continue
+    results += parse_news("https://www.judiciary.senate.gov/press/majority?expanded=true", "majority")
+    results += parse_news("https://www.judiciary.senate.gov/press/minority?expanded=true", "minority")
+    results += parse_hearings()
 
-            try:
-                pub_date = datetime.strptime(date_tag.get_text(strip=True), "%m.%d.%Y")
-            except ValueError:
-                continue
+    return {
+        "base_url": base_url,
+        "articles": results,
+    }
 
-            if start_date and pub_date.date() < start_date:
-                continue
 
-            url = link_tag["href"].strip()
-            if not url.startswith("http"):
-                url = base_url + url
+@parsing.parser
+def parse_jud_news(html, base_url, tag, start_date=None):
+    soup = BeautifulSoup(html, "html.parser")
+    items = []
 
-            items.append({
-                "title": title_tag.get_text(strip=True),
-                "url": url,
-                "date": pub_date.date() if pub_date.time().isoformat() == "00:00:00" else pub_date,
-                "tag": tag,
-            })
+    for li in soup.select("li.PageList__item"):
+        date_tag = li.select_one("p.Heading--time")
+        link_tag = li.select_one("a.ArticleBlockLink")
+        title_tag = link_tag.select_one("h2") if link_tag else None
 
-        return items
+        if not date_tag or not link_tag or not title_tag:
+            continue
 
-    def parse_hearings():
-        url = base_url + "/committee-activity/hearings"
-        response = requests.get(url)
-        if response.status_code != 200:
-            return []
-        soup = BeautifulSoup(response.text, "html.parser")
-        items = []
+        try:
+            pub_date = datetime.strptime(date_tag.get_text(strip=True), "%m.%d.%Y")
+        except ValueError:
+            continue
 
-        for div in soup.select("div.LegislationList__item"):
-            title_tag = div.select_one("a.LegislationList__title")
-            time_tag = div.select_one("div.LegislationList__colDate time")
+        if start_date and pub_date.date() < start_date:
+            continue
 
-            if not title_tag or not time_tag:
-                continue
+        url = link_tag["href"].strip()
+        if not url.startswith("http"):
+            url = base_url + url
 
-            try:
-                utc_dt = datetime.strptime(time_tag["datetime"], "%Y-%m-%dT%H:%M:%SZ")
-                utc_dt = utc_dt.replace(tzinfo=ZoneInfo("UTC"))
-                pub_date = utc_dt.astimezone(ZoneInfo("America/New_York"))
-            except ValueError:
-                continue
+        items.append({
+            "title": title_tag.get_text(strip=True),
+            "url": url,
+            "date": pub_date.date() if pub_date.time().isoformat() == "00:00:00" else pub_date,
+            "tag": tag,
+        })
 
-            if start_date and pub_date.date() < start_date:
-                continue
+    return items
 
-            url = title_tag["href"].strip()
-            if not url.startswith("http"):
-                url = base_url + url
 
-            items.append({
-                "title": title_tag.get_text(strip=True),
-                "url": url,
-                "date": pub_date,
-                "tag": "hearing",
-            })
+@parsing.parser
+def parse_jud_hearings(html, base_url, start_date=None):
+    soup = BeautifulSoup(html, "html.parser")
+    items = []
 
-        return items
+    for div in soup.select("div.LegislationList__item"):
+        title_tag = div.select_one("a.LegislationList__title")
+        time_tag = div.select_one("div.LegislationList__colDate time")
 
-    results += parse_news("https://www.judiciary.senate.gov/press/majority?expanded=true", "majority")
-    results += parse_news("https://www.judiciary.senate.gov/press/minority?expanded=true", "minority")
-    results += parse_hearings()
+        if not title_tag or not time_tag:
+            continue
 
-    return {
-        "base_url": base_url,
-        "articles": results,
-    }
+        try:
+            utc_dt = datetime.strptime(time_tag["datetime"], "%Y-%m-%dT%H:%M:%SZ")
+            utc_dt = utc_dt.replace(tzinfo=ZoneInfo("UTC"))
+            pub_date = utc_dt.astimezone(ZoneInfo("America/New_York"))
+        except ValueError:
+            continue
+
+        if start_date and pub_date.date() < start_date:
+            continue
+
+        url = title_tag["href"].strip()
+        if not url.startswith("http"):
+            url = base_url + url
+
+        items.append({
+            "title": title_tag.get_text(strip=True),
+            "url": url,
+            "date": pub_date,
+            "tag": "hearing",
+        })
+
+    return items
@@ -1,4 +1,4 @@
-import requests
+from sources import http, parsing
 from bs4 import BeautifulSoup
 from datetime import datetime
 
@@ -7,92 +7,100 @@ def fetch_smb_articles(start_date=None):
     results = []
 
     def parse_news(url, tag):
-        response = requests.get(url)
+        response = http.get(url)
         if response.status_code != 200:
             return []
+        return parsing.parse(parse_smb_news, response.text, base_url, tag, start_date)
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        rows = soup.select("table.table.recordList tbody tr")
-        items = []
+    def parse_hearings():
+        url = "https://www.sbc.senate.gov/public/index.cfm/hearings"
+        response = http.get(url)
+        if response.status_code != 200:
+            return []
+        return parsing.parse(parse_smb_hearings, response.text, base_url, start_date)
 
-        for row in rows:
-            date_tag = row.select_one("td.recordListDate")
-            link_tag = row.select_one("td.recordListTitle a")
+    results += parse_news("https://www.sbc.senate.gov/public/index.cfm/republicanpressreleases", "majority")
+    results += parse_news("https://www.sbc.senate.gov/public/index.cfm/democraticpressreleases", "minority")
+    results += parse_hearings()
 
-            if not date_tag or not link_tag:
-                continue
+    return {
+        "base_url": base_url,
+        "articles": results,
+    }
 
-            try:
-                pub_date = datetime.strptime(date_tag.get_text(strip=True), "%m/%d/%y")
-            except ValueError:
-                continue
 
-            if start_date and pub_date.date() < start_date:
-                continue
+@parsing.parser
+def parse_smb_news(html, base_url, tag, start_date=None):
+    soup = BeautifulSoup(html, "html.parser")
+    rows = soup.select("table.table.recordList tbody tr")
+    items = []
 
-            title = link_tag.get_text(strip=True)
-            url = link_tag["href"].strip()
-            if not url.startswith("http"):
-                url = base_url + url
+    for row in rows:
+        date_tag = row.select_one("td.recordListDate")
+        link_tag = row.select_one("td.recordListTitle a")
 
-            items.append({
-                "title": title,
-                "url": url,
-                "date": pub_date.date() if pub_date.time().isoformat() == "00:00:00" else pub_date,
-                "tag": tag,
-            })
+        if not date_tag or not link_tag:
+            continue
 
-        return items
+        try:
+            pub_date = datetime.strptime(date_tag.get_text(strip=True), "%m/%d/%y")
+        except ValueError:
+            continue
 
-    def parse_hearings():
-        url = "https://www.sbc.senate.gov/public/index.cfm/hearings"
-        response = requests.get(url)
-        if response.status_code != 200:
-            return []
+        if start_date and pub_date.date() < start_date:
+            continue
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        rows = soup.select("table.table.recordList tbody tr")
-        items = []
+        title = link_tag.get_text(strip=True)
+        url = link_tag["href"].strip()
+        if not url.startswith("http"):
+            url = base_url + url
 
-        for row in rows:
-            date_tag = row.select_one("td.recordListDate")
-            time_tag = row.select_one("td.recordListTime")
-            link_tag = row.select_one("td.recordListTitle a")
+        items.append({
+            "title": title,
+            "url": url,
+            "date": pub_date.date() if pub_date.time().isoformat() == "00:00:00" else pub_date,
+            "tag": tag,
+        })
 
-            if not date_tag or not link_tag:
-                continue
+    return items
 
-            date_str = date_tag.get_text(strip=True)
-            time_str = time_tag.get_text(strip=True) if time_tag else "12:00 AM"
-            dt_str = f"{date_str} {time_str}"
 
-            try:
-                pub_date = datetime.strptime(dt_str, "%m/%d/%y %I:%M %p")
-            except ValueError:
-                continue
+@parsing.parser
+def parse_smb_hearings(html, base_url, start_date=None):
+    soup = BeautifulSoup(html, "html.parser")
+    rows = soup.select("table.table.recordList tbody tr")
+    items = []
 
-            if start_date and pub_date.date() < start_date:
-                continue
+    for row in rows:
+        date_tag = row.select_one("td.recordListDate")
+        time_tag = row.select_one("td.recordListTime")
+        link_tag = row.select_one("td.recordListTitle a")
 
-            title = link_tag.get_text(strip=True)
-            url = link_tag["href"].strip()
-            if not url.startswith("http"):
-                url = base_url + url
+        if not date_tag or not link_tag:
+            continue
 
-            items.append({
-                "title": title,
-                "url": url,
-                "date": pub_date,
-                "tag": "hearing",
-            })
+        date_str = date_tag.get_text(strip=True)
+        time_str = time_tag.get_text(strip=True) if time_tag else "12:00 AM"
+        dt_str = f"{date_str} {time_str}"
 
-        return items
+        try:
+            pub_date = datetime.strptime(dt_str, "%m/%d/%y %I:%M %p")
+        except ValueError:
+            continue
 
-    results += parse_news("https://www.sbc.senate.gov/public/index.cfm/republicanpressreleases", "majority")
-    results += parse_news("https://www.sbc.senate.gov/public/index.cfm/democraticpressreleases", "minority")
-    results += parse_hearings()
+        if start_date and pub_date.date() < start_date:
+            continue
 
-    return {
-        "base_url": base_url,
-        "articles": results,
-    }
+        title = link_tag.get_text(strip=True)
+        url = link_tag["href"].strip()
+        if not url.startswith("http"):
+            url = base_url + url
+
+        items.append({
+            "title": title,
+            "url": url,
+            "date": pub_date,
+            "tag": "hearing",
+        })
+
+    return items
@@ -1,4 +1,4 @@
-import requests
+from sources import http, parsing
 from bs4 import BeautifulSoup
 from datetime import datetime
 
@@ -7,94 +7,103 @@ def fetch_vet_articles(start_date=None):
     results = []
 
     def parse_news(url, tag):
-        response = requests.get(url)
+        response = http.get(url)
         if response.status_code != 200:
             return []
-        soup = BeautifulSoup(response.text, "html.parser")
-        items = []
+        return parsing.parse(parse_vet_news, response.text, base_url, tag, start_date)
 
-        for article in soup.select("div.element"):
-            date_tag = article.select_one(".post-media-list-date")
-            title_tag = article.select_one(".post-media-list-title")
-            link_tag = article.select_one("a.media-list-body-link")
-
-            if not date_tag or not title_tag or not link_tag:
-                continue
+    def parse_hearings():
+        url = "https://www.veterans.senate.gov/hearings"
+        response = http.get(url)
+        if response.status_code != 200:
+            return []
+        return parsing.parse(parse_vet_hearings, response.text, base_url, start_date)
 
-            try:
-                pub_date = datetime.strptime(date_tag.text.strip(), "%B %d, %Y")
-            except ValueError:
-                continue
+    results += parse_news("https://www.veterans.senate.gov/majority-news", "majority")
+    results += parse_news("https://www.veterans.senate.gov/minority-news", "minority")
+    results += parse_hearings()
 
-            if start_date and pub_date.date() < start_date:
-                continue
+    return {
+        "base_url": base_url,
+        "articles": results,
+    }
 
-            title = title_tag.get_text(strip=True)
-            url = link_tag["href"].strip()
-            if not url.startswith("http"):
-                url = base_url + url
 
-            items.append({
-                "title": title,
-                "url": url,
-                "date": pub_date.date() if pub_date.time().isoformat() == "00:00:00" else pub_date,
-                "tag": tag,
-            })
+@parsing.parser
+def parse_vet_news(html, base_url, tag, start_date=None):
+    soup = BeautifulSoup(html, "html.parser")
+    items = []
 
-        return items
+    for article in soup.select("div.element"):
+        date_tag = article.select_one(".post-media-list-date")
+        title_tag = article.select_one(".post-media-list-title")
+        link_tag = article.select_one("a.media-list-body-link")
 
-    def parse_hearings():
-        url = "https://www.veterans.senate.gov/hearings"
-        response = requests.get(url)
-        if response.status_code != 200:
-            return []
+        if not date_tag or not title_tag or not link_tag:
+            continue
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        blocks = soup.select("div.hearing-list-item")
-        items = []
+        try:
+            pub_date = datetime.strptime(date_tag.text.strip(), "%B %d, %Y")
+        except ValueError:
+            continue
 
-        for block in blocks:
-            title_tag = block.select_one("div.hearing-list-title")
-            link_tag = block.select_one("a")
-            datetime_tag = block.select_one("span.hearing-list-datetime")
+        if start_date and pub_date.date() < start_date:
+            continue
 
-            if not title_tag or not link_tag or not datetime_tag:
-                continue
+        title = title_tag.get_text(strip=True)
+        url = link_tag["href"].strip()
+        if not url.startswith("http"):
+            url = base_url + url
 
-            try:
-                parts = list(datetime_tag.stripped_strings)
-                if len(parts) < 2:
-                    continue
+        items.append({
+            "title": title,
+            "url": url,
+            "date": pub_date.date() if pub_date.time().isoformat() == "00:00:00" else pub_date,
+            "tag": tag,
+        })
 
-                month_day = parts[0].strip()
-                time_str = parts[1].strip().upper().replace(" ", "")
-                full_date_str = f"{month_day} 2025 {time_str}"
-                pub_date = datetime.strptime(full_date_str, "%b %d %Y %I:%M%p")
-            except Exception:
-                continue
+    return items
 
-            if start_date and pub_date.date() < start_date:
-                continue
 
-            title = title_tag.get_text(strip=True)
-            url = link_tag["href"].strip()
-            if not url.startswith("http"):
-                url = "https://www.veterans.senate.gov" + url
+@parsing.parser
+def parse_vet_hearings(html, base_url, start_date=None):
+    soup = BeautifulSoup(html, "html.parser")
+    blocks = soup.select("div.hearing-list-item")
+    items = []
 
-            items.append({
-                "title": title,
-                "url": url,
-                "date": pub_date,
-                "tag": "hearing",
-            })
+    for block in blocks:
+        title_tag = block.select_one("div.hearing-list-title")
+        link_tag = block.select_one("a")
+        datetime_tag = block.select_one("span.hearing-list-datetime")
 
-        return items
+        if not title_tag or not link_tag or not datetime_tag:
+            continue
 
-    results += parse_news("https://www.veterans.senate.gov/majority-news", "majority")
-    results += parse_news("https://www.veterans.senate.gov/minority-news", "minority")
-    results += parse_hearings()
+        try:
+            parts = list(datetime_tag.stripped_strings)
+            if len(parts) < 2:
+                continue
 
-    return {
-        "base_url": base_url,
-        "articles": results,
-    }
+            month_day = parts[0].strip()
+            time_str = parts[1].strip().upper().replace(" ", "")
+            full_date_str = f"{month_day} 2025 {time_str}"
+            pub_date = datetime.strptime(full_date_str, "%b %d %Y %I:%M%p")
+        except Exception:
+            continue
+
+        if start_date and pub_date.date() < start_date:
+            continue
+
+        title = title_tag.get_text(strip=True)
+        url = link_tag["href"].strip()
+        if not url.startswith("http"):
+            url = "https://www.veterans.senate.gov" + url
+
+        items.append({
+            "title": title,
+            "url": url,
+            "date": pub_date,
+            "tag": "hearing",
+        })
+
+    return items
@@ -0,0 +1,111 @@
+# sources/strategy.py
+"""
+Cheapest-first fetch strategies for the browser-scraped sources.
+
+Several of the news sources were only ever fetched with Chrome, although
+some serve their listing in the plain HTML or publish it as XML. They now
+list their strategies cheapest first and let this module pick:
+
+    articles = strategy.first_valid("news.hhs", [
+        ("http", fetch_http),           # -> items parsed without a start_date
+        ("selenium", fetch_browser),
+    ], start_date)
+
+A strategy is good enough when it returns at least `min_items` items.
+Strategies parse without a start_date, so a quiet week doesn't look like a
+broken page, and first_valid() applies start_date afterwards. A strategy
+that raises or comes back short escalates to the next one, and the last one
+is taken as-is.
+
+The strategy that worked is remembered per source (.cache/strategies.json)
+and the next run starts there. A cheaper strategy that failed is probed
+again after STRATEGY_RETRY seconds, so a site that needs the browser doesn't
+cost a doomed request on every load, but one that stops needing it is
+noticed. registry.Source.expected_cost follows the remembered strategy.
+
+ENV (optional):
+    STRATEGY_RETRY  -> seconds before a cheaper strategy is probed again (default 86400)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import typing as t
+
+from features.storage import cache_dir, read_json, write_json
+
+RETRY = float(os.getenv("STRATEGY_RETRY", "86400"))
+
+_state: dict[str, dict] | None = None
+_lock = threading.Lock()
+
+
+def _path() -> str:
+    return os.path.join(cache_dir(), "strategies.json")
+
+
+def _load() -> dict[str, dict]:
+    global _state
+    if _state is None:
+        _state = read_json(_path(), {}) or {}
+    return _state
+
+
+def last(key: str) -> str | None:
+    """The strategy that worked for `key` last time, if any."""
+    with _lock:
+        entry = _load().get(key)
+    return entry["strategy"] if entry else None
+
+
+def remember(key: str, name: str) -> None:
+    """Record that `name` worked for `key` after trying everything cheaper, as of now."""
+    with _lock:
+        state = _load()
+        state[key] = {"strategy": name, "at": time.time()}
+        snapshot = dict(state)
+    try:
+        write_json(_path(), snapshot)
+    except OSError:
+        pass
+
+
+def _start(key: str, names: list[str]) -> int:
+    """Index to start at: the remembered strategy, or 0 when it's time to re-probe."""
+    with _lock:
+        entry = _load().get(key)
+    if not entry or entry["strategy"] not in names or time.time() - entry["at"] >= RETRY:
+        return 0
+    return names.index(entry["strategy"])
+
+
+def since(items: list[dict], start_date) -> list[dict]:
+    if not start_date:
+        return items
+    cutoff = start_date.strftime("%Y-%m-%d")
+    return [item for item in items if item.get("date", "") >= cutoff]
+
+
+def first_valid(key: str, strategies: list[tuple[str, t.Callable[[], list[dict]]]],
+                start_date=None, min_items: int = 1) -> list[dict]:
+    names = [name for name, _fn in strategies]
+    error: Exception | None = None
+
+    start = _start(key, names)
+    for i in range(start, len(strategies)):
+        name, fn = strategies[i]
+        try:
+            items = fn()
+        except Exception as e:
+            error = e
+            continue
+        if len(items) >= min_items or i == len(strategies) - 1:
+            if start == 0 or i != start:
+                remember(key, name)
+            return since(items, start_date)
+
+    if error is not None:
+        raise error
+    return []
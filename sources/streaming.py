@@ -0,0 +1,151 @@
+# sources/streaming.py
+"""
+Incremental parsing for listing pages.
+
+Committee pages put the listing near the top and then hundreds of KB of
+menus, footers and inline scripts after it. Instead of downloading the
+whole page and building a full BeautifulSoup tree, a fetcher can stream the
+response into lxml's pull parser and take listing items as they close:
+
+    response = http.get(url, stream=True)
+    for item in streaming.items(response, "div", "views-row"):
+        a = streaming.find(item, "a")
+        ...
+        if start_date and pub_date.date() < start_date:
+            break                   # newest-first listing: nothing newer follows
+
+Reading stops (and the connection is released) as soon as the element that
+holds the items closes, or when the caller breaks out of the loop. Items are
+cleared once the caller moves on, so only the page head and the current item
+are kept in memory.
+
+Parsing happens in the fetching thread as bytes arrive, so these sources
+don't go through parsing.parse(); lxml parses in C and there is no whole
+page to hand over. Pass `archive_as` (a @parsing.parser function that reads
+the same listing from page text, usually via parse_items()) and the bytes
+that were read go into the page archive (sources/archive.py) when the
+stream ends or is stopped, so the page can be re-parsed offline like any
+other.
+
+ENV (optional):
+    STREAM_CHUNK  -> bytes read per chunk (default 16384)
+"""
+
+from __future__ import annotations
+
+import os
+import typing as t
+
+import requests
+from lxml import etree
+
+from sources import archive
+
+CHUNK = int(os.getenv("STREAM_CHUNK", "16384"))
+
+
+def _charset(response: requests.Response) -> str | None:
+    # only an explicit header charset; requests' ISO-8859-1 default for text/*
+    # would override the page's own <meta charset>
+    content_type = response.headers.get("Content-Type", "")
+    for part in content_type.split(";"):
+        name, _, value = part.strip().partition("=")
+        if name.lower() == "charset" and value:
+            return value.strip("\"'")
+    return None
+
+
+def has_class(el: etree._Element, cls: str) -> bool:
+    return cls in (el.get("class") or "").split()
+
+
+def find(el: etree._Element | None, tag: str, cls: str | None = None) -> etree._Element | None:
+    """First descendant <tag> (with class `cls`, if given), like soup.select_one("tag.cls")."""
+    if el is None:
+        return None
+    for child in el.iter(tag):
+        if child is not el and (cls is None or has_class(child, cls)):
+            return child
+    return None
+
+
+def next_sibling(el: etree._Element | None, tag: str) -> etree._Element | None:
+    """Next sibling element named `tag` (skips comments and other tags)."""
+    while el is not None:
+        el = el.getnext()
+        if el is not None and el.tag == tag:
+            return el
+    return None
+
+
+def text(el: etree._Element | None) -> str:
+    return "".join(el.itertext()).strip() if el is not None else ""
+
+
+def _items(chunks: t.Iterable[bytes], tag: str, cls: str,
+           encoding: str | None) -> t.Iterator[etree._Element]:
+    parser = etree.HTMLPullParser(events=("end",), encoding=encoding)
+    container = None
+
+    def ready() -> t.Iterator[etree._Element | None]:
+        # None marks the end of the listing
+        nonlocal container
+        for _event, el in parser.read_events():
+            if container is not None and el is container:
+                yield None
+                return
+            if el.tag != tag or not has_class(el, cls):
+                continue
+            if container is None:
+                container = el.getparent()
+            yield el
+            # the caller is done with it: drop it and anything before it
+            el.clear()
+            parent = el.getparent()
+            while el.getprevious() is not None:
+                del parent[0]
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        for el in ready():
+            if el is None:
+                return
+            yield el
+    parser.close()
+    for el in ready():
+        if el is None:
+            return
+        yield el
+
+
+def items(response: requests.Response, tag: str, cls: str,
+          chunk_size: int | None = None,
+          archive_as: t.Callable[..., list] | None = None,
+          args: tuple = ()) -> t.Iterator[etree._Element]:
+    """
+    Yield each <tag class="cls"> element of a streamed response as soon as it
+    has been fully parsed. Stops at the end of the element that contains
+    the first item. With `archive_as`, the bytes read are archived under
+    that parser (with `args`) once reading ends.
+    """
+    encoding = _charset(response)
+    read: list[bytes] = []
+
+    def chunks() -> t.Iterator[bytes]:
+        for chunk in response.iter_content(chunk_size or CHUNK):
+            if archive_as is not None:
+                read.append(chunk)
+            yield chunk
+
+    try:
+        yield from _items(chunks(), tag, cls, encoding)
+    finally:
+        response.close()
+        if archive_as is not None and read:
+            html = b"".join(read).decode(encoding or "utf-8", errors="replace")
+            archive.record(archive_as.parser_name, html, args)
+
+
+def parse_items(html: str, tag: str, cls: str) -> t.Iterator[etree._Element]:
+    """items() over page text already in hand (an archived page, say)."""
+    return _items([html.encode("utf-8")], tag, cls, "utf-8")
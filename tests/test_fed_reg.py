@@ -0,0 +1,155 @@
+"""
+sources/news/fed_reg.py against a stub Federal Register server.
+
+The stub serves the JSON fixtures in fixtures/fed_reg/ (the API's
+public-inspection-documents.json response, trimmed to the fields we ask
+for) page by page, and the public-inspection search page for the HTML path.
+"""
+
+import os
+import threading
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from features import storage
+from sources import archive, parsing
+from sources.news import fed_reg
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "fed_reg")
+
+
+def _fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURES, name), "rb") as fh:
+        return fh.read()
+
+
+class Stub:
+    """What the stub serves and the query strings it was asked for."""
+
+    def __init__(self):
+        self.api_status = 200
+        self.pages = {
+            "1": _fixture("public_inspection_page1.json"),
+            "2": _fixture("public_inspection_page2.json"),
+        }
+        self.api_queries: list[dict] = []
+        self.search_queries: list[dict] = []
+
+
+@pytest.fixture
+def stub(monkeypatch, tmp_path):
+    state = Stub()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            query = parse_qs(parts.query)
+            if parts.path == "/api/v1/public-inspection-documents.json":
+                state.api_queries.append(query)
+                body = state.pages.get(query.get("page", ["1"])[0], b"{}")
+                self._send(state.api_status, "application/json", body)
+            elif parts.path == "/public-inspection/search":
+                state.search_queries.append(query)
+                self._send(200, "text/html", _fixture("search.html"))
+            else:
+                self._send(404, "text/plain", b"not found")
+
+        def _send(self, status, content_type, body):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    root = f"http://127.0.0.1:{server.server_port}"
+
+    monkeypatch.setattr(fed_reg, "MODE", "api")
+    monkeypatch.setattr(fed_reg, "API_BASE", root + "/api/v1")
+    monkeypatch.setattr(fed_reg, "SEARCH_URL", root + "/public-inspection/search")
+    monkeypatch.setattr(storage, "CACHE_ROOT", str(tmp_path))
+    monkeypatch.setattr(parsing, "PARSE_WORKERS", 0)
+    monkeypatch.setattr(archive, "ENABLED", False)
+    try:
+        yield state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_api_follows_pages_and_drops_repeats(stub):
+    result = fed_reg.fetch_federal_register_articles()
+
+    assert result["url"] == fed_reg.PUBLIC_URL
+    assert [q["page"] for q in stub.api_queries] == [["1"], ["2"]]
+    assert [a["url"].split("/")[4] for a in result["articles"]] == [
+        "2026-20931", "2026-20904", "2026-20877", "2026-20850", "2026-20812",
+    ]
+    # no publication date yet: the filing day stands in
+    assert result["articles"][2]["date"] == "2026-10-20"
+    assert result["articles"][1]["title"].endswith("Comment Request")
+
+
+def test_api_asks_only_for_our_fields_and_agencies(stub):
+    fed_reg.fetch_federal_register_articles()
+
+    query = stub.api_queries[0]
+    assert query["fields[]"] == list(fed_reg.API_FIELDS)
+    assert query["conditions[agencies][]"] == list(fed_reg.AGENCIES)
+    assert query["per_page"] == [str(fed_reg.PER_PAGE)]
+    assert "conditions[available_on]" not in query
+
+
+def test_api_queries_each_day_and_dedupes_across_days(stub, monkeypatch):
+    days = [date(2026, 10, 19), date(2026, 10, 20)]
+    monkeypatch.setattr(fed_reg, "_api_days", lambda start_date: days)
+
+    result = fed_reg.fetch_federal_register_articles(date(2026, 10, 17))
+
+    asked = [(q["conditions[available_on]"][0], q["page"][0]) for q in stub.api_queries]
+    assert asked == [("2026-10-19", "1"), ("2026-10-19", "2"),
+                     ("2026-10-20", "1"), ("2026-10-20", "2")]
+    numbers = [a["url"].split("/")[4] for a in result["articles"]]
+    assert numbers == ["2026-20931", "2026-20904", "2026-20877", "2026-20850"]
+
+
+def test_falls_back_to_html_when_the_api_fails(stub):
+    stub.api_status = 404
+
+    result = fed_reg.fetch_federal_register_articles(date(2026, 10, 17))
+
+    assert len(stub.api_queries) == 1
+    assert stub.search_queries[0]["conditions[agencies][]"] == list(fed_reg.AGENCIES)
+    assert result["url"] == fed_reg.PUBLIC_URL
+    assert result["articles"] == [
+        {
+            "title": "Medicare Program; Hospital Outpatient Prospective Payment System: Correction",
+            "url": "https://www.federalregister.gov/public-inspection/2026-20931/"
+                   "medicare-program-hospital-outpatient-prospective-payment-system-correction",
+            "date": "2026-10-21",
+        },
+        {
+            "title": "Food Additives Permitted for Direct Addition to Food for Human Consumption; "
+                     "Vitamin D2 Mushroom Powder",
+            "url": "https://www.federalregister.gov/public-inspection/2026-20850/"
+                   "food-additives-permitted-for-direct-addition-to-food-for-human-consumption-"
+                   "vitamin-d2-mushroom-powder",
+            "date": "2026-10-22",
+        },
+    ]
+
+
+def test_falls_back_to_html_on_an_unreadable_api_body(stub):
+    stub.pages["1"] = b"<html>maintenance</html>"
+
+    result = fed_reg.fetch_federal_register_articles()
+
+    assert stub.search_queries
+    assert len(result["articles"]) == 3
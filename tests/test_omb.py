@@ -0,0 +1,52 @@
+"""
+sources/news/omb.py: the XML report and the browser-rendered dashboard must
+describe the same rules with the same URLs, so a rule keeps its article id
+whichever strategy fetched it.
+
+fixtures/omb/ holds one report and one dashboard page listing the same three
+rules (two HHS, one Treasury).
+"""
+
+import os
+from datetime import date
+
+from sources.news import omb
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "omb")
+
+
+def _fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as fh:
+        return fh.read()
+
+
+def test_xml_keeps_hhs_rules():
+    items = omb.parse_omb_xml(_fixture("eo_rules_under_review.xml"))
+
+    assert items == [
+        {
+            "title": "Final Rule - Medicare and Medicaid Programs; CY 2027 Home Health "
+                     "Prospective Payment System Rate Update",
+            "url": "https://www.reginfo.gov/public/do/eAgendaViewRule?RIN=0938-AV41",
+            "date": "2026-10-14",
+        },
+        {
+            "title": "Proposed Rule - Food Labeling: Front-of-Package Nutrition Information",
+            "url": "https://www.reginfo.gov/public/do/eAgendaViewRule?RIN=0910-AJ12",
+            "date": "2026-09-30",
+        },
+    ]
+
+
+def test_both_strategies_agree():
+    xml = omb.parse_omb_xml(_fixture("eo_rules_under_review.xml"))
+    html = omb.parse_omb_articles(_fixture("eo_dashboard.html"))
+
+    assert html == xml
+
+
+def test_start_date_applies_to_both():
+    start = date(2026, 10, 1)
+
+    assert [i["date"] for i in omb.parse_omb_xml(_fixture("eo_rules_under_review.xml"), start)] == ["2026-10-14"]
+    assert [i["date"] for i in omb.parse_omb_articles(_fixture("eo_dashboard.html"), start)] == ["2026-10-14"]
@@ -0,0 +1,53 @@
+"""
+production/routes.py /addevent/bulk: every ref in the Events category gets
+a result row, including the ones that can't be turned into an event.
+"""
+
+import pytest
+from flask import Flask
+
+from features.article import Article
+from features.categorize import SPECIAL_CALENDAR
+from production import routes
+
+
+def _hearing(aid: str, url: str) -> Article:
+    return Article.from_raw(id=aid, title=f"Hearing {aid}", url=url, date="2026-10-21T10:00",
+                            committee="Aging", tag="hearing")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    store = {a.id: a for a in (_hearing("s1", "https://www.aging.senate.gov/hearings/one"),
+                               _hearing("s2", ""))}
+    monkeypatch.setattr(routes, "SENATE_STORE", store)
+    monkeypatch.setattr(routes, "extract_hearing_details", lambda url: {
+        "title": "Hearing one", "date": "2026-10-21", "time": "10:00", "location": "SD-562",
+    })
+    monkeypatch.setattr(routes, "_existing_addevent_events", lambda *a: [])
+    monkeypatch.setattr(routes, "create_event_addevent", lambda data, dedupe=True: {
+        "id": "ev1", "url": "https://addevent.test/ev1",
+    })
+
+    app = Flask(__name__)
+    app.secret_key = "test"
+    app.register_blueprint(routes.production, url_prefix="/production")
+    c = app.test_client()
+    with c.session_transaction() as s:
+        s["categories_cache"] = {"index": {SPECIAL_CALENDAR: [
+            {"source": "senate", "id": "s1"},
+            {"source": "senate", "id": "s2"},
+            {"source": "senate", "id": "gone"},
+        ]}}
+    return c
+
+
+def test_every_submitted_hearing_gets_a_row(client):
+    data = client.post("/production/addevent/bulk", json={}).json
+
+    rows = {r["id"]: r for r in data["results"]}
+    assert [r["id"] for r in data["results"]] == ["s1", "s2", "gone"]
+    assert rows["s1"]["ok"] and rows["s1"]["event_id"] == "ev1"
+    assert (rows["s2"]["ok"], rows["s2"]["error"]) == (False, "no hearing URL")
+    assert (rows["gone"]["ok"], rows["gone"]["error"]) == (False, "article not found")
+    assert data["ok"] is False
@@ -0,0 +1,85 @@
+"""
+production/routes.py: changing the selection after categories were built
+keeps the category index. The next build only classifies what is new, and
+labels and manual moves carry over.
+"""
+
+import pytest
+from flask import Flask
+
+from features.article import Article
+from production import routes
+
+
+def _article(aid: str, title: str) -> Article:
+    return Article.from_raw(id=aid, title=title, url=f"https://example.gov/{aid}",
+                            date="2026-10-19", source="HHS")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    store = {a.id: a for a in (_article("n1", "Medicare audit plan"),
+                               _article("n2", "Medicaid waiver approved"),
+                               _article("n3", "Drug pricing rule"))}
+    monkeypatch.setattr(routes, "NEWS_STORE", store)
+
+    classified = []
+
+    def categorize(title, is_hearing=False):
+        classified.append(title)
+        return "Medicare"
+
+    monkeypatch.setattr(routes, "categorize_article", categorize)
+
+    app = Flask(__name__)
+    app.secret_key = "test"
+    app.register_blueprint(routes.production, url_prefix="/production")
+    c = app.test_client()
+    c.classified = classified
+    return c
+
+
+def _select_news(client, *ids):
+    r = client.post("/production/select-news", data={"action": "next", "selected": list(ids)})
+    assert r.status_code == 302
+
+
+def _build(client):
+    r = client.post("/production/categorize")
+    assert r.status_code == 302 and r.location.endswith("/production/review")
+
+
+def _index(client):
+    with client.session_transaction() as s:
+        return {label: [ref["id"] for ref in refs]
+                for label, refs in s["categories_cache"]["index"].items() if refs}
+
+
+def test_new_selection_keeps_labels_and_moves(client):
+    _select_news(client, "n1", "n2")
+    _build(client)
+    assert sorted(client.classified) == ["Medicaid waiver approved", "Medicare audit plan"]
+
+    r = client.post("/production/move-articles", json={"ops": [
+        {"source": "news", "id": "n2", "to_category": "Medicaid", "new_index": 0},
+    ]})
+    assert r.json["applied"] == 1
+
+    client.classified.clear()
+    _select_news(client, "n1", "n2", "n3")
+    _build(client)
+
+    assert client.classified == ["Drug pricing rule"]
+    assert _index(client) == {"Medicare": ["n1", "n3"], "Medicaid": ["n2"]}
+
+
+def test_review_waits_for_a_build_after_the_selection_changes(client):
+    _select_news(client, "n1")
+    _build(client)
+    _select_news(client, "n1", "n2")
+
+    r = client.get("/production/review")
+    assert r.status_code == 302 and r.location.endswith("/production/categorize")
+
+    _build(client)
+    assert _index(client) == {"Medicare": ["n1", "n2"]}